@@ -0,0 +1,226 @@
+"""Benchmark the nowplaying pipeline: decode, format, serialize, search and memory.
+
+Usage:
+    python3 benchmarks/bench.py            # compare against baseline.json
+    python3 benchmarks/bench.py --save     # record a new baseline
+
+Each stage is timed on every fixture size and compared with the stored
+baseline; the run exits with status 1 when a stage regresses by more than
+the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fixtures import SIZES, load_body  # noqa: E402
+from integration import load  # noqa: E402
+
+models = load("models")
+diff = load("diff")
+stream = load("stream")
+search = load("search")
+
+# Differences below these are noise, whatever the relative change
+NOISE_FLOOR = {"_ms": 0.05, "_us": 2.0, "_kib": 16.0}
+# One loop for every run, so loop startup is not counted as decode time
+LOOP = asyncio.new_event_loop()
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+CITY = "São Paulo"
+THEATER = "Cinema Benchmark"
+
+# Same header the sensor puts in front of the movie list
+UPCOMING_MEDIA_HEADER = {
+    "title_default": "$title",
+    "line1_default": "$rating",
+    "line2_default": "$release",
+    "line3_default": "$runtime",
+    "line4_default": "$studio",
+    "icon": "mdi:arrow-down-bold",
+}
+
+try:
+    # Home Assistant serializes states with orjson
+    import orjson
+
+    def dumps(value: Any) -> bytes:
+        """Serialize like Home Assistant does."""
+        return orjson.dumps(value)
+
+except ImportError:
+
+    def dumps(value: Any) -> bytes:
+        """Serialize with the standard library when orjson is missing."""
+        return json.dumps(value, ensure_ascii=False).encode()
+
+
+async def _chunks(body: bytes):
+    """Yield the body in the chunk size used by the client."""
+    for start in range(0, len(body), stream.CHUNK_SIZE):
+        yield body[start : start + stream.CHUNK_SIZE]
+
+
+def decode_stream(body: bytes) -> list[dict[str, Any]]:
+    """Decode the body the way the client does: streamed and projected."""
+    coro = stream.async_decode_items(_chunks(body), models.project_movie)
+    return LOOP.run_until_complete(coro)[1]
+
+
+def format_movies(movies: list[Any]) -> list[dict[str, Any]]:
+    """Build the sensor's data attribute."""
+    return [UPCOMING_MEDIA_HEADER, *(movie.as_dict(CITY, THEATER) for movie in movies)]
+
+
+def refresh(body: bytes) -> bytes:
+    """Run one full refresh: decode, diff, format and serialize."""
+    differ = diff.MovieDiffer()
+    differ.update(decode_stream(body))
+    return dumps({"data": format_movies(differ.movies)})
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best run time of the function in milliseconds."""
+    runs = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        runs.append((time.perf_counter() - start) * 1000)
+    # The fastest run is the least disturbed by the rest of the machine
+    return min(runs)
+
+
+def peak_kib(func: Callable[[], Any]) -> float:
+    """Return the traced memory high-water mark of the function in KiB."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run_size(size: str, repeat: int) -> dict[str, float]:
+    """Benchmark every stage on one fixture size."""
+    body = load_body(size)
+    payload = decode_stream(body)
+    unchanged = copy.deepcopy(payload)
+    differ = diff.MovieDiffer()
+    differ.update(payload)
+    movies = differ.movies
+    attributes = {"data": format_movies(movies)}
+
+    def diff_unchanged() -> None:
+        differ.update(unchanged)
+        differ.update(payload)
+
+    index = search.MovieSearchIndex()
+    index.update("bench", differ.by_id, theater_name=THEATER)
+    changed = dict(differ.by_id)
+    first = next(iter(changed))
+    edited = copy.copy(changed[first])
+    changed[first] = edited
+    # One genre and one rating picked from the listings, like an automation
+    genre = next(iter(search.tokenize(movies[0].genres)))
+    rating = next(iter(search.tokenize(movies[0].rating)))
+
+    def search_queries() -> None:
+        for _ in range(1000):
+            index.search(genres=genre, rating=rating)
+
+    def search_update() -> None:
+        index.update("bench", changed, theater_name=THEATER)
+        index.update("bench", differ.by_id, theater_name=THEATER)
+
+    return {
+        "body_kib": len(body) / 1024,
+        "movies": len(movies),
+        "decode_json_ms": timed(lambda: json.loads(body), repeat),
+        "decode_stream_ms": timed(lambda: decode_stream(body), repeat),
+        "decode_movies_ms": timed(lambda: diff.MovieDiffer().update(payload), repeat),
+        "diff_unchanged_ms": timed(diff_unchanged, repeat) / 2,
+        "format_ms": timed(lambda: format_movies(movies), repeat),
+        "serialize_ms": timed(lambda: dumps(attributes), repeat),
+        "refresh_ms": timed(lambda: refresh(body), repeat),
+        "search_update_ms": timed(search_update, repeat) / 2,
+        # A single query is too short to time alone: milliseconds per thousand
+        # queries are microseconds per query
+        "search_query_us": timed(search_queries, repeat),
+        "peak_json_kib": peak_kib(lambda: json.loads(body)),
+        "peak_refresh_kib": peak_kib(lambda: refresh(body)),
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float):
+    """Print the results next to the baseline and return the regressions."""
+    regressions = []
+    for size, metrics in results.items():
+        print(f"\n{size} ({metrics['movies']} movies, {metrics['body_kib']:.0f} KiB)")
+        previous = baseline.get(size, {})
+        for name, value in metrics.items():
+            if not name.endswith(("_ms", "_us", "_kib")) or name == "body_kib":
+                continue
+            line = f"  {name:<20} {value:>10.2f}"
+            if (before := previous.get(name)) is not None and before > 0:
+                change = value / before - 1
+                line += f"  {change:>+7.1%} vs {before:.2f}"
+                floor = NOISE_FLOOR[name[name.rindex("_") :]]
+                if change > tolerance and value - before > floor:
+                    line += "  REGRESSION"
+                    regressions.append(f"{size}.{name}")
+            print(line)
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="store as baseline")
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    args = parser.parse_args()
+
+    results = {size: run_size(size, args.repeat) for size in args.sizes}
+    stored = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    regressions = compare(results, stored.get("results", {}), args.tolerance)
+
+    if args.save:
+        BASELINE.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": {
+                        size: {name: round(value, 3) for name, value in metrics.items()}
+                        for size, metrics in results.items()
+                    },
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"\nBaseline saved to {BASELINE.name}")
+        return 0
+
+    if regressions:
+        print(f"\nRegressions over {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""Local stand-in for api-content.ingresso.com.
+
+Usage:
+    python3 benchmarks/fake_api.py serve [--port 8123] [--latency 80] ...
+    python3 benchmarks/fake_api.py record --city 1 --size sao_paulo
+
+``serve`` answers the endpoints used by the integration from the fixtures,
+with configurable latency, errors, timeouts, ETag/304 support and gzip.
+``record`` captures real responses into ``benchmarks/fixtures`` so later
+runs (and the benchmarks) use them instead of the synthetic payloads.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aiohttp import ClientSession, web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fixtures import FIXTURES, SIZES, load_body  # noqa: E402
+
+REAL_API = "https://api-content.ingresso.com"
+
+
+@dataclass
+class Behaviour:
+    """How the fake API misbehaves."""
+
+    latency: float = 0.05
+    jitter: float = 0.02
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout: float = 60.0
+    # Seconds between content changes; 0 keeps the content fixed
+    change_every: float = 0.0
+    etag: bool = True
+    gzip: bool = True
+
+
+@dataclass
+class Stats:
+    """Counters of what the fake API served."""
+
+    requests: Counter = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters."""
+        return dict(self.requests)
+
+
+class FakeIngressoApi:
+    """aiohttp application serving the fixtures."""
+
+    def __init__(self, behaviour: Behaviour, size: str = "city") -> None:
+        """Load the fixtures for the given size."""
+        self.behaviour = behaviour
+        self.stats = Stats()
+        self._movies: list[dict[str, Any]] = json.loads(load_body(size))
+        self._states = self._load("states", _synthetic_states)
+        self._theaters = self._load("theaters", lambda: self._synthetic_theaters())
+        self._bodies: dict[tuple[str, int], bytes] = {}
+        self._compressed: dict[str, bytes] = {}
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/v0/templates/nowplaying/{city}", self._nowplaying)
+        app.router.add_get("/v0/states", self._states_handler)
+        app.router.add_get(
+            "/v0/theaters/city/{city}/partnership/{partnership}", self._theaters_handler
+        )
+        app.router.add_get("/v0/sessions/city/{city}/theater/{theater}", self._sessions)
+        app.router.add_get("/_stats", self._stats_handler)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply latency, errors and timeouts, then serve with ETags."""
+        if request.path == "/_stats":
+            return await handler(request)
+        behaviour = self.behaviour
+        self.stats.requests["total"] += 1
+        await asyncio.sleep(
+            max(0.0, random.gauss(behaviour.latency, behaviour.jitter or 1e-9))
+        )
+        roll = random.random()
+        if roll < behaviour.timeout_rate:
+            self.stats.requests["timeout"] += 1
+            await asyncio.sleep(behaviour.timeout)
+        elif roll < behaviour.timeout_rate + behaviour.error_rate:
+            self.stats.requests["error"] += 1
+            raise web.HTTPServiceUnavailable
+
+        response = await handler(request)
+        if behaviour.etag and isinstance(response, web.Response) and response.body:
+            etag = hashlib.blake2b(response.body, digest_size=8).hexdigest()
+            if request.headers.get("If-None-Match") == f'"{etag}"':
+                self.stats.requests["not_modified"] += 1
+                return web.Response(status=304, headers={"ETag": f'"{etag}"'})
+            response.headers["ETag"] = f'"{etag}"'
+            if behaviour.gzip and "gzip" in request.headers.get("Accept-Encoding", ""):
+                # Compressed once per content, like a CDN would
+                if (body := self._compressed.get(etag)) is None:
+                    body = self._compressed[etag] = gzip.compress(response.body, 6)
+                response.body = body
+                response.headers["Content-Encoding"] = "gzip"
+        self.stats.requests["ok"] += 1
+        if isinstance(response, web.Response) and response.body:
+            self.stats.requests["bytes"] += len(response.body)
+        return response
+
+    def _generation(self) -> int:
+        """Return the current content generation."""
+        if not self.behaviour.change_every:
+            return 0
+        return int(time.monotonic() // self.behaviour.change_every)
+
+    async def _nowplaying(self, request: web.Request) -> web.Response:
+        """Serve the movies of a city, or of one or more theaters."""
+        theaters = request.query.get("theaters")
+        key = (theaters or "", self._generation())
+        if (body := self._bodies.get(key)) is None:
+            movies = self._movies
+            if theaters:
+                wanted = set(theaters.split(","))
+                movies = [
+                    movie
+                    for movie in movies
+                    if any(item["id"] in wanted for item in movie.get("theaters", ()))
+                ]
+            if key[1]:
+                # Simulate a listings change by retitling one movie
+                movies = [dict(movie) for movie in movies]
+                if movies:
+                    movies[key[1] % len(movies)]["title"] += f" ({key[1]})"
+            body = self._bodies[key] = json.dumps(movies, ensure_ascii=False).encode()
+        return web.Response(body=body, content_type="application/json")
+
+    async def _states_handler(self, request: web.Request) -> web.Response:
+        """Serve the states and their cities."""
+        return web.json_response(self._states)
+
+    async def _theaters_handler(self, request: web.Request) -> web.Response:
+        """Serve the theaters of a city."""
+        return web.json_response(self._theaters)
+
+    async def _sessions(self, request: web.Request) -> web.Response:
+        """Serve a day of sessions for the movies of the theater."""
+        movies = [
+            {
+                "id": movie["id"],
+                "title": movie["title"],
+                "rooms": [
+                    {
+                        "name": "Sala 1",
+                        "sessions": [
+                            {"time": f"{hour}:00", "type": ["Legendado"]}
+                            for hour in (14, 17, 20)
+                        ],
+                    }
+                ],
+            }
+            for movie in self._movies[:20]
+        ]
+        return web.json_response([{"date": "2099-01-01", "movies": movies}])
+
+    async def _stats_handler(self, request: web.Request) -> web.Response:
+        """Serve the request counters."""
+        return web.json_response(self.stats.as_dict())
+
+    def _load(self, name: str, default) -> Any:
+        """Load a recorded fixture or build a synthetic one."""
+        if (path := FIXTURES / f"{name}.json").exists():
+            return json.loads(path.read_bytes())
+        return default()
+
+    def _synthetic_theaters(self) -> dict[str, Any]:
+        """Return the theaters referenced by the movies."""
+        theaters = {
+            theater["id"]: {"id": theater["id"], "name": theater["name"]}
+            for movie in self._movies
+            for theater in movie.get("theaters", ())
+        }
+        return {"items": sorted(theaters.values(), key=lambda item: item["id"])}
+
+    def theater_ids(self) -> list[str]:
+        """Return the ids of the theaters that show at least one movie."""
+        return [theater["id"] for theater in self._theaters["items"]]
+
+
+def _synthetic_states() -> list[dict[str, Any]]:
+    """Return one state with a few cities."""
+    return [
+        {
+            "uf": "SP",
+            "name": "São Paulo",
+            "cities": [
+                {"id": str(city), "name": f"Cidade {city}", "uf": "SP"}
+                for city in range(1, 11)
+            ],
+        }
+    ]
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Run the fake API until interrupted."""
+    api = FakeIngressoApi(
+        Behaviour(
+            latency=args.latency / 1000,
+            jitter=args.jitter / 1000,
+            error_rate=args.error_rate,
+            timeout_rate=args.timeout_rate,
+            change_every=args.change_every,
+            etag=not args.no_etag,
+            gzip=not args.no_gzip,
+        ),
+        args.size,
+    )
+    runner = web.AppRunner(api.app())
+    await runner.setup()
+    await web.TCPSite(runner, args.host, args.port).start()
+    print(f"Fake Ingresso API on http://{args.host}:{args.port} ({args.size})")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+async def record(args: argparse.Namespace) -> None:
+    """Capture real responses into the fixtures directory."""
+    FIXTURES.mkdir(exist_ok=True)
+    paths = {
+        args.size: f"/v0/templates/nowplaying/{args.city}?partnership={args.partnership}",
+        "states": "/v0/states",
+        "theaters": f"/v0/theaters/city/{args.city}/partnership/{args.partnership}",
+    }
+    async with ClientSession(headers={"User-Agent": "Mozilla/5.0"}) as session:
+        for name, path in paths.items():
+            async with session.get(REAL_API + path) as response:
+                response.raise_for_status()
+                body = await response.read()
+            (FIXTURES / f"{name}.json").write_bytes(body)
+            print(f"Recorded {name}.json ({len(body) / 1024:.0f} KiB)")
+
+
+def main() -> None:
+    """Parse the command line and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="serve the fixtures")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8123)
+    serve_parser.add_argument("--size", choices=list(SIZES), default="city")
+    serve_parser.add_argument("--latency", type=float, default=50, help="ms")
+    serve_parser.add_argument("--jitter", type=float, default=20, help="ms")
+    serve_parser.add_argument("--error-rate", type=float, default=0.0)
+    serve_parser.add_argument("--timeout-rate", type=float, default=0.0)
+    serve_parser.add_argument("--change-every", type=float, default=0.0, help="s")
+    serve_parser.add_argument("--no-etag", action="store_true")
+    serve_parser.add_argument("--no-gzip", action="store_true")
+
+    record_parser = commands.add_parser("record", help="capture real responses")
+    record_parser.add_argument("--city", default="1")
+    record_parser.add_argument("--partnership", default="encora")
+    record_parser.add_argument("--size", choices=list(SIZES), default="sao_paulo")
+
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args) if args.command == "serve" else record(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Nowplaying fixtures used by the benchmarks and the fake API.
+
+Recorded responses are read from ``benchmarks/fixtures/<size>.json`` when
+present (see ``fake_api.py --record``). Otherwise a synthetic payload with
+the shape and field sizes of the real nowplaying template is generated
+from a fixed seed, so results are comparable between runs and machines.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+# Movies showing and theaters listed per movie at each size
+SIZES: dict[str, tuple[int, int]] = {
+    "theater": (15, 1),
+    "city": (60, 40),
+    "sao_paulo": (150, 300),
+}
+
+_GENRES = ("Ação", "Aventura", "Animação", "Comédia", "Drama", "Suspense", "Terror")
+_RATINGS = ("Livre", "10 anos", "12 anos", "14 anos", "16 anos", "18 anos")
+_DISTRIBUTORS = ("Warner", "Disney", "Paris Filmes", "Sony", "Universal", "Imagem")
+_WORDS = (
+    "cinema filme história família aventura cidade noite amor guerra destino "
+    "segredo viagem mundo herói missão tempo vida sonho medo verdade"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    """Return a sentence of random Portuguese words."""
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _movie(rng: random.Random, index: int, theaters: int) -> dict[str, Any]:
+    """Return one movie in the nowplaying format."""
+    movie_id = str(20000 + index)
+    url_key = f"filme-{movie_id}"
+    return {
+        "id": movie_id,
+        "title": _text(rng, rng.randint(1, 4))[:-1],
+        "originalTitle": _text(rng, rng.randint(1, 4))[:-1],
+        "urlKey": url_key,
+        "siteURL": f"https://www.ingresso.com/filme/{url_key}",
+        "nationalSiteURL": f"https://www.ingresso.com/filme/{url_key}",
+        "synopsis": _text(rng, rng.randint(40, 120)),
+        "cast": ", ".join(_text(rng, 2)[:-1] for _ in range(rng.randint(3, 10))),
+        "director": _text(rng, 2)[:-1],
+        "distributor": rng.choice(_DISTRIBUTORS),
+        "duration": str(rng.randint(80, 180)),
+        "contentRating": rng.choice(_RATINGS),
+        "genres": rng.sample(_GENRES, rng.randint(1, 3)),
+        "tags": rng.sample(("Pré-venda", "Em alta", "Estreia", "IMAX", "3D"), 2),
+        "premiereDate": {
+            "localDate": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            "T00:00:00-03:00",
+            "isToday": False,
+            "dayOfWeek": "quinta-feira",
+            "dayAndMonth": "01/01",
+            "hour": "00:00",
+            "year": "2025",
+        },
+        "images": [
+            {
+                "url": f"https://ingresso-a.akamaihd.net/img/{movie_id}/{kind}.jpg",
+                "type": kind,
+            }
+            for kind in ("PosterPortrait", "PosterHorizontal", "Banner")
+        ],
+        "trailers": [
+            {
+                "type": "Youtube",
+                "url": f"https://www.youtube.com/watch?v={movie_id}{n}",
+                "embeddedUrl": f"https://www.youtube.com/embed/{movie_id}{n}",
+            }
+            for n in range(rng.randint(1, 3))
+        ],
+        "theaters": [
+            {
+                "id": str(1000 + rng.randint(0, theaters * 3)),
+                "name": f"Cinema {_text(rng, 2)[:-1]}",
+                "address": _text(rng, 6),
+            }
+            for _ in range(rng.randint(1, theaters))
+        ],
+        "isPlaying": True,
+        "countIsPlaying": 1,
+        "premiereDateBR": None,
+    }
+
+
+def generate(size: str, seed: int = 0) -> list[dict[str, Any]]:
+    """Return a synthetic nowplaying payload of the given size."""
+    movies, theaters = SIZES[size]
+    rng = random.Random(f"{size}-{seed}")
+    return [_movie(rng, index, theaters) for index in range(movies)]
+
+
+def load_body(size: str) -> bytes:
+    """Return the raw nowplaying body of the given size."""
+    if (path := FIXTURES / f"{size}.json").exists():
+        return path.read_bytes()
+    return json.dumps(generate(size), ensure_ascii=False).encode()
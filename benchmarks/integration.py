@@ -0,0 +1,26 @@
+"""Import the integration modules without Home Assistant.
+
+The core modules (api, models, diff, stream) only need aiohttp and the
+standard library. Importing ``custom_components.ingresso`` would run its
+``__init__`` and pull in Home Assistant, so the directory is registered as
+a bare ``ingresso`` package instead.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+INTEGRATION = ROOT / "custom_components" / "ingresso"
+
+
+def load(name: str) -> types.ModuleType:
+    """Import ``ingresso.<name>`` from the integration directory."""
+    if "ingresso" not in sys.modules:
+        package = types.ModuleType("ingresso")
+        package.__path__ = [str(INTEGRATION)]
+        sys.modules["ingresso"] = package
+    return importlib.import_module(f"ingresso.{name}")
@@ -0,0 +1,282 @@
+"""Load-test the integration's fetch pipeline against the fake API.
+
+Usage:
+    python3 benchmarks/load.py --entries 50 --duration 60 --interval 5
+
+Sets up ``--entries`` config entries the way ``async_setup_entry`` does:
+each one subscribes its theater to the shared fetch hub and gets its own
+update coordinator. Refreshes then take the integration's real path: the
+coordinator asks the hub, which shares fetches between entries of a city
+(single flight, grouped theaters), and the hub's API client goes through
+the rate limiter, retries, circuit breaker and streaming decode before the
+coordinator diffs the movies. Entries are spread over ``--cities`` cities,
+start staggered and refresh every ``--interval`` seconds, with the adaptive
+scheduler replaced by that fixed interval. The fake API runs in the same
+process unless ``--url`` points to one started separately.
+
+Home Assistant must be installed (``scripts/setup``); it runs in the same
+process, with its storage in a temporary directory.
+
+Requests go through the integration's own HTTP session (keep-alive pool,
+DNS cache, compression); ``--plain-session`` uses a default aiohttp session
+instead, for comparison.
+
+Requests also pass through the integration's rate limiter; ``--rate`` and
+``--burst`` override its limits.
+
+Reported: requests/sec served, requests per refresh, p50/p99 refresh
+latency, refresh errors, connections opened per request, bytes on the wire,
+rate limiter waits and event-loop lag (how late a 50 ms timer fires).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+from aiohttp import ClientSession, web
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry
+from homeassistant.core import HomeAssistant
+from yarl import URL
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_api import Behaviour, FakeIngressoApi  # noqa: E402
+from fixtures import SIZES  # noqa: E402
+from integration import load  # noqa: E402
+
+api = load("api")
+const = load("const")
+coordinator_module = load("coordinator")
+hub_module = load("hub")
+
+LAG_PROBE = 0.05
+PARTNERSHIP = "encora"
+
+
+def point_at(base_url: str) -> None:
+    """Send the client's requests to the fake API instead of the real one."""
+    for name in (
+        "BASE_URL",
+        "THEATER_URL",
+        "STATES_URL",
+        "THEATERS_URL",
+        "SESSIONS_URL",
+    ):
+        value = getattr(api, name)
+        setattr(api, name, value.replace("https://api-content.ingresso.com", base_url))
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the given percentile of the values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class FixedInterval:
+    """Stand-in for the adaptive scheduler that always polls at one interval."""
+
+    def __init__(self, interval: float) -> None:
+        """Store the interval."""
+        self._interval = timedelta(seconds=interval)
+
+    def record(self, moment: datetime, changed: bool) -> None:
+        """Ignore what changed; the interval is fixed."""
+
+    def next_interval(self, now: datetime) -> timedelta:
+        """Return the fixed interval."""
+        return self._interval
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Nothing to restore."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Nothing was learned."""
+        return {}
+
+
+def config_entry(number: int, city: str, theater: str) -> ConfigEntry:
+    """Build the config entry of one simulated theater."""
+    return ConfigEntry(
+        data={
+            const.CONF_CITY_ID: city,
+            const.CONF_CITY_NAME: f"Cidade {city}",
+            const.CONF_PARTNERSHIP: PARTNERSHIP,
+            const.CONF_THEATER: theater,
+            const.CONF_THEATER_NAME: f"Cinema {theater}",
+        },
+        discovery_keys=MappingProxyType({}),
+        domain=const.DOMAIN,
+        minor_version=1,
+        options={},
+        source=SOURCE_USER,
+        title=f"Cinema {theater} ({number})",
+        unique_id=f"load_{number}",
+        version=1,
+    )
+
+
+async def entry(
+    coordinator: Any,
+    interval: float,
+    deadline: float,
+    latencies: list[float],
+    errors: list[str],
+) -> None:
+    """Refresh one entry's coordinator until the deadline."""
+    await asyncio.sleep(random.uniform(0, interval))
+    while (started := time.monotonic()) < deadline:
+        await coordinator.async_refresh()
+        if coordinator.last_update_success:
+            latencies.append(time.monotonic() - started)
+        else:
+            error = coordinator.last_exception
+            errors.append(type(error.__cause__ or error).__name__)
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+async def probe_lag(deadline: float, lags: list[float]) -> None:
+    """Measure how late a short timer fires while the load runs."""
+    while time.monotonic() < deadline:
+        started = time.monotonic()
+        await asyncio.sleep(LAG_PROBE)
+        lags.append(time.monotonic() - started - LAG_PROBE)
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Start the fake API if needed and drive the simulated entries."""
+    runner = None
+    fake = None
+    base_url = args.url
+    if base_url is None:
+        fake = FakeIngressoApi(
+            Behaviour(
+                latency=args.latency / 1000,
+                error_rate=args.error_rate,
+                timeout_rate=args.timeout_rate,
+                timeout=args.timeout,
+                change_every=args.change_every,
+                gzip=not args.no_gzip,
+            ),
+            args.size,
+        )
+        runner = web.AppRunner(fake.app())
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        base_url = f"http://127.0.0.1:{port}"
+    point_at(base_url)
+
+    theaters = fake.theater_ids() if fake else [str(1000 + n) for n in range(20)]
+    latencies: list[float] = []
+    errors: list[str] = []
+    lags: list[float] = []
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hub = hub_module.async_get_hub(hass)
+        hub.transport.hosts.configure(args.rate, args.burst)
+        if args.plain_session:
+            # Replace the tuned session the transport would create
+            hub.transport._session = ClientSession()  # noqa: SLF001
+        unsubscribes = []
+        coordinators = []
+        for number in range(args.entries):
+            city = str(number % args.cities + 1)
+            theater = theaters[number % len(theaters)]
+            unsubscribes.append(hub.async_subscribe(city, PARTNERSHIP, [theater]))
+            coordinator = coordinator_module.IngressoDataUpdateCoordinator(
+                hass,
+                config_entry(number, city, theater),
+                hub,
+                update_interval=timedelta(seconds=args.interval),
+                theater=theater,
+                theater_name=f"Cinema {theater}",
+            )
+            coordinator._scheduler = FixedInterval(args.interval)  # noqa: SLF001
+            coordinators.append(coordinator)
+
+        started = time.monotonic()
+        deadline = started + args.duration
+        await asyncio.gather(
+            probe_lag(deadline, lags),
+            *(
+                entry(coordinator, args.interval, deadline, latencies, errors)
+                for coordinator in coordinators
+            ),
+        )
+        elapsed = time.monotonic() - started
+        async with hub.transport.session.get(f"{base_url}/_stats") as response:
+            served = await response.json()
+        transport = hub.transport.stats
+        # Read before the last unsubscribe clears the state of the hosts
+        limiter = hub.transport.hosts.limiter(URL(base_url).host).stats
+        # The last unsubscribe closes the session in a background task
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        await hass.async_stop(force=True)
+    if runner is not None:
+        await runner.cleanup()
+
+    refreshes = len(latencies) + len(errors)
+    print(
+        f"{args.entries} entries in {args.cities} cities, {elapsed:.0f}s, "
+        f"refresh every {args.interval}s"
+    )
+    print(f"requests/sec        {served.get('total', 0) / elapsed:8.1f}")
+    print(f"served              {served}")
+    print(f"refreshes           {refreshes:8d}")
+    print(f"requests/refresh    {served.get('total', 0) / (refreshes or 1):8.3f}")
+    print(f"refresh p50 (ms)    {percentile(latencies, 0.50) * 1000:8.1f}")
+    print(f"refresh p99 (ms)    {percentile(latencies, 0.99) * 1000:8.1f}")
+    print(f"refresh errors      {len(errors):8d} {dict(Counter(errors)) or ''}")
+    if not args.plain_session:
+        print(f"connections/request {transport.handshakes_per_request or 0:8.3f}")
+        print(f"compressed          {transport.compressed:8d}")
+    print(f"bytes served (KiB)  {served.get('bytes', 0) / 1024:8.0f}")
+    print(f"rate limited        {limiter.waited:8d}")
+    print(f"rate limit max (ms) {limiter.max_wait * 1000:8.1f}")
+    print(f"loop lag p50 (ms)   {percentile(lags, 0.50) * 1000:8.1f}")
+    print(f"loop lag p99 (ms)   {percentile(lags, 0.99) * 1000:8.1f}")
+    print(f"loop lag max (ms)   {max(lags, default=0) * 1000:8.1f}")
+    if lags:
+        print(f"loop lag mean (ms)  {statistics.fmean(lags) * 1000:8.1f}")
+
+
+def main() -> None:
+    """Parse the command line and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50)
+    parser.add_argument("--cities", type=int, default=5)
+    parser.add_argument("--duration", type=float, default=30, help="s")
+    parser.add_argument("--interval", type=float, default=5, help="s")
+    parser.add_argument("--url", help="use a fake API that is already running")
+    parser.add_argument("--size", choices=list(SIZES), default="sao_paulo")
+    parser.add_argument("--latency", type=float, default=50, help="ms")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=60, help="s")
+    parser.add_argument("--change-every", type=float, default=0.0, help="s")
+    parser.add_argument("--no-gzip", action="store_true")
+    parser.add_argument("--rate", type=float, default=api.API_RATE_LIMIT, help="/s")
+    parser.add_argument("--burst", type=int, default=api.API_RATE_BURST)
+    parser.add_argument("--plain-session", action="store_true")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,70 +1,204 @@
 """Integração Ingresso.com para Home Assistant."""
 
+import asyncio
 import logging
-from datetime import timedelta
-from typing import Any
+from collections.abc import Container
+from functools import partial
+from pathlib import Path
 
 from homeassistant import config_entries, core
 from homeassistant.const import Platform
-from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.loader import async_get_loaded_integration
+
+from .const import (
+    API_RATE_BURST,
+    API_RATE_LIMIT,
+    CONF_CITY_ID,
+    CONF_CITY_NAME,
+    CONF_LOCAL_POSTERS,
+    CONF_PARTNERSHIP,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CONF_THEATER,
+    CONF_THEATER_NAME,
+    CONF_THEATERS,
+    DOMAIN,
+    STORAGE_VERSION,
+    UPDATE_INTERVAL,
+)
+from .coordinator import IngressoDataUpdateCoordinator, snapshot_key
+from .data import IngressoConfigEntry, IngressoData
+from .hub import async_get_hub
+from .posters import async_get_poster_cache
+from .services import async_setup_services
+from .websocket import async_setup_websocket
+
+PLATFORMS = [
+    Platform.BINARY_SENSOR,
+    Platform.IMAGE,
+    Platform.SENSOR,
+    Platform.SWITCH,
+]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-from .api import IngressoApiClient
-from .const import CONF_CITY_ID, CONF_CITY_NAME, CONF_PARTNERSHIP, CONF_THEATER, DOMAIN
+_LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.SENSOR]
 
-_LOGGER = logging.getLogger(__name__)
+async def async_setup(hass: core.HomeAssistant, config: ConfigType) -> bool:
+    """Configurar os recursos compartilhados da integração."""
+    async_setup_services(hass)
+    async_setup_websocket(hass)
+    return True
 
 
 async def async_setup_entry(
-    hass: core.HomeAssistant, entry: config_entries.ConfigEntry
+    hass: core.HomeAssistant, entry: IngressoConfigEntry
 ) -> bool:
     """Configurar a integração Ingresso.com a partir de uma entrada de configuração."""
-    session = async_get_clientsession(hass)
-    client = IngressoApiClient(
-        city_id=entry.data.get(CONF_CITY_ID),
-        partnership=entry.data.get(CONF_PARTNERSHIP),
-        session=session,
-        theater=entry.data.get(CONF_THEATER),
+    hub = async_get_hub(hass)
+    entry.async_on_unload(
+        hub.transport.async_set_limits(
+            entry.entry_id,
+            entry.options.get(CONF_RATE_LIMIT, API_RATE_LIMIT),
+            entry.options.get(CONF_RATE_BURST, API_RATE_BURST),
+        )
+    )
+    theaters = _entry_theaters(entry)
+    entry.async_on_unload(
+        hub.async_subscribe(
+            entry.data[CONF_CITY_ID], entry.data[CONF_PARTNERSHIP], theaters
+        )
     )
 
-    try:
-        movies = await client.async_get_movies()
-    except Exception as exception:
-        raise ConfigEntryAuthFailed("Falha ao conectar") from exception
-
-    # Create a coordinator for data updates
-    coordinator = DataUpdateCoordinator(
+    # Create a coordinator per theater (one device each); the hub fetches the
+    # theaters followed in a city together in a single request
+    coordinators = [
+        IngressoDataUpdateCoordinator(
+            hass,
+            entry,
+            hub,
+            update_interval=UPDATE_INTERVAL,
+            theater=theater,
+            theater_name=theater_name,
+            multi_theater=bool(entry.data.get(CONF_THEATERS)),
+        )
+        for theater, theater_name in theaters.items()
+    ]
+    _async_remove_stale_devices(hass, entry, coordinators)
+    # Snapshots of theaters dropped in the options are no longer read
+    entry.async_create_background_task(
         hass,
-        _LOGGER,
-        name=f"{DOMAIN}_{entry.entry_id}",
-        update_method=client.async_get_movies,
-        update_interval=timedelta(minutes=30),
+        _async_remove_snapshots(
+            hass,
+            entry.entry_id,
+            {coordinator.snapshot_key for coordinator in coordinators},
+        ),
+        f"{DOMAIN}_{entry.entry_id}_remove_snapshots",
+    )
+    for coordinator in coordinators:
+        entry.async_on_unload(partial(hub.search.remove, coordinator.name))
+
+    # Bring entities up from the last saved listings, if any, and leave the
+    # first request for after startup so the API is never on its critical path
+    await asyncio.gather(*(coordinator.async_restore() for coordinator in coordinators))
+
+    @core.callback
+    def _async_first_refresh(_: core.HomeAssistant) -> None:
+        for coordinator in coordinators:
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"{coordinator.name}_refresh"
+            )
+
+    entry.async_on_unload(async_at_started(hass, _async_first_refresh))
+
+    entry.runtime_data = IngressoData(
+        hub=hub,
+        coordinators=coordinators,
+        integration=async_get_loaded_integration(hass, entry.domain),
+        posters=(
+            await async_get_poster_cache(hass)
+            if entry.options.get(CONF_LOCAL_POSTERS, False)
+            else None
+        ),
     )
 
-    # Initial data
-    await coordinator.async_config_entry_first_refresh()
-
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
-        "client": client,
-        "coordinator": coordinator,
-        **entry.data,
-    }
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
-async def async_unload_entry(
+def _entry_theaters(entry: config_entries.ConfigEntry) -> dict[str | None, str]:
+    """Retornar os cinemas da entrada; a cidade inteira tem o cinema None."""
+    if theaters := entry.data.get(CONF_THEATERS):
+        return dict(theaters)
+    return {entry.data.get(CONF_THEATER): entry.data.get(CONF_THEATER_NAME, "")}
+
+
+@core.callback
+def _async_remove_stale_devices(
+    hass: core.HomeAssistant,
+    entry: config_entries.ConfigEntry,
+    coordinators: list[IngressoDataUpdateCoordinator],
+) -> None:
+    """Remover os dispositivos de cinemas que a entrada deixou de seguir."""
+    registry = dr.async_get(hass)
+    current = {(DOMAIN, coordinator.device_id) for coordinator in coordinators}
+    for device in dr.async_entries_for_config_entry(registry, entry.entry_id):
+        if not device.identifiers & current:
+            registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
+
+
+async def async_reload_entry(
     hass: core.HomeAssistant, entry: config_entries.ConfigEntry
+) -> None:
+    """Recarregar a entrada após alterações nas opções."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_unload_entry(
+    hass: core.HomeAssistant, entry: IngressoConfigEntry
 ) -> bool:
     """Descarregar uma entrada de configuração."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(
+    hass: core.HomeAssistant, entry: config_entries.ConfigEntry
+) -> None:
+    """Remover os dados salvos de uma entrada de configuração."""
+    await _async_remove_snapshots(hass, entry.entry_id)
+
+
+async def _async_remove_snapshots(
+    hass: core.HomeAssistant, entry_id: str, keep: Container[str] = ()
+) -> None:
+    """Remover os snapshots salvos da entrada, exceto os de `keep`.
+
+    Os arquivos são procurados pelo prefixo da entrada, o que inclui os de
+    cinemas que ela já deixou de seguir.
+    """
+    prefix = snapshot_key(entry_id)
+    storage = Path(hass.config.path(STORAGE_DIR))
+
+    def _keys() -> list[str]:
+        return [
+            path.name
+            for path in storage.glob(f"{prefix}*")
+            if path.name == prefix or path.name.startswith(f"{prefix}.")
+        ]
+
+    for key in await hass.async_add_executor_job(_keys):
+        if key not in keep:
+            await Store(hass, STORAGE_VERSION, key).async_remove()
 
 
 async def async_migrate_entry(
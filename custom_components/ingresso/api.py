@@ -2,17 +2,65 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import random
 import socket
-from typing import Any
+from collections import deque
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
+from aiohttp import hdrs
+from aiohttp.compression_utils import HAS_BROTLI
+from yarl import URL
 
-from .const import BASE_URL, THEATER_URL
+from .const import (
+    API_BACKOFF,
+    API_BODY_TIMEOUT,
+    API_MAX_RETRY_AFTER,
+    API_MAX_TIMEOUT,
+    API_MIN_TIMEOUT,
+    API_RATE_BURST,
+    API_RATE_LIMIT,
+    API_RETRIES,
+    BASE_URL,
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_FAILURE_THRESHOLD,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_LIMIT_PER_HOST,
+    SESSIONS_URL,
+    STATES_URL,
+    THEATER_URL,
+    THEATERS_URL,
+)
+from .limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, RateLimiter
+from .models import project_movie
+from .sessions import project_session_day
+from .stats import RequestStats, TransportStats
+from .stream import CHUNK_SIZE, async_decode_items
+
+if TYPE_CHECKING:
+    import ssl
+    from collections.abc import Callable, Mapping
+    from types import SimpleNamespace
 
 _LOGGER = logging.getLogger(__name__)
 
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Amostras de latência usadas no tempo limite adaptativo
+LATENCY_WINDOW = 50
+LATENCY_MIN_SAMPLES = 10
+
+
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
 
 class IngressoApiClientError(Exception):
     """Exceção para indicar um erro geral na API."""
@@ -26,6 +74,134 @@ class IngressoApiClientAuthenticationError(IngressoApiClientError):
     """Exceção para indicar um erro de autenticação."""
 
 
+class IngressoApiClientCircuitOpenError(IngressoApiClientCommunicationError):
+    """Exceção para indicar que o host está temporariamente bloqueado."""
+
+
+class _RetryableError(IngressoApiClientCommunicationError):
+    """Erro de comunicação transitório, que pode ser repetido."""
+
+    def __init__(self, msg: str, retry_after: float | None = None) -> None:
+        """Guardar a espera pedida pelo servidor, se houver."""
+        super().__init__(msg)
+        self.retry_after = retry_after
+
+
+class _HostHealth:
+    """Latências observadas e disjuntor (circuit breaker) de um host."""
+
+    def __init__(self) -> None:
+        """Inicializar o estado do host."""
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    def check(self) -> bool:
+        """Falhar imediatamente enquanto o circuito estiver aberto.
+
+        Passado o intervalo, uma única requisição sonda o host (estado
+        semiaberto); as demais continuam falhando até o resultado dela.
+        Retorna se a requisição é essa sondagem.
+        """
+        if self._opened_at is None:
+            return False
+        if self._probing or monotonic() - self._opened_at < CIRCUIT_COOLDOWN:
+            msg = "API indisponível; aguardando para tentar novamente"
+            raise IngressoApiClientCircuitOpenError(msg)
+        self._probing = True
+        return True
+
+    def end_probe(self) -> None:
+        """Liberar a sondagem, qualquer que tenha sido o resultado."""
+        self._probing = False
+
+    def timeout(self) -> float:
+        """Retornar o tempo limite dos cabeçalhos, derivado do p95 das latências."""
+        if len(self._latencies) < LATENCY_MIN_SAMPLES:
+            return API_MAX_TIMEOUT
+        latencies = sorted(self._latencies)
+        p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        return min(API_MAX_TIMEOUT, max(API_MIN_TIMEOUT, p95 * 3))
+
+    def record_success(self, latency: float) -> None:
+        """Registrar o tempo até os cabeçalhos de uma resposta e fechar o circuito."""
+        self._latencies.append(latency)
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Registrar uma falha e abrir o circuito após várias seguidas."""
+        self._failures += 1
+        if self._failures >= CIRCUIT_FAILURE_THRESHOLD:
+            if self._opened_at is None:
+                _LOGGER.warning(
+                    "API Ingresso.com falhou %s vezes seguidas; pausando requisições",
+                    self._failures,
+                )
+            # Uma falha na tentativa após o intervalo reabre o circuito
+            self._opened_at = monotonic()
+
+
+class ApiHosts:
+    """Estado de cada host da API: disjuntor, latências e limitador de taxa.
+
+    Compartilhado pelos clientes de uma instalação, para que o limite valha
+    para todas as entradas juntas.
+    """
+
+    def __init__(
+        self, rate: float = API_RATE_LIMIT, burst: int = API_RATE_BURST
+    ) -> None:
+        """Inicializar sem nenhum host conhecido."""
+        self.rate = rate
+        self.burst = burst
+        self._health: dict[str, _HostHealth] = {}
+        self._limiters: dict[str, RateLimiter] = {}
+
+    def health(self, host: str) -> _HostHealth:
+        """Retornar o estado do host."""
+        if (health := self._health.get(host)) is None:
+            health = self._health[host] = _HostHealth()
+        return health
+
+    def limiter(self, host: str) -> RateLimiter:
+        """Retornar o limitador de taxa do host."""
+        if (limiter := self._limiters.get(host)) is None:
+            limiter = self._limiters[host] = RateLimiter(self.rate, self.burst)
+        return limiter
+
+    def configure(self, rate: float, burst: int) -> None:
+        """Alterar a taxa e a rajada, inclusive dos limitadores já criados."""
+        self.rate = rate
+        self.burst = burst
+        for limiter in self._limiters.values():
+            limiter.configure(rate, burst)
+
+    def clear(self) -> None:
+        """Esquecer o estado de todos os hosts."""
+        self._health.clear()
+        self._limiters.clear()
+
+
+def _retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Retornar a espera, em segundos, pedida no cabeçalho Retry-After."""
+    if not headers or (value := headers.get(hdrs.RETRY_AFTER)) is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # O cabeçalho também pode trazer uma data HTTP
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return max(0.0, (moment - datetime.now(UTC)).total_seconds())
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verificar se a resposta é válida."""
     if response.status in (401, 403):
@@ -34,6 +210,59 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     response.raise_for_status()
 
 
+def _counter(stats: TransportStats, name: str) -> Callable[..., Any]:
+    """Criar um callback de trace que incrementa um contador."""
+
+    async def count(*_: Any) -> None:
+        setattr(stats, name, getattr(stats, name) + 1)
+
+    return count
+
+
+def create_session(
+    stats: TransportStats, ssl_context: ssl.SSLContext | bool = True
+) -> aiohttp.ClientSession:
+    """Criar uma sessão HTTP ajustada para a API do Ingresso.com.
+
+    As conexões ficam abertas entre as requisições de um mesmo ciclo, com
+    um limite por host e cache de DNS, e as respostas chegam comprimidas.
+    Os contadores mostram quantas conexões (e handshakes TLS) cada
+    requisição custa e quantos bytes passaram pela rede.
+    """
+
+    async def on_request_end(
+        _session: aiohttp.ClientSession,
+        _context: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        stats.requests += 1
+        response = params.response
+        if response.headers.get(hdrs.CONTENT_ENCODING):
+            stats.compressed += 1
+        if response.content_length is not None:
+            stats.wire_bytes += response.content_length
+
+    trace = aiohttp.TraceConfig()
+    trace.on_request_end.append(on_request_end)
+    trace.on_connection_create_end.append(_counter(stats, "connections"))
+    trace.on_connection_reuseconn.append(_counter(stats, "reused"))
+    trace.on_dns_cache_hit.append(_counter(stats, "dns_hits"))
+    trace.on_dns_cache_miss.append(_counter(stats, "dns_misses"))
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit_per_host=HTTP_LIMIT_PER_HOST,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ssl=ssl_context,
+        ),
+        headers={hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING},
+        # Teto de segurança; os limites de cada etapa ficam com o cliente
+        timeout=aiohttp.ClientTimeout(total=API_MAX_TIMEOUT + API_BODY_TIMEOUT),
+        trace_configs=[trace],
+    )
+
+
 class IngressoApiClient:
     """Cliente da API Ingresso.com."""
 
@@ -43,25 +272,79 @@ class IngressoApiClient:
         partnership: str,
         session: aiohttp.ClientSession,
         theater: str = None,
+        retries: int = API_RETRIES,
+        backoff: float = API_BACKOFF,
+        hosts: ApiHosts | None = None,
     ) -> None:
-        """Inicializar cliente da API Ingresso.com."""
+        """Inicializar cliente da API Ingresso.com.
+
+        `hosts` é o estado compartilhado com os demais clientes; sem ele, o
+        cliente limita apenas as próprias requisições.
+        """
         self._city_id = city_id
         self._partnership = partnership
         self._session = session
         self._theater = theater
+        self._retries = retries
+        self._backoff = backoff
+        self._hosts = hosts if hosts is not None else ApiHosts()
+        # Validadores e último conteúdo por URL, para requisições condicionais
+        self._validators: dict[str, dict[str, str]] = {}
+        self._payloads: dict[str, tuple[bytes, Any]] = {}
+        self.stats = RequestStats()
 
-    async def async_get_movies(self) -> Any:
+    async def async_get_movies(
+        self,
+        project: Callable[[Any], Any] = project_movie,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> Any:
         """Obter dados de filmes da API."""
         if self._theater:
             url = THEATER_URL.format(self._city_id, self._partnership, self._theater)
         else:
             url = BASE_URL.format(self._city_id, self._partnership)
 
+        # Listas de cidades grandes são lidas em pedaços, mantendo apenas
+        # os campos usados de cada filme
         return await self._api_wrapper(
             method="get",
             url=url,
             headers={"User-Agent": "Mozilla/5.0"},
+            project=project,
+            priority=priority,
+        )
+
+    async def async_get_sessions(self, priority: int = PRIORITY_BACKGROUND) -> Any:
+        """Obter as sessões do cinema, agrupadas por dia."""
+        return await self._api_wrapper(
+            method="get",
+            url=SESSIONS_URL.format(self._city_id, self._theater, self._partnership),
+            headers={"User-Agent": "Mozilla/5.0"},
+            project=project_session_day,
+            priority=priority,
+        )
+
+    async def async_get_states(self) -> Any:
+        """Obter os estados e suas cidades."""
+        return await self._api_wrapper(
+            method="get",
+            url=STATES_URL,
+            headers={"User-Agent": "Mozilla/5.0"},
+            # Usado pelas telas de configuração, à frente das atualizações
+            priority=PRIORITY_INTERACTIVE,
+        )
+
+    async def async_get_theaters(self) -> list[dict[str, Any]]:
+        """Obter os cinemas da cidade."""
+        data = await self._api_wrapper(
+            method="get",
+            url=THEATERS_URL.format(self._city_id, self._partnership),
+            headers={"User-Agent": "Mozilla/5.0"},
+            priority=PRIORITY_INTERACTIVE,
         )
+        if isinstance(data, dict) and "items" in data:
+            return data["items"]
+        return []
 
     async def _api_wrapper(
         self,
@@ -69,25 +352,169 @@ class IngressoApiClient:
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
+        project: Callable[[Any], Any] | None = None,
+        priority: int = PRIORITY_BACKGROUND,
     ) -> Any:
-        """Obter informações da API."""
+        """Obter informações da API, repetindo falhas transitórias.
+
+        Com `project`, a resposta é decodificada em streaming e cada item do
+        array é reduzido pela função assim que chega. Cada tentativa aguarda
+        sua vez no limitador de taxa do host, na fila de `priority`.
+        """
+        host = URL(url).host or ""
+        health = self._hosts.health(host)
+        limiter = self._hosts.limiter(host)
+        # Apenas requisições idempotentes são repetidas
+        retries = self._retries if method == "get" else 0
+        attempt = 0
+        while True:
+            probe = health.check()
+            try:
+                await limiter.acquire(priority)
+                return await self._api_attempt(
+                    method, url, data, headers, health, project
+                )
+            except _RetryableError as exception:
+                retry_after = exception.retry_after
+                # Esperas mais longas que o teto ficam para o próximo ciclo
+                if attempt >= retries or (retry_after or 0) > API_MAX_RETRY_AFTER:
+                    self.stats.failures += 1
+                    raise
+            except IngressoApiClientError:
+                self.stats.failures += 1
+                raise
+            finally:
+                # O resultado da sondagem já fechou ou reabriu o circuito
+                if probe:
+                    health.end_probe()
+            attempt += 1
+            self.stats.retries += 1
+            if retry_after is None:
+                # Backoff exponencial com jitter completo
+                delay = random.uniform(0, self._backoff * 2**attempt)
+            else:
+                delay = retry_after
+            _LOGGER.debug(
+                "Tentativa %s de %s falhou; repetindo em %.1fs - %s",
+                attempt,
+                retries + 1,
+                delay,
+                url,
+            )
+            await asyncio.sleep(delay)
+
+    async def _api_attempt(
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        headers: dict | None,
+        health: _HostHealth,
+        project: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Fazer uma única tentativa de requisição."""
+        started = monotonic()
+        self.stats.requests += 1
+        conditional = method == "get"
+        if conditional and url in self._payloads:
+            headers = {**(headers or {}), **self._validators.get(url, {})}
         try:
-            async with async_timeout.timeout(30):
+            # O limite adaptativo vale só até os cabeçalhos: respostas 304 e
+            # corpos de vários MB teriam latências totais incomparáveis
+            async with async_timeout.timeout(health.timeout()):
                 response = await self._session.request(
                     method=method,
                     url=url,
                     headers=headers,
                     json=data,
                 )
+            first_byte = monotonic() - started
+
+            # Devolver a conexão ao pool mesmo quando a leitura falha
+            async with response, async_timeout.timeout(API_BODY_TIMEOUT):
+                if conditional and response.status == 304 and url in self._payloads:
+                    _LOGGER.debug("Conteúdo não modificado (304) - %s", url)
+                    self._record_success(health, started, first_byte)
+                    self.stats.not_modified += 1
+                    return self._payloads[url][1]
                 _verify_response_or_raise(response)
-                return await response.json()
+                if not conditional:
+                    body = await response.read()
+                    self._record_success(health, started, first_byte)
+                    return json.loads(body)
+                payload = await self._decode_if_changed(url, response, project)
+                self._record_success(health, started, first_byte)
+                return payload
 
         except TimeoutError as exception:
+            health.record_failure()
             msg = f"Erro de tempo limite ao buscar informações - {exception}"
-            raise IngressoApiClientCommunicationError(msg) from exception
+            raise _RetryableError(msg) from exception
+        except aiohttp.ClientResponseError as exception:
+            msg = f"Erro ao buscar informações - {exception}"
+            if exception.status not in RETRYABLE_STATUSES:
+                raise IngressoApiClientCommunicationError(msg) from exception
+            health.record_failure()
+            raise _RetryableError(msg, _retry_after(exception.headers)) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
+            health.record_failure()
             msg = f"Erro ao buscar informações - {exception}"
-            raise IngressoApiClientCommunicationError(msg) from exception
+            raise _RetryableError(msg) from exception
+        except IngressoApiClientError:
+            raise
         except Exception as exception:  # pylint: disable=broad-except
             msg = f"Algo realmente errado aconteceu! - {exception}"
             raise IngressoApiClientError(msg) from exception
+
+    def _record_success(
+        self, health: _HostHealth, started: float, first_byte: float
+    ) -> None:
+        """Registrar as latências de uma resposta bem-sucedida."""
+        health.record_success(first_byte)
+        self.stats.latency.record(monotonic() - started)
+
+    async def _decode_if_changed(
+        self,
+        url: str,
+        response: aiohttp.ClientResponse,
+        project: Callable[[Any], Any] | None,
+    ) -> Any:
+        """Decodificar a resposta apenas se o conteúdo mudou."""
+        validators = {}
+        if etag := response.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        self._validators[url] = validators
+
+        cached = self._payloads.get(url)
+        if project is not None:
+            # Um corpo igual ao anterior é reconhecido pelo hash sem ser
+            # decodificado nem projetado
+            decoded = await async_decode_items(
+                response.content.iter_chunked(CHUNK_SIZE),
+                project,
+                cached[0] if cached is not None else (),
+            )
+            digest, payload = decoded.digest, decoded.payload
+            self.stats.record_body(decoded.size, decoded.decode_seconds)
+        else:
+            body = await response.read()
+            digest = hashlib.blake2b(body, digest_size=16).digest()
+            payload = None
+
+        # Sem validadores do servidor, comparar o hash do corpo mantém o
+        # mesmo objeto para um conteúdo idêntico
+        if cached is not None and cached[0] == digest:
+            _LOGGER.debug("Conteúdo inalterado - %s", url)
+            self.stats.unchanged += 1
+            if project is None:
+                self.stats.record_body(len(body), 0.0)
+            return cached[1]
+
+        if project is None:
+            started = perf_counter()
+            payload = json.loads(body)
+            self.stats.record_body(len(body), perf_counter() - started)
+        self._payloads[url] = (digest, payload)
+        return payload
@@ -9,65 +9,67 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.const import EntityCategory
 
 from .const import DOMAIN
+from .entity import IngressoEntity
 
 if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
-    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+    from .coordinator import IngressoDataUpdateCoordinator
+    from .data import IngressoConfigEntry
 
 ENTITY_DESCRIPTIONS = (
     BinarySensorEntityDescription(
-        key="ingresso_availability",
-        name="Ingresso Movies Available",
+        key="api_connectivity",
+        name="Conexão com a API",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
 )
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: IngressoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-
     async_add_entities(
         IngressoBinarySensor(
             coordinator=coordinator,
             entity_description=entity_description,
-            entry_id=entry.entry_id,
         )
+        for coordinator in entry.runtime_data.coordinators
         for entity_description in ENTITY_DESCRIPTIONS
     )
 
 
-class IngressoBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Ingresso binary_sensor class."""
+class IngressoBinarySensor(IngressoEntity, BinarySensorEntity):
+    """Whether the last refresh reached the Ingresso.com API."""
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: IngressoDataUpdateCoordinator,
         entity_description: BinarySensorEntityDescription,
-        entry_id: str,
     ) -> None:
         """Initialize the binary_sensor class."""
         super().__init__(coordinator)
         self.entity_description = entity_description
-        self._attr_unique_id = f"{entry_id}_{entity_description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry_id)},
-            "name": "Ingresso.com",
-            "manufacturer": "Ingresso.com",
-            "model": "API",
-            "sw_version": "1.0",
-        }
+        self._attr_unique_id = (
+            f"{DOMAIN}_{coordinator.device_id}_{entity_description.key}"
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True; a failed refresh is reported as disconnected."""
+        return True
 
     @property
     def is_on(self) -> bool:
-        """Return true if movies are available."""
-        return len(self.coordinator.data) > 0 if self.coordinator.data else False
+        """Return true if the last refresh succeeded."""
+        return (
+            self.coordinator.last_update_success and self.coordinator.data is not None
+        )
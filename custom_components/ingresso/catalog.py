@@ -0,0 +1,206 @@
+"""Catálogo de cidades e cinemas do Ingresso.com."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .api import IngressoApiClient, IngressoApiClientError
+from .const import (
+    CATALOG_TTL,
+    DATA_CATALOG,
+    DEFAULT_PARTNERSHIP,
+    DOMAIN,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .models import normalize_text
+from .transport import async_get_transport
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .transport import IngressoTransport
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IngressoCatalog:
+    """Catálogo persistido de cidades e cinemas, com índices prontos.
+
+    O catálogo é salvo em disco e servido na hora, mesmo vencido: passado o
+    CATALOG_TTL, a versão salva é usada enquanto uma atualização roda em
+    segundo plano. Só quando não há nada salvo os formulários esperam a API.
+    """
+
+    def __init__(self, hass: HomeAssistant, transport: IngressoTransport) -> None:
+        """Inicializar o catálogo."""
+        self._hass = hass
+        self._transport = transport
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.catalog"
+        )
+        # Atualizações em andamento, uma por lista do catálogo
+        self._refreshes: dict[str, asyncio.Task[Any]] = {}
+        self._cities: list[dict[str, Any]] = []
+        self._cities_fetched_at = 0.0
+        self._theaters: dict[str, dict[str, Any]] = {}
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._by_uf: dict[str, list[dict[str, Any]]] = {}
+        self._by_name: dict[str, list[dict[str, Any]]] = {}
+        self._city_choices: dict[str, str] = {}
+        # Formulários abertos juntos aguardam a mesma leitura do disco
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Carregar o catálogo salvo em disco, uma única vez."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            if stored := await self._store.async_load():
+                self._set_cities(stored["cities"], stored["cities_fetched_at"])
+                self._theaters = stored["theaters"]
+            self._loaded = True
+
+    @property
+    def city_choices(self) -> dict[str, str]:
+        """Retornar as opções de cidade no formato dos formulários."""
+        return self._city_choices
+
+    def city(self, city_id: str) -> dict[str, Any] | None:
+        """Retornar uma cidade pelo id."""
+        return self._by_id.get(str(city_id))
+
+    def cities_by_uf(self, uf: str) -> list[dict[str, Any]]:
+        """Retornar as cidades de um estado."""
+        return self._by_uf.get(uf.upper(), [])
+
+    def cities_by_name(self, name: str) -> list[dict[str, Any]]:
+        """Retornar as cidades com o nome, ignorando acentos e caixa."""
+        return self._by_name.get(normalize_text(name), [])
+
+    async def async_get_cities(self) -> list[dict[str, Any]]:
+        """Retornar as cidades, atualizando o catálogo se estiver vencido."""
+        if not self._cities:
+            await self._async_refresh("cities", self._async_fetch_cities)
+        elif not self._is_fresh(self._cities_fetched_at):
+            self._async_refresh_in_background("cities", self._async_fetch_cities)
+        return self._cities
+
+    async def async_get_theaters(
+        self, city_id: str, partnership: str
+    ) -> list[dict[str, Any]]:
+        """Retornar os cinemas de uma cidade, atualizando se estiverem vencidos."""
+        key = f"{city_id}|{partnership}"
+
+        async def fetch() -> None:
+            await self._async_fetch_theaters(key, city_id, partnership)
+
+        if (cached := self._theaters.get(key)) is None:
+            await self._async_refresh(key, fetch)
+            cached = self._theaters[key]
+        elif not self._is_fresh(cached["fetched_at"]):
+            self._async_refresh_in_background(key, fetch)
+        return cached["items"]
+
+    async def _async_fetch_cities(self) -> None:
+        """Buscar as cidades na API e guardá-las."""
+        client = IngressoApiClient(
+            city_id=None,
+            partnership=DEFAULT_PARTNERSHIP,
+            session=self._transport.session,
+            hosts=self._transport.hosts,
+        )
+        states = await client.async_get_states()
+        cities = [city for state in states for city in state.get("cities") or ()]
+        self._set_cities(cities, time())
+        self._async_schedule_save()
+
+    async def _async_fetch_theaters(
+        self, key: str, city_id: str, partnership: str
+    ) -> None:
+        """Buscar os cinemas de uma cidade na API e guardá-los."""
+        client = IngressoApiClient(
+            city_id=city_id,
+            partnership=partnership,
+            session=self._transport.session,
+            hosts=self._transport.hosts,
+        )
+        theaters = await client.async_get_theaters()
+        self._theaters[key] = {"fetched_at": time(), "items": theaters}
+        self._async_schedule_save()
+
+    async def _async_refresh(
+        self, key: str, fetch: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Atualizar uma lista, aproveitando a atualização em andamento."""
+        if (task := self._refreshes.get(key)) is None or task.done():
+            task = self._refreshes[key] = self._hass.async_create_background_task(
+                fetch(), f"{DOMAIN}_catalog_{key}"
+            )
+        # Um formulário fechado não deve cancelar a atualização
+        await asyncio.shield(task)
+
+    def _async_refresh_in_background(
+        self, key: str, fetch: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Atualizar uma lista vencida sem fazer o formulário esperar."""
+        if (task := self._refreshes.get(key)) is not None and not task.done():
+            return
+
+        async def refresh() -> None:
+            try:
+                await fetch()
+            except IngressoApiClientError as err:
+                _LOGGER.warning("Mantendo o catálogo salvo (%s): %s", key, err)
+
+        self._refreshes[key] = self._hass.async_create_background_task(
+            refresh(), f"{DOMAIN}_catalog_{key}"
+        )
+
+    @staticmethod
+    def _is_fresh(fetched_at: float) -> bool:
+        """Retornar se um conteúdo ainda está dentro do TTL."""
+        return time() - fetched_at < CATALOG_TTL.total_seconds()
+
+    def _set_cities(self, cities: list[dict[str, Any]], fetched_at: float) -> None:
+        """Guardar as cidades e montar os índices uma única vez."""
+        self._cities = sorted(cities, key=lambda city: city["name"])
+        self._cities_fetched_at = fetched_at
+        self._by_id = {str(city["id"]): city for city in self._cities}
+        self._by_uf = {}
+        self._by_name = {}
+        for city in self._cities:
+            self._by_uf.setdefault(city.get("uf", "").upper(), []).append(city)
+            self._by_name.setdefault(normalize_text(city["name"]), []).append(city)
+        self._city_choices = {
+            city["id"]: f"{city['name']} - {city['uf']}" for city in self._cities
+        }
+
+    def _async_schedule_save(self) -> None:
+        """Agendar a gravação do catálogo em disco."""
+        self._store.async_delay_save(
+            lambda: {
+                "cities": self._cities,
+                "cities_fetched_at": self._cities_fetched_at,
+                "theaters": self._theaters,
+            },
+            SNAPSHOT_SAVE_DELAY,
+        )
+
+
+async def async_get_catalog(hass: HomeAssistant) -> IngressoCatalog:
+    """Retornar o catálogo compartilhado, carregando-o na primeira chamada."""
+    if (catalog := hass.data.get(DATA_CATALOG)) is None:
+        catalog = IngressoCatalog(hass, async_get_transport(hass))
+        hass.data[DATA_CATALOG] = catalog
+    # Quem chega durante a leitura espera por ela em vez de ver o catálogo vazio
+    await catalog.async_load()
+    return catalog
@@ -1,28 +1,81 @@
 """Config flow for Ingresso integration."""
 
 import logging
-from typing import Any, Dict, List
 
-import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+    TimeSelector,
+)
 
+from .catalog import IngressoCatalog, async_get_catalog
 from .const import (
+    API_RATE_BURST,
+    API_RATE_LIMIT,
     CONF_CITY_ID,
     CONF_CITY_NAME,
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_LOCAL_POSTERS,
+    CONF_MOVIE_ENTITIES,
     CONF_PARTNERSHIP,
+    CONF_QUIET_END,
+    CONF_QUIET_START,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CONF_SESSION_DAYS,
     CONF_THEATER,
     CONF_THEATER_NAME,
+    CONF_THEATERS,
     DEFAULT_PARTNERSHIP,
+    DEFAULT_SESSION_DAYS,
     DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# Base API URL for fetching data
-API_BASE_URL = "https://api-content.ingresso.com"
+
+def _theater_selector(theaters):
+    """Build a selector that accepts one or more theaters of a city."""
+    return SelectSelector(
+        SelectSelectorConfig(
+            options=[
+                SelectOptionDict(value=theater["id"], label=theater["name"])
+                for theater in theaters
+            ],
+            multiple=True,
+            mode=SelectSelectorMode.DROPDOWN,
+        )
+    )
+
+
+def _theater_data(theaters, selected):
+    """Return the entry data for the selected theaters.
+
+    A single theater keeps the original data layout; several theaters are
+    stored together so the entry fetches them in one request.
+    """
+    names = {theater["id"]: theater["name"] for theater in theaters}
+    chosen = {theater_id: names[theater_id] for theater_id in selected}
+    if len(chosen) == 1:
+        ((theater_id, theater_name),) = chosen.items()
+        return {CONF_THEATER: theater_id, CONF_THEATER_NAME: theater_name}
+    return {CONF_THEATERS: chosen}
+
+
+def _theater_title(city_name, data):
+    """Return the entry title for a city and its theaters."""
+    if CONF_THEATERS in data:
+        return f"{city_name} - {', '.join(data[CONF_THEATERS].values())}"
+    return f"{city_name} - {data[CONF_THEATER_NAME]}"
 
 
 class IngressoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -32,6 +85,7 @@ class IngressoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self):
         """Initialize the config flow."""
+        self._catalog: IngressoCatalog | None = None
         self._cities = []
         self._theaters = []
         self._selected_city_id = None
@@ -41,11 +95,11 @@ class IngressoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the initial step - selecting a city."""
         errors = {}
 
-        # Fetch cities list if not already loaded
+        # Load cities from the shared catalog if not already loaded
         if not self._cities:
-            session = async_get_clientsession(self.hass)
             try:
-                self._cities = await self._fetch_cities(session)
+                self._catalog = await async_get_catalog(self.hass)
+                self._cities = await self._catalog.async_get_cities()
             except Exception as err:
                 _LOGGER.error("Error fetching cities: %s", err)
                 errors["base"] = "cannot_connect"
@@ -58,19 +112,15 @@ class IngressoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             city_id = user_input.get(CONF_CITY_ID)
             # Find selected city name from ID for display purposes
-            for city in self._cities:
-                if city["id"] == city_id:
-                    self._selected_city_id = city_id
-                    self._selected_city_name = city["name"]
-                    break
+            if city := self._catalog.city(city_id):
+                self._selected_city_id = city_id
+                self._selected_city_name = city["name"]
 
             # Continue to next step to select theater
             return await self.async_step_theater()
 
-        # Prepare city choices for dropdown
-        city_choices = {
-            city["id"]: f"{city['name']} - {city['uf']}" for city in self._cities
-        }
+        # City choices for dropdown are prepared once by the catalog
+        city_choices = self._catalog.city_choices
 
         # Build schema for city selection
         schema = vol.Schema(
@@ -89,12 +139,11 @@ class IngressoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the second step - selecting a theater."""
         errors = {}
 
-        # Fetch theaters for the selected city
+        # Load theaters for the selected city from the shared catalog
         if not self._theaters:
-            session = async_get_clientsession(self.hass)
             try:
-                self._theaters = await self._fetch_theaters(
-                    session, self._selected_city_id, DEFAULT_PARTNERSHIP
+                self._theaters = await self._catalog.async_get_theaters(
+                    self._selected_city_id, DEFAULT_PARTNERSHIP
                 )
                 if not self._theaters:
                     errors["base"] = "no_theaters"
@@ -116,35 +165,26 @@ class IngressoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     description_placeholders={"city_name": self._selected_city_name},
                 )
 
-        if user_input is not None:
-            theater_id = user_input.get(CONF_THEATER)
-            theater_name = ""
-
-            # Get the theater name
-            for theater in self._theaters:
-                if theater["id"] == theater_id:
-                    theater_name = theater["name"]
-                    break
+        if user_input is not None and not user_input.get(CONF_THEATER):
+            errors["base"] = "no_theater_selected"
+        elif user_input is not None:
+            theater_data = _theater_data(self._theaters, user_input[CONF_THEATER])
 
             # Create entry with all the collected data
             return self.async_create_entry(
-                title=f"{self._selected_city_name} - {theater_name}",
+                title=_theater_title(self._selected_city_name, theater_data),
                 data={
                     CONF_CITY_ID: self._selected_city_id,
                     CONF_CITY_NAME: self._selected_city_name,
                     CONF_PARTNERSHIP: DEFAULT_PARTNERSHIP,
-                    CONF_THEATER: theater_id,
-                    CONF_THEATER_NAME: theater_name,
+                    **theater_data,
                 },
             )
 
-        # Prepare theater choices for dropdown
-        theater_choices = {theater["id"]: theater["name"] for theater in self._theaters}
-
-        # Build schema for theater selection
+        # Build schema for selecting one or more theaters
         schema = vol.Schema(
             {
-                vol.Required(CONF_THEATER): vol.In(theater_choices),
+                vol.Required(CONF_THEATER): _theater_selector(self._theaters),
             }
         )
 
@@ -155,44 +195,6 @@ class IngressoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={"city_name": self._selected_city_name},
         )
 
-    async def _fetch_cities(
-        self, session: aiohttp.ClientSession
-    ) -> List[Dict[str, Any]]:
-        """Fetch available cities from API."""
-        all_cities = []
-
-        try:
-            async with session.get(f"{API_BASE_URL}/v0/states") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    for state in data:
-                        if state.get("cities"):
-                            all_cities.extend(state["cities"])
-
-            # Sort cities alphabetically by name
-            return sorted(all_cities, key=lambda x: x["name"])
-        except Exception as err:
-            _LOGGER.error("Error fetching cities: %s", err)
-            return []
-
-    async def _fetch_theaters(
-        self, session: aiohttp.ClientSession, city_id: str, partnership: str
-    ) -> List[Dict[str, Any]]:
-        """Fetch theaters for a specific city."""
-        try:
-            async with session.get(
-                f"{API_BASE_URL}/v0/theaters/city/{city_id}/partnership/{partnership}"
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if isinstance(data, dict) and "items" in data:
-                        return data["items"]
-                    return []
-                return []
-        except Exception as err:
-            _LOGGER.error("Error fetching theaters: %s", err)
-            return []
-
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -206,20 +208,22 @@ class IngressoOptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
+        self._catalog: IngressoCatalog | None = None
         self._cities = []
         self._theaters = []
         self._selected_city_id = self.config_entry.data.get(CONF_CITY_ID)
         self._selected_city_name = self.config_entry.data.get(CONF_CITY_NAME)
+        self._new_data = dict(self.config_entry.data)
 
     async def async_step_init(self, user_input=None):
         """Handle options flow - selecting a city."""
         errors = {}
 
-        # Fetch cities list if not already loaded
+        # Load cities from the shared catalog if not already loaded
         if not self._cities:
-            session = async_get_clientsession(self.hass)
             try:
-                self._cities = await self._fetch_cities(session)
+                self._catalog = await async_get_catalog(self.hass)
+                self._cities = await self._catalog.async_get_cities()
             except Exception as err:
                 _LOGGER.error("Error fetching cities: %s", err)
                 errors["base"] = "cannot_connect"
@@ -232,19 +236,15 @@ class IngressoOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             city_id = user_input.get(CONF_CITY_ID)
             # Find selected city name from ID for display purposes
-            for city in self._cities:
-                if city["id"] == city_id:
-                    self._selected_city_id = city_id
-                    self._selected_city_name = city["name"]
-                    break
+            if city := self._catalog.city(city_id):
+                self._selected_city_id = city_id
+                self._selected_city_name = city["name"]
 
             # Continue to next step to select theater
             return await self.async_step_theater()
 
-        # Prepare city choices for dropdown
-        city_choices = {
-            city["id"]: f"{city['name']} - {city['uf']}" for city in self._cities
-        }
+        # City choices for dropdown are prepared once by the catalog
+        city_choices = self._catalog.city_choices
 
         # Build schema for city selection with default value from current config
         schema = vol.Schema(
@@ -265,12 +265,11 @@ class IngressoOptionsFlowHandler(config_entries.OptionsFlow):
         """Handle the second step - selecting a theater."""
         errors = {}
 
-        # Fetch theaters for the selected city
+        # Load theaters for the selected city from the shared catalog
         if not self._theaters:
-            session = async_get_clientsession(self.hass)
             try:
-                self._theaters = await self._fetch_theaters(
-                    session, self._selected_city_id, DEFAULT_PARTNERSHIP
+                self._theaters = await self._catalog.async_get_theaters(
+                    self._selected_city_id, DEFAULT_PARTNERSHIP
                 )
                 if not self._theaters:
                     errors["base"] = "no_theaters"
@@ -292,52 +291,41 @@ class IngressoOptionsFlowHandler(config_entries.OptionsFlow):
                     description_placeholders={"city_name": self._selected_city_name},
                 )
 
-        if user_input is not None:
-            theater_id = user_input.get(CONF_THEATER)
-            theater_name = ""
-
-            # Get the theater name
-            for theater in self._theaters:
-                if theater["id"] == theater_id:
-                    theater_name = theater["name"]
-                    break
-
-            # Update config entry with new values
-            new_data = {
-                **self.config_entry.data,
+        if user_input is not None and not user_input.get(CONF_THEATER):
+            errors["base"] = "no_theater_selected"
+        elif user_input is not None:
+            # Keep the new values until the settings step is confirmed; the
+            # single and multi-theater layouts replace each other
+            data = {
+                key: value
+                for key, value in self.config_entry.data.items()
+                if key not in (CONF_THEATER, CONF_THEATER_NAME, CONF_THEATERS)
+            }
+            self._new_data = {
+                **data,
                 CONF_CITY_ID: self._selected_city_id,
                 CONF_CITY_NAME: self._selected_city_name,
                 CONF_PARTNERSHIP: DEFAULT_PARTNERSHIP,
-                CONF_THEATER: theater_id,
-                CONF_THEATER_NAME: theater_name,
+                **_theater_data(self._theaters, user_input[CONF_THEATER]),
             }
 
-            self.hass.config_entries.async_update_entry(
-                self.config_entry, data=new_data
-            )
-            return self.async_create_entry(title="", data={})
-
-        # Get current theater ID
-        current_theater_id = self.config_entry.data.get(CONF_THEATER, "")
+            # Continue to next step to adjust the settings
+            return await self.async_step_settings()
 
-        # Prepare theater choices for dropdown
-        theater_choices = {theater["id"]: theater["name"] for theater in self._theaters}
+        # Preselect the current theaters that are still listed for the city
+        data = self.config_entry.data
+        current = list(data.get(CONF_THEATERS) or ()) or [data.get(CONF_THEATER)]
+        available = {theater["id"] for theater in self._theaters}
+        current = [theater_id for theater_id in current if theater_id in available]
 
-        # Build schema for theater selection with default value if it exists in current theaters
-        if current_theater_id in theater_choices:
-            schema = vol.Schema(
-                {
-                    vol.Required(CONF_THEATER, default=current_theater_id): vol.In(
-                        theater_choices
-                    ),
-                }
-            )
-        else:
-            schema = vol.Schema(
-                {
-                    vol.Required(CONF_THEATER): vol.In(theater_choices),
-                }
-            )
+        # Build schema for selecting one or more theaters
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_THEATER, default=current): _theater_selector(
+                    self._theaters
+                ),
+            }
+        )
 
         return self.async_show_form(
             step_id="theater",
@@ -346,40 +334,92 @@ class IngressoOptionsFlowHandler(config_entries.OptionsFlow):
             description_placeholders={"city_name": self._selected_city_name},
         )
 
-    async def _fetch_cities(
-        self, session: aiohttp.ClientSession
-    ) -> List[Dict[str, Any]]:
-        """Fetch available cities from API."""
-        all_cities = []
-
-        try:
-            async with session.get(f"{API_BASE_URL}/v0/states") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    for state in data:
-                        if state.get("cities"):
-                            all_cities.extend(state["cities"])
-
-            # Sort cities alphabetically by name
-            return sorted(all_cities, key=lambda x: x["name"])
-        except Exception as err:
-            _LOGGER.error("Error fetching cities: %s", err)
-            return []
-
-    async def _fetch_theaters(
-        self, session: aiohttp.ClientSession, city_id: str, partnership: str
-    ) -> List[Dict[str, Any]]:
-        """Fetch theaters for a specific city."""
-        try:
-            async with session.get(
-                f"{API_BASE_URL}/v0/theaters/city/{city_id}/partnership/{partnership}"
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if isinstance(data, dict) and "items" in data:
-                        return data["items"]
-                    return []
-                return []
-        except Exception as err:
-            _LOGGER.error("Error fetching theaters: %s", err)
-            return []
+    async def async_step_settings(self, user_input=None):
+        """Handle the last step - integration settings."""
+        if user_input is not None:
+            # Quiet hours are optional, so a cleared field must drop the option
+            options = {
+                key: value
+                for key, value in self.config_entry.options.items()
+                if key not in (CONF_QUIET_START, CONF_QUIET_END)
+            }
+            options.update(user_input)
+
+            # Update data and options together so the entry reloads once
+            self.hass.config_entries.async_update_entry(
+                self.config_entry,
+                title=_theater_title(self._selected_city_name, self._new_data),
+                data=self._new_data,
+                options=options,
+            )
+            return self.async_create_entry(title="", data=options)
+
+        options = self.config_entry.options
+
+        # Build schema for the settings with the current values as defaults
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_COMPACT_ATTRIBUTES,
+                    default=options.get(CONF_COMPACT_ATTRIBUTES, False),
+                ): bool,
+                vol.Optional(
+                    CONF_MOVIE_ENTITIES,
+                    default=options.get(CONF_MOVIE_ENTITIES, False),
+                ): bool,
+                vol.Optional(
+                    CONF_LOCAL_POSTERS,
+                    default=options.get(CONF_LOCAL_POSTERS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_DIAGNOSTIC_SENSORS,
+                    default=options.get(CONF_DIAGNOSTIC_SENSORS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_SESSION_DAYS,
+                    default=options.get(CONF_SESSION_DAYS, DEFAULT_SESSION_DAYS),
+                ): vol.All(
+                    NumberSelector(
+                        NumberSelectorConfig(
+                            min=0, max=7, step=1, mode=NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Coerce(int),
+                ),
+                vol.Optional(
+                    CONF_RATE_LIMIT,
+                    default=options.get(CONF_RATE_LIMIT, API_RATE_LIMIT),
+                ): vol.All(
+                    NumberSelector(
+                        NumberSelectorConfig(
+                            min=0.1, max=50, step=0.1, mode=NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Coerce(float),
+                ),
+                vol.Optional(
+                    CONF_RATE_BURST,
+                    default=options.get(CONF_RATE_BURST, API_RATE_BURST),
+                ): vol.All(
+                    NumberSelector(
+                        NumberSelectorConfig(
+                            min=1, max=100, step=1, mode=NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Coerce(int),
+                ),
+                vol.Optional(
+                    CONF_QUIET_START,
+                    description={"suggested_value": options.get(CONF_QUIET_START)},
+                ): TimeSelector(),
+                vol.Optional(
+                    CONF_QUIET_END,
+                    description={"suggested_value": options.get(CONF_QUIET_END)},
+                ): TimeSelector(),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=schema,
+        )
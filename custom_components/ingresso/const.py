@@ -1,5 +1,6 @@
 """Constants for the Ingresso integration."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
@@ -7,7 +8,45 @@ LOGGER: Logger = getLogger(__package__)
 # API
 BASE_URL = "https://api-content.ingresso.com/v0/templates/nowplaying/{}?partnership={}"
 THEATER_URL = "https://api-content.ingresso.com/v0/templates/nowplaying/{}?partnership={}&theaters={}"
+STATES_URL = "https://api-content.ingresso.com/v0/states"
+THEATERS_URL = "https://api-content.ingresso.com/v0/theaters/city/{}/partnership/{}"
+SESSIONS_URL = (
+    "https://api-content.ingresso.com/v0/sessions/city/{}/theater/{}?partnership={}"
+)
+# Host of the URLs above, which keys the rate limiter and circuit breaker
+API_HOST = "api-content.ingresso.com"
 DEFAULT_POSTER = "https://www.promoview.com.br/uploads/2019/01/images/07.01.2019/ingresso.comlogo.jpg"
+# Requests: retries of idempotent calls, backoff base and timeout bounds (seconds)
+API_RETRIES = 2
+API_BACKOFF = 1.0
+API_MIN_TIMEOUT = 5
+API_MAX_TIMEOUT = 30
+# Fixed budget for reading a response body once the headers arrived
+API_BODY_TIMEOUT = 60
+# Longest Retry-After (seconds) waited before retrying; longer ones give up
+API_MAX_RETRY_AFTER = 60
+# Default requests per second and burst allowed to each API host, for all
+# entries; the lowest values set in the options of the loaded entries win
+API_RATE_LIMIT = 5.0
+API_RATE_BURST = 20
+# Consecutive failures that open the circuit, and how long it stays open
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 120
+# Integration HTTP session: connections per host, DNS cache and keep-alive (s)
+HTTP_LIMIT_PER_HOST = 4
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 60
+# Distinct genre lists shared by the movie library before its table restarts
+GENRES_CACHE_SIZE = 1024
+# Age up to which a shared city fetch is reused by other entries
+HUB_MAX_AGE = timedelta(minutes=25)
+# Age up to which a fetch is reused by the get_movies service
+SERVICE_CACHE_TTL = timedelta(minutes=5)
+# Serialized get_movies responses kept for repeated calls
+SERVICE_CACHE_SIZE = 32
+# Concurrent fetches and per-target timeout (seconds) of get_movies_batch
+BATCH_MAX_CONCURRENCY = 4
+BATCH_TIMEOUT = 15
 
 # Configuration
 CONF_CITY_ID = "city_id"
@@ -16,9 +55,43 @@ CONF_PARTNERSHIP = "partnership"
 DEFAULT_PARTNERSHIP = "encora"
 CONF_THEATER = "theater"
 CONF_THEATER_NAME = "theater_name"
+# Theaters followed by a multi-theater entry, as {id: name}
+CONF_THEATERS = "theaters"
+CONF_COMPACT_ATTRIBUTES = "compact_attributes"
+CONF_MOVIE_ENTITIES = "movie_entities"
+CONF_DIAGNOSTIC_SENSORS = "diagnostic_sensors"
+CONF_QUIET_START = "quiet_start"
+CONF_QUIET_END = "quiet_end"
+CONF_SESSION_DAYS = "session_days"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_BURST = "rate_burst"
+DEFAULT_SESSION_DAYS = 0
+CONF_LOCAL_POSTERS = "local_posters"
+
+# Events
+EVENT_MOVIE_ADDED = "ingresso_movie_added"
+EVENT_MOVIE_REMOVED = "ingresso_movie_removed"
+EVENT_MOVIE_CHANGED = "ingresso_movie_changed"
+
+# Storage
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10  # seconds
+# Cities and theaters rarely change; the stored catalog is refreshed daily
+CATALOG_TTL = timedelta(days=1)
+# Posters are resized to fit this box and kept on disk up to this many bytes
+POSTER_SIZE = (300, 450)
+POSTER_CACHE_BUDGET = 64 * 1024 * 1024
+
+# Polling: default interval and the bounds of the adaptive scheduler
+UPDATE_INTERVAL = timedelta(minutes=30)
+MIN_UPDATE_INTERVAL = timedelta(minutes=10)
+MAX_UPDATE_INTERVAL = timedelta(hours=4)
 
 # Misc
 ICON = "mdi:movie"
-SCAN_INTERVAL = 3600  # 1 hour
 DOMAIN = "ingresso"
+DATA_HUB = f"{DOMAIN}_hub"
+DATA_CATALOG = f"{DOMAIN}_catalog"
+DATA_POSTERS = f"{DOMAIN}_posters"
+DATA_TRANSPORT = f"{DOMAIN}_transport"
 ATTRIBUTION = "Dados fornecidos por Ingresso.com"
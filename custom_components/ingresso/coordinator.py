@@ -1,32 +1,361 @@
-"""DataUpdateCoordinator for integration_blueprint."""
+"""Coordenador de atualização de dados do Ingresso.com."""
 
 from __future__ import annotations
 
+from datetime import timedelta
+from time import monotonic, perf_counter
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
-    IntegrationBlueprintApiClientAuthenticationError,
-    IntegrationBlueprintApiClientError,
+    IngressoApiClientAuthenticationError,
+    IngressoApiClientError,
 )
+from .const import (
+    CONF_CITY_ID,
+    CONF_CITY_NAME,
+    CONF_PARTNERSHIP,
+    CONF_QUIET_END,
+    CONF_QUIET_START,
+    CONF_SESSION_DAYS,
+    DEFAULT_SESSION_DAYS,
+    DOMAIN,
+    EVENT_MOVIE_ADDED,
+    EVENT_MOVIE_CHANGED,
+    EVENT_MOVIE_REMOVED,
+    LOGGER,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .diff import MovieDiff, MovieDiffer
+from .limiter import PRIORITY_BACKGROUND, PRIORITY_SERVICE
+from .scheduler import AdaptivePollScheduler
+from .sessions import SessionIndex
+from .stats import RefreshStats
 
 if TYPE_CHECKING:
-    from .data import IntegrationBlueprintConfigEntry
+    from datetime import date, datetime, time
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .hub import IngressoFetchHub
+    from .models import Movie
+
+
+def _parse_time(value: str | None) -> time | None:
+    """Converter um horário das opções, se configurado."""
+    return dt_util.parse_time(value) if value else None
+
+
+def snapshot_key(entry_id: str, theater: str | None = None) -> str:
+    """Retornar a chave do snapshot de uma entrada ou de um de seus cinemas."""
+    key = f"{DOMAIN}.{entry_id}"
+    return f"{key}.{theater}" if theater else key
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-class BlueprintDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching data from the API."""
+class IngressoDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
+    """Gerenciar a busca dos filmes em cartaz de uma entrada de configuração."""
+
+    config_entry: ConfigEntry
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        hub: IngressoFetchHub,
+        update_interval: timedelta,
+        theater: str | None = None,
+        theater_name: str | None = None,
+        multi_theater: bool = False,
+    ) -> None:
+        """Inicializar o coordenador.
+
+        Entradas com vários cinemas têm um coordenador por cinema, cada um
+        com o seu snapshot; o hub busca os cinemas juntos.
+        """
+        name = f"{DOMAIN}_{entry.entry_id}"
+        if multi_theater:
+            name = f"{name}_{theater}"
+        super().__init__(
+            hass,
+            LOGGER,
+            config_entry=entry,
+            name=name,
+            update_interval=update_interval,
+            # O cliente devolve o mesmo objeto quando a resposta não mudou,
+            # então ciclos sem alteração não reescrevem o estado
+            always_update=False,
+        )
+        self.hub = hub
+        self.theater = theater
+        self.theater_name = theater_name or ""
+        self.city_name: str = entry.data[CONF_CITY_NAME]
+        # Intervalo calculado pelo agendador, mantido mesmo com a
+        # atualização automática desligada
+        self._poll_interval = update_interval
+        self._auto_update = True
+        # Atualizações pedidas pelo usuário passam à frente das periódicas e
+        # não aceitam o que o hub guardou em cache
+        self._priority = PRIORITY_BACKGROUND
+        self._forced = False
+        self.fetched_at: datetime | None = None
+        # Os filmes decodificados vêm do catálogo compartilhado do hub
+        self._differ = MovieDiffer(hub.library.movie)
+        self._scheduler = AdaptivePollScheduler(
+            _parse_time(entry.options.get(CONF_QUIET_START)),
+            _parse_time(entry.options.get(CONF_QUIET_END)),
+        )
+        self.stats = RefreshStats()
+        self.sessions = SessionIndex([])
+        self._session_days = entry.options.get(CONF_SESSION_DAYS, DEFAULT_SESSION_DAYS)
+        self._session_source: tuple[Any, date] | None = None
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            snapshot_key(entry.entry_id, theater if multi_theater else None),
+        )
+
+    @property
+    def snapshot_key(self) -> str:
+        """Retornar a chave de armazenamento do snapshot."""
+        return self._store.key
+
+    @property
+    def is_stale(self) -> bool:
+        """Retornar se os dados exibidos não vêm da última atualização."""
+        return not self.last_update_success
+
+    @property
+    def auto_update(self) -> bool:
+        """Retornar se as atualizações periódicas estão ligadas."""
+        return self._auto_update
+
+    @property
+    def poll_interval(self) -> timedelta:
+        """Retornar o intervalo do agendador, mesmo com a atualização pausada."""
+        return self._poll_interval
+
+    @callback
+    def async_set_auto_update(self, enabled: bool) -> None:
+        """Ligar ou desligar as atualizações periódicas."""
+        if enabled == self._auto_update:
+            return
+        self._auto_update = enabled
+        if enabled:
+            self.update_interval = self._poll_interval
+            self._schedule_refresh()
+        else:
+            # Sem intervalo o coordenador não agenda novas atualizações;
+            # as manuais continuam funcionando
+            self.update_interval = None
+            self._unschedule_refresh()
+
+    @property
+    def movies(self) -> list[Movie]:
+        """Retornar os filmes decodificados da última atualização."""
+        return self._differ.movies
+
+    @property
+    def movies_by_id(self) -> dict[str, Movie]:
+        """Retornar os filmes decodificados pelo identificador.
 
-    config_entry: IntegrationBlueprintConfigEntry
+        Filmes que não mudaram mantêm o mesmo objeto entre atualizações.
+        """
+        return self._differ.by_id
 
-    async def _async_update_data(self) -> Any:
-        """Update data via library."""
+    @property
+    def fetch_stats(self) -> dict[str, Any]:
+        """Retornar os contadores das buscas do hub usadas pela entrada."""
+        data = self.config_entry.data
+        return self.hub.async_fetch_stats(
+            data[CONF_CITY_ID], data[CONF_PARTNERSHIP], self.theater
+        )
+
+    @property
+    def primary_fetch_stats(self) -> dict[str, Any] | None:
+        """Retornar os contadores da busca que traz os filmes da entrada."""
+        fetches = self.fetch_stats
+        # Cinemas cujos filmes não vêm separados na resposta da cidade (ou
+        # do grupo) têm uma busca própria
+        return fetches.get("theater") or fetches.get("group") or fetches.get("city")
+
+    async def async_request_refresh(self) -> None:
+        """Pedir uma atualização fora do agendamento, buscada na API."""
+        self._priority = PRIORITY_SERVICE
+        self._forced = True
+        await super().async_request_refresh()
+
+    async def async_restore(self) -> bool:
+        """Carregar o último conteúdo salvo em disco, se houver."""
+        if not (snapshot := await self._store.async_load()):
+            return False
+
+        # Snapshots antigos guardam os filmes completos da API
+        self.data = [self.hub.library.project(movie) for movie in snapshot["movies"]]
+        self._differ.update(self.data)
+        self._update_search()
+        self._scheduler.restore(snapshot.get("scheduler", {}))
+        self.fetched_at = dt_util.parse_datetime(snapshot["fetched_at"])
+        # Dados restaurados contam como desatualizados até a revalidação, o
+        # que também garante a escrita do estado quando ela for concluída
+        self.last_update_success = False
+        LOGGER.debug(
+            "%s - Restaurado conteúdo salvo em %s", self.name, snapshot["fetched_at"]
+        )
+        return True
+
+    @property
+    def device_id(self) -> str:
+        """Retornar o identificador do dispositivo do cinema."""
+        data = self.config_entry.data
+        device_id = f"{data[CONF_CITY_ID]}_{data[CONF_PARTNERSHIP]}"
+        if self.theater:
+            device_id = f"{device_id}_{self.theater}"
+        return device_id
+
+    @property
+    def device_name(self) -> str:
+        """Retornar o nome do dispositivo do cinema."""
+        if self.theater_name:
+            return f"Ingresso.com {self.theater_name}"
+        partnership = self.config_entry.data[CONF_PARTNERSHIP]
+        return f"Ingresso.com {partnership.capitalize()} {self.city_name}"
+
+    async def _async_update_data(self) -> list[dict[str, Any]]:
+        """Atualizar os dados através do hub compartilhado."""
+        data = self.config_entry.data
+        started = monotonic()
+        priority, self._priority = self._priority, PRIORITY_BACKGROUND
+        forced, self._forced = self._forced, False
+        max_age = timedelta(0) if forced else self._poll_interval * 0.9
         try:
-            return await self.config_entry.runtime_data.client.async_get_data()
-        except IntegrationBlueprintApiClientAuthenticationError as exception:
+            # Reaproveitar a busca de outra entrada feita neste mesmo ciclo
+            movies = await self.hub.async_get_movies(
+                data[CONF_CITY_ID],
+                data[CONF_PARTNERSHIP],
+                self.theater,
+                max_age=max_age,
+                priority=priority,
+            )
+        except IngressoApiClientAuthenticationError as exception:
+            self.stats.record_failure(dt_util.utcnow(), exception)
             raise ConfigEntryAuthFailed(exception) from exception
-        except IntegrationBlueprintApiClientError as exception:
+        except IngressoApiClientError as exception:
+            self.stats.record_failure(dt_util.utcnow(), exception)
             raise UpdateFailed(exception) from exception
+
+        sessions_changed = await self._async_update_sessions(priority, max_age)
+        self.fetched_at = dt_util.utcnow()
+
+        # A primeira carga é só a referência; não há o que anunciar. A lista
+        # pode ser outro objeto com os mesmos filmes (uma nova resposta da
+        # cidade, um cinema sem filmes), então vale a comparação do differ
+        first_load = self.data is None
+        diff = MovieDiff()
+        if movies is not self.data:
+            diff_started = perf_counter()
+            diff = self._differ.update(movies)
+            self.stats.last_diff_seconds = perf_counter() - diff_started
+            self._update_search()
+            if diff and not first_load:
+                self._fire_events(diff)
+            if diff or first_load:
+                self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+        if sessions_changed and not (diff or first_load):
+            # Com os filmes iguais o coordenador não avisaria as entidades
+            self.async_update_listeners()
+
+        now = dt_util.now()
+        self._scheduler.record(now, bool(diff) and not first_load)
+        self._poll_interval = self._scheduler.next_interval(now)
+        if self._auto_update:
+            self.update_interval = self._poll_interval
+            LOGGER.debug(
+                "%s - Próxima atualização em %s", self.name, self._poll_interval
+            )
+        self.stats.record_success(self.fetched_at, monotonic() - started)
+        return movies
+
+    async def _async_update_sessions(self, priority: int, max_age: timedelta) -> bool:
+        """Atualizar o índice de sessões do cinema, se habilitado."""
+        data = self.config_entry.data
+        if not self.theater or not self._session_days:
+            return False
+        try:
+            days = await self.hub.async_get_sessions(
+                data[CONF_CITY_ID],
+                data[CONF_PARTNERSHIP],
+                self.theater,
+                max_age=max_age,
+                priority=priority,
+            )
+        except IngressoApiClientError as exception:
+            # Sem sessões novas, o índice atual continua valendo
+            LOGGER.warning("%s - Erro ao obter sessões: %s", self.name, exception)
+            return False
+
+        today = dt_util.now().date()
+        if self._session_source is not None and (
+            days is self._session_source[0] and today == self._session_source[1]
+        ):
+            return False
+        self._session_source = (days, today)
+        self.sessions = SessionIndex.from_days(
+            days, today, self._session_days, dt_util.get_default_time_zone()
+        )
+        LOGGER.debug("%s - %s sessões indexadas", self.name, len(self.sessions))
+        return True
+
+    def _update_search(self) -> None:
+        """Levar os filmes do cinema ao índice de busca do hub."""
+        self.hub.search.update(
+            self.name,
+            self.movies_by_id,
+            entry_id=self.config_entry.entry_id,
+            city_name=self.city_name,
+            theater=self.theater,
+            theater_name=self.theater_name,
+        )
+
+    def _fire_events(self, diff: MovieDiff) -> None:
+        """Disparar os eventos de filmes adicionados, removidos e alterados."""
+        base = {
+            "entry_id": self.config_entry.entry_id,
+            "city_name": self.city_name,
+            "theater_name": self.theater_name,
+        }
+        fire = self.hass.bus.async_fire
+        for key in diff.added:
+            fire(
+                EVENT_MOVIE_ADDED, {**base, "movie_id": key, "title": diff.titles[key]}
+            )
+        for key in diff.removed:
+            fire(
+                EVENT_MOVIE_REMOVED,
+                {**base, "movie_id": key, "title": diff.titles[key]},
+            )
+        for key, changes in diff.changed.items():
+            fire(
+                EVENT_MOVIE_CHANGED,
+                {
+                    **base,
+                    "movie_id": key,
+                    "title": diff.titles[key],
+                    "changes": changes,
+                },
+            )
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Montar o conteúdo a ser salvo em disco."""
+        return {
+            "fetched_at": self.fetched_at.isoformat(),
+            "movies": self.data,
+            "scheduler": self._scheduler.as_dict(),
+        }
@@ -1,4 +1,4 @@
-"""Custom types for integration_blueprint."""
+"""Tipos da integração Ingresso.com."""
 
 from __future__ import annotations
 
@@ -9,17 +9,20 @@ if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
-    from .api import IntegrationBlueprintApiClient
-    from .coordinator import BlueprintDataUpdateCoordinator
+    from .coordinator import IngressoDataUpdateCoordinator
+    from .hub import IngressoFetchHub
+    from .posters import IngressoPosterCache
 
 
-type IntegrationBlueprintConfigEntry = ConfigEntry[IntegrationBlueprintData]
+type IngressoConfigEntry = ConfigEntry[IngressoData]
 
 
 @dataclass
-class IntegrationBlueprintData:
-    """Data for the Blueprint integration."""
+class IngressoData:
+    """Dados de uma entrada compartilhados pelas plataformas."""
 
-    client: IntegrationBlueprintApiClient
-    coordinator: BlueprintDataUpdateCoordinator
+    hub: IngressoFetchHub
+    # Um coordenador por cinema (ou um só para a cidade)
+    coordinators: list[IngressoDataUpdateCoordinator]
     integration: Integration
+    posters: IngressoPosterCache | None = None
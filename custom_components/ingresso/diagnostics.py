@@ -0,0 +1,48 @@
+"""Diagnóstico das entradas do Ingresso.com."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import API_HOST
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import IngressoConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: IngressoConfigEntry
+) -> dict[str, Any]:
+    """Retornar o diagnóstico de uma entrada de configuração."""
+    coordinators = entry.runtime_data.coordinators
+    hub = entry.runtime_data.hub
+    return {
+        "entry": {
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "theaters": [
+            {
+                "theater": coordinator.theater,
+                "coordinator": {
+                    "last_update_success": coordinator.last_update_success,
+                    # Com a atualização automática desligada não há intervalo
+                    "update_interval": coordinator.poll_interval.total_seconds(),
+                    "auto_update": coordinator.auto_update,
+                    "fetched_at": coordinator.fetched_at,
+                    "stale": coordinator.is_stale,
+                    "movies": len(coordinator.movies),
+                    "sessions": len(coordinator.sessions),
+                },
+                "refresh": coordinator.stats.as_dict(),
+                "fetches": coordinator.fetch_stats,
+            }
+            for coordinator in coordinators
+        ],
+        "library": hub.library.as_dict(),
+        "search": hub.search.as_dict(),
+        "transport": hub.transport.stats.as_dict(),
+        "rate_limit": hub.transport.hosts.limiter(API_HOST).as_dict(),
+    }
@@ -0,0 +1,79 @@
+"""Comparação incremental dos filmes em cartaz do Ingresso.com."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .models import SOURCE_FIELDS, Movie, decode_movie, movie_id
+
+
+@dataclass(slots=True)
+class MovieDiff:
+    """Filmes adicionados, removidos e alterados em uma atualização."""
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: dict[str, list[str]] = field(default_factory=dict)
+    titles: dict[str, str | None] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        """Retornar se houve alguma mudança."""
+        return bool(self.added or self.removed or self.changed)
+
+
+class MovieDiffer:
+    """Manter o último snapshot por filme e decodificar apenas o que mudou."""
+
+    def __init__(
+        self, decode: Callable[[dict[str, Any]], Movie] = decode_movie
+    ) -> None:
+        """Inicializar o comparador."""
+        self._decode = decode
+        self._sources: dict[str, dict[str, Any]] = {}
+        self._decoded: dict[str, Movie] = {}
+        self.movies: list[Movie] = []
+
+    @property
+    def by_id(self) -> dict[str, Movie]:
+        """Retornar os filmes decodificados pelo identificador."""
+        return self._decoded
+
+    def update(self, movies: list[dict[str, Any]]) -> MovieDiff:
+        """Aplicar a nova lista de filmes e retornar as diferenças."""
+        diff = MovieDiff()
+        sources: dict[str, dict[str, Any]] = {}
+        decoded: dict[str, Movie] = {}
+
+        for movie in movies or ():
+            key = movie_id(movie)
+            sources[key] = movie
+            previous = self._sources.get(key)
+
+            if previous is None:
+                diff.added.append(key)
+            elif previous is not movie and (
+                changes := [
+                    name
+                    for name in SOURCE_FIELDS
+                    if previous.get(name) != movie.get(name)
+                ]
+            ):
+                diff.changed[key] = changes
+            else:
+                decoded[key] = self._decoded[key]
+                continue
+
+            decoded[key] = self._decode(movie)
+            diff.titles[key] = decoded[key].title
+
+        for key, previous in self._sources.items():
+            if key not in sources:
+                diff.removed.append(key)
+                diff.titles[key] = previous.get("title")
+
+        self._sources = sources
+        self._decoded = decoded
+        self.movies = list(decoded.values())
+        return diff
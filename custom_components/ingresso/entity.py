@@ -1,28 +1,100 @@
-"""BlueprintEntity class."""
+"""Entidade base do Ingresso.com."""
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION
-from .coordinator import BlueprintDataUpdateCoordinator
+from .const import ATTRIBUTION, DOMAIN
+from .coordinator import IngressoDataUpdateCoordinator
+
+if TYPE_CHECKING:
+    from .data import IngressoConfigEntry
+    from .posters import IngressoPosterCache
 
 
-class IntegrationBlueprintEntity(CoordinatorEntity[BlueprintDataUpdateCoordinator]):
-    """BlueprintEntity class."""
+class IngressoEntity(CoordinatorEntity[IngressoDataUpdateCoordinator]):
+    """Entidade base ligada ao dispositivo do cinema."""
 
     _attr_attribution = ATTRIBUTION
+    _attr_has_entity_name = True
 
-    def __init__(self, coordinator: BlueprintDataUpdateCoordinator) -> None:
-        """Initialize."""
+    def __init__(self, coordinator: IngressoDataUpdateCoordinator) -> None:
+        """Inicializar a entidade."""
         super().__init__(coordinator)
-        self._attr_unique_id = coordinator.config_entry.entry_id
         self._attr_device_info = DeviceInfo(
-            identifiers={
-                (
-                    coordinator.config_entry.domain,
-                    coordinator.config_entry.entry_id,
-                ),
-            },
+            identifiers={(DOMAIN, coordinator.device_id)},
+            name=coordinator.device_name,
+            manufacturer="Ingresso.com",
+            model="Cinema",
+            sw_version="1.0",
+            configuration_url="https://ingresso.com",
         )
+
+    @property
+    def available(self) -> bool:
+        """Manter a entidade disponível enquanto houver dados, mesmo antigos."""
+        return self.coordinator.data is not None
+
+    @property
+    def posters(self) -> IngressoPosterCache | None:
+        """Retornar o cache de pôsteres, se a entrada servir pôsteres locais."""
+        return self.coordinator.config_entry.runtime_data.posters
+
+
+@callback
+def async_setup_movie_entities(
+    hass: HomeAssistant,
+    config_entry: IngressoConfigEntry,
+    coordinator: IngressoDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    platform: Platform,
+    kind: str,
+    factory: Callable[[IngressoDataUpdateCoordinator, str], Entity],
+    enabled: bool,
+) -> None:
+    """Manter uma entidade por filme de um cinema sincronizada com a programação.
+
+    Os ids únicos seguem o formato ``ingresso_<dispositivo>_<kind>_<filme>``,
+    o que permite reconhecer no registro as entidades de filmes que saíram
+    de cartaz, inclusive com o Home Assistant desligado ou o modo desativado.
+    """
+    registry = er.async_get(hass)
+    prefix = f"{DOMAIN}_{coordinator.device_id}_{kind}_"
+    tracked: set[str] = set()
+
+    @callback
+    def _async_sync_movies() -> None:
+        """Adicionar entidades de filmes novos e remover as que saíram de cartaz."""
+        if enabled and coordinator.data is None:
+            # Sem programação ainda (primeira inicialização, sem snapshot)
+            return
+        movies = coordinator.movies_by_id if enabled else {}
+        if added := movies.keys() - tracked:
+            tracked.update(added)
+            async_add_entities(factory(coordinator, key) for key in sorted(added))
+
+        # Só uma programação recém-obtida diz o que saiu de cartaz; a
+        # restaurada do disco pode estar desatualizada
+        if enabled and not coordinator.last_update_success:
+            return
+        for entry in er.async_entries_for_config_entry(registry, config_entry.entry_id):
+            if (
+                entry.domain == platform
+                and entry.unique_id.startswith(prefix)
+                and entry.unique_id.removeprefix(prefix) not in movies
+            ):
+                tracked.discard(entry.unique_id.removeprefix(prefix))
+                registry.async_remove(entry.entity_id)
+
+    _async_sync_movies()
+    if enabled:
+        config_entry.async_on_unload(coordinator.async_add_listener(_async_sync_movies))
@@ -0,0 +1,384 @@
+"""Hub compartilhado de buscas de filmes em cartaz do Ingresso.com."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .api import IngressoApiClient
+from .const import DATA_HUB, HUB_MAX_AGE, SERVICE_CACHE_TTL
+from .library import MovieLibrary
+from .limiter import PRIORITY_BACKGROUND
+from .search import MovieSearchIndex
+from .stats import FetchStats
+from .transport import async_get_transport
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+    from datetime import timedelta
+
+    from .sessions import Session
+    from .transport import IngressoTransport
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _movie_theater_ids(movie: dict[str, Any]) -> set[str] | None:
+    """Retornar os cinemas em que o filme está em cartaz, se informados."""
+    theaters = movie.get("theaters")
+    if theaters is None:
+        return None
+    return {
+        str(theater.get("id")) if isinstance(theater, dict) else str(theater)
+        for theater in theaters
+    }
+
+
+class _SharedFetch:
+    """Busca única (single-flight) que guarda o último resultado obtido."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        client: IngressoApiClient,
+        fetch: Callable[[int], Awaitable[Any]],
+    ) -> None:
+        """Inicializar a busca compartilhada."""
+        self._hass = hass
+        self._name = name
+        self._fetch = fetch
+        self._task: asyncio.Task | None = None
+        self.client = client
+        self.stats = FetchStats()
+        self.data: Any = None
+        self.fetched_at: float | None = None
+        # Separação por cinema, nas buscas de filmes
+        self.split: _TheaterSplit | None = None
+
+    def is_idle(self, since: float) -> bool:
+        """Retornar se a busca não está em andamento nem foi feita desde `since`."""
+        return (self._task is None or self._task.done()) and (
+            self.fetched_at is None or self.fetched_at < since
+        )
+
+    async def async_get(self, max_age: float, priority: int) -> Any:
+        """Retornar o resultado em cache ou aguardar a busca em andamento.
+
+        A busca entra no limitador de taxa com a prioridade de quem a iniciou.
+        """
+        if self.fetched_at is not None and monotonic() - self.fetched_at < max_age:
+            self.stats.hits += 1
+            return self.data
+        if self._task is None or self._task.done():
+            self.stats.misses += 1
+            self._task = self._hass.async_create_background_task(
+                self._async_fetch(priority), self._name
+            )
+        else:
+            self.stats.coalesced += 1
+        # Um chamador cancelado não deve cancelar a busca dos demais
+        return await asyncio.shield(self._task)
+
+    async def _async_fetch(self, priority: int) -> Any:
+        """Executar a busca e guardar o resultado."""
+        data = await self._fetch(priority)
+        self.data = data
+        self.fetched_at = monotonic()
+        return data
+
+
+class _TheaterSplit:
+    """Cinemas de cada filme de uma resposta, guardados fora do catálogo.
+
+    O catálogo compartilhado guarda só os metadados de cada filme; a lista
+    de cinemas muda entre respostas (cidade, cinemas filtrados) e fica aqui,
+    já separada por cinema durante a decodificação.
+    """
+
+    def __init__(self, library: MovieLibrary) -> None:
+        """Inicializar a separação."""
+        self._library = library
+        # None enquanto não soubermos se a resposta identifica os cinemas
+        self.tagged: bool | None = None
+        self.by_theater: dict[str, list[dict[str, Any]]] = {}
+        self._source: Any = None
+
+    async def async_fetch(
+        self, client: IngressoApiClient, priority: int
+    ) -> list[dict[str, Any]]:
+        """Buscar os filmes, separando-os por cinema se a resposta mudou."""
+        by_theater: dict[str, list[dict[str, Any]]] = {}
+        tagged = False
+
+        def project(item: Any) -> Any:
+            nonlocal tagged
+            shared = self._library.project(item)
+            if isinstance(item, dict) and (ids := _movie_theater_ids(item)) is not None:
+                tagged = True
+                for theater_id in ids:
+                    by_theater.setdefault(theater_id, []).append(shared)
+            return shared
+
+        movies = await client.async_get_movies(project, priority)
+        # Respostas 304 ou com o mesmo conteúdo devolvem a lista anterior
+        if movies is not self._source:
+            self._source = movies
+            self.tagged = tagged
+            self.by_theater = by_theater
+        return movies
+
+
+class _CityFetches:
+    """Buscas compartilhadas de uma chave (cidade, parceria)."""
+
+    def __init__(self) -> None:
+        """Inicializar o estado da cidade."""
+        self.city: _SharedFetch | None = None
+        self.theaters: dict[str, _SharedFetch] = {}
+        self.sessions: dict[str, _SharedFetch] = {}
+        # Cinemas seguidos pelas entradas carregadas; None é a cidade inteira
+        self.followed: Counter[str | None] = Counter()
+        # Cinemas seguidos, buscados juntos em uma requisição filtrada
+        self.group: tuple[str, ...] = ()
+        self.group_fetch: _SharedFetch | None = None
+
+    @property
+    def subscribers(self) -> int:
+        """Retornar quantos cinemas (ou cidades) as entradas seguem."""
+        return self.followed.total()
+
+    def update_group(self) -> None:
+        """Recalcular o grupo de cinemas após uma mudança nas entradas."""
+        group = tuple(sorted(theater for theater in self.followed if theater))
+        if len(group) < 2:
+            group = ()
+        if group != self.group:
+            self.group = group
+            self.group_fetch = None
+
+
+class IngressoFetchHub:
+    """Compartilhar as buscas de filmes entre as entradas de configuração.
+
+    Cada busca é feita no máximo uma vez por ciclo, com as chamadas
+    simultâneas aguardando a mesma requisição. A resposta da cidade inteira
+    só é usada pelos cinemas quando alguma entrada já a baixa; os cinemas
+    seguidos de uma cidade são buscados juntos, em uma requisição filtrada
+    por eles. As respostas que identificam os cinemas de cada filme são
+    separadas localmente; caso contrário, cada cinema é buscado uma única
+    vez por ciclo.
+    """
+
+    def __init__(self, hass: HomeAssistant, transport: IngressoTransport) -> None:
+        """Inicializar o hub."""
+        self._hass = hass
+        self.transport = transport
+        self._cities: dict[tuple[str, str], _CityFetches] = {}
+        # Filmes iguais de cidades e cinemas diferentes ocupam memória uma vez
+        self.library = MovieLibrary()
+        # Busca nos filmes de todas as entradas carregadas
+        self.search = MovieSearchIndex()
+
+    @callback
+    def async_subscribe(
+        self, city_id: str, partnership: str, theaters: Iterable[str | None]
+    ) -> CALLBACK_TYPE:
+        """Registrar os cinemas (ou a cidade, com None) seguidos por uma entrada."""
+        key = (str(city_id), partnership)
+        followed = Counter(str(theater) if theater else None for theater in theaters)
+        city = self._cities.setdefault(key, _CityFetches())
+        city.followed.update(followed)
+        city.update_group()
+        release = self.transport.async_acquire()
+
+        @callback
+        def _unsubscribe() -> None:
+            city = self._cities[key]
+            city.followed.subtract(followed)
+            city.followed = +city.followed
+            city.update_group()
+            if not city.subscribers:
+                del self._cities[key]
+            if not any(other.subscribers for other in self._cities.values()):
+                # Buscas criadas por serviços guardam a sessão que será
+                # fechada; as próximas são criadas com uma sessão nova
+                self._cities.clear()
+            release()
+
+        return _unsubscribe
+
+    async def async_get_movies(
+        self,
+        city_id: str,
+        partnership: str,
+        theater: str | None = None,
+        max_age: timedelta = HUB_MAX_AGE,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> list[dict[str, Any]]:
+        """Obter os filmes em cartaz da cidade ou de um cinema."""
+        key = (str(city_id), partnership)
+        city = self._city(key)
+        max_age_seconds = max_age.total_seconds()
+
+        if not theater:
+            return await self._city_fetch(city, key).async_get(
+                max_age_seconds, priority
+            )
+        theater = str(theater)
+
+        # A resposta completa da cidade é bem maior que a dos cinemas; ela só
+        # compensa quando uma entrada da cidade inteira já a baixa
+        if None in city.followed:
+            fetch = self._city_fetch(city, key)
+            if fetch.split.tagged is not False:
+                await fetch.async_get(max_age_seconds, priority)
+                if fetch.split.tagged:
+                    return fetch.split.by_theater.get(theater, [])
+                _LOGGER.debug(
+                    "Resposta da cidade %s não identifica os cinemas; "
+                    "buscando por cinema",
+                    city_id,
+                )
+
+        if theater in city.group:
+            if city.group_fetch is None:
+                city.group_fetch = self._shared_fetch(key, ",".join(city.group))
+            fetch = city.group_fetch
+            if fetch.split.tagged is not False:
+                await fetch.async_get(max_age_seconds, priority)
+                if fetch.split.tagged:
+                    return fetch.split.by_theater.get(theater, [])
+                _LOGGER.debug(
+                    "Resposta dos cinemas %s não identifica os cinemas; "
+                    "buscando por cinema",
+                    ",".join(city.group),
+                )
+
+        # Sem a identificação, cada cinema é buscado separadamente
+        return await self._theater_fetch(city, key, theater).async_get(
+            max_age_seconds, priority
+        )
+
+    def _city(self, key: tuple[str, str]) -> _CityFetches:
+        """Retornar as buscas de uma cidade, descartando as ociosas."""
+        self._prune()
+        return self._cities.setdefault(key, _CityFetches())
+
+    def _prune(self) -> None:
+        """Descartar as buscas que só serviços usaram e estão sem uso.
+
+        Serviços podem consultar qualquer cidade ou cinema; o que nenhuma
+        entrada segue é mantido só pelo tempo em que o serviço o reaproveita.
+        """
+        since = monotonic() - SERVICE_CACHE_TTL.total_seconds()
+        for key, city in list(self._cities.items()):
+            for fetches in (city.theaters, city.sessions):
+                for theater, fetch in list(fetches.items()):
+                    if theater not in city.followed and fetch.is_idle(since):
+                        del fetches[theater]
+            if (
+                city.city is not None
+                and None not in city.followed
+                and city.city.is_idle(since)
+            ):
+                city.city = None
+            if not (city.subscribers or city.city or city.theaters or city.sessions):
+                del self._cities[key]
+
+    def _city_fetch(self, city: _CityFetches, key: tuple[str, str]) -> _SharedFetch:
+        """Retornar a busca da cidade inteira."""
+        if city.city is None:
+            city.city = self._shared_fetch(key, None)
+        return city.city
+
+    def _theater_fetch(
+        self, city: _CityFetches, key: tuple[str, str], theater: str
+    ) -> _SharedFetch:
+        """Retornar a busca própria de um cinema."""
+        if (fetch := city.theaters.get(str(theater))) is None:
+            fetch = city.theaters[str(theater)] = self._shared_fetch(key, theater)
+        return fetch
+
+    async def async_get_sessions(
+        self,
+        city_id: str,
+        partnership: str,
+        theater: str,
+        max_age: timedelta = HUB_MAX_AGE,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> list[tuple[str | None, list[Session]]]:
+        """Obter as sessões de um cinema, agrupadas por dia."""
+        key = (str(city_id), partnership)
+        city = self._city(key)
+        if (fetch := city.sessions.get(str(theater))) is None:
+            fetch = city.sessions[str(theater)] = self._shared_fetch(
+                key, theater, sessions=True
+            )
+        return await fetch.async_get(max_age.total_seconds(), priority)
+
+    def _shared_fetch(
+        self, key: tuple[str, str], theater: str | None, sessions: bool = False
+    ) -> _SharedFetch:
+        """Criar a busca compartilhada de uma cidade ou de um cinema."""
+        client = IngressoApiClient(
+            city_id=key[0],
+            partnership=key[1],
+            session=self.transport.session,
+            theater=theater,
+            hosts=self.transport.hosts,
+        )
+        if sessions:
+            return _SharedFetch(
+                self._hass,
+                f"ingresso_sessions_{key[0]}_{key[1]}_{theater}",
+                client,
+                client.async_get_sessions,
+            )
+        split = _TheaterSplit(self.library)
+        fetch = _SharedFetch(
+            self._hass,
+            f"ingresso_fetch_{key[0]}_{key[1]}_{theater or 'all'}",
+            client,
+            lambda priority: split.async_fetch(client, priority),
+        )
+        fetch.split = split
+        return fetch
+
+    @callback
+    def async_fetch_stats(
+        self,
+        city_id: str,
+        partnership: str,
+        theater: str | None = None,
+    ) -> dict[str, Any]:
+        """Retornar os contadores das buscas usadas por uma entrada."""
+        if (city := self._cities.get((str(city_id), partnership))) is None:
+            return {}
+        fetches = {"city": city.city}
+        if theater and str(theater) in city.group:
+            fetches["group"] = city.group_fetch
+        if theater:
+            fetches["theater"] = city.theaters.get(str(theater))
+            fetches["sessions"] = city.sessions.get(str(theater))
+        return {
+            name: {
+                "cache": fetch.stats.as_dict(),
+                "requests": fetch.client.stats.as_dict(),
+            }
+            for name, fetch in fetches.items()
+            if fetch is not None
+        }
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> IngressoFetchHub:
+    """Retornar o hub compartilhado, criando-o se necessário."""
+    if (hub := hass.data.get(DATA_HUB)) is None:
+        hub = hass.data[DATA_HUB] = IngressoFetchHub(hass, async_get_transport(hass))
+    return hub
@@ -0,0 +1,77 @@
+"""Support for Ingresso.com movie posters."""
+
+from __future__ import annotations
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt
+
+from .const import CONF_LOCAL_POSTERS, DOMAIN
+from .coordinator import IngressoDataUpdateCoordinator
+from .data import IngressoConfigEntry
+from .entity import IngressoEntity, async_setup_movie_entities
+from .posters import POSTER_CONTENT_TYPE
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: IngressoConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up one poster image per movie."""
+    for coordinator in config_entry.runtime_data.coordinators:
+        async_setup_movie_entities(
+            hass,
+            config_entry,
+            coordinator,
+            async_add_entities,
+            Platform.IMAGE,
+            "poster",
+            IngressoPosterImage,
+            enabled=config_entry.options.get(CONF_LOCAL_POSTERS, False),
+        )
+
+
+class IngressoPosterImage(IngressoEntity, ImageEntity):
+    """Poster of a movie, served from the local poster cache.
+
+    The poster is downloaded and resized once; dashboards then load it from
+    Home Assistant instead of the CDN, also while the API is unreachable.
+    """
+
+    _attr_content_type = POSTER_CONTENT_TYPE
+
+    def __init__(self, coordinator: IngressoDataUpdateCoordinator, key: str) -> None:
+        """Initialize the image."""
+        super().__init__(coordinator)
+        ImageEntity.__init__(self, coordinator.hass)
+        self._key = key
+        movie = coordinator.movies_by_id[key]
+        self._url = movie.poster
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.device_id}_poster_{key}"
+        self._attr_name = movie.title
+        self._attr_image_last_updated = dt.utcnow()
+
+    @property
+    def available(self) -> bool:
+        """Return True while the movie is in the listings."""
+        return super().available and self._key in self.coordinator.movies_by_id
+
+    async def async_image(self) -> bytes | None:
+        """Return the cached poster, downloading it on first use."""
+        if (posters := self.posters) is None:
+            return None
+        return await posters.async_get(self._url)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the poster of this movie changed."""
+        if (movie := self.coordinator.movies_by_id.get(self._key)) is None:
+            # Removed from the listings; the platform removes the entity
+            return
+        if movie.poster != self._url:
+            self._url = movie.poster
+            self._attr_image_last_updated = dt.utcnow()
+            self.async_write_ha_state()
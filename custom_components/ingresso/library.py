@@ -0,0 +1,79 @@
+"""Catálogo de filmes compartilhado entre os cinemas do Ingresso.com."""
+
+from __future__ import annotations
+
+from typing import Any
+from weakref import WeakValueDictionary
+
+from .models import Movie, decode_movie, movie_id, project_movie
+
+
+class _SharedItem(dict):
+    """Filme projetado da API, único para todas as respostas que o trazem."""
+
+    __slots__ = ("__weakref__", "movie")
+
+    def __init__(self, item: dict[str, Any]) -> None:
+        """Copiar o filme projetado."""
+        super().__init__(item)
+        self.movie: Movie | None = None
+
+
+def _freeze(value: Any) -> Any:
+    """Converter um valor decodificado do JSON em uma chave imutável."""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class MovieLibrary:
+    """Filmes em cartaz guardados uma única vez para todas as entradas.
+
+    Cada resposta da API passa a referenciar o mesmo objeto para um filme
+    idêntico, com o filme decodificado junto dele; as listas de cada cinema
+    guardam apenas referências. O catálogo mantém referências fracas, então
+    um filme é descartado assim que nenhuma resposta em cache, snapshot ou
+    entrada o usa mais.
+    """
+
+    def __init__(self) -> None:
+        """Inicializar o catálogo."""
+        self._items: WeakValueDictionary[Any, _SharedItem] = WeakValueDictionary()
+        # Listas de gêneros iguais entre filmes ocupam memória uma vez
+        self._genres: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        """Retornar quantas versões de filmes estão em uso."""
+        return len(self._items)
+
+    def project(self, item: Any) -> Any:
+        """Projetar um filme da API e retornar a cópia compartilhada."""
+        projected = project_movie(item)
+        if not isinstance(projected, dict):
+            return projected
+        # Os cinemas variam entre respostas e ficam nas listas de cada cinema;
+        # o filme compartilhado é só o id e os campos de SOURCE_FIELDS
+        projected.pop("theaters", None)
+        key = _freeze(projected)
+        if (shared := self._items.get(key)) is None:
+            shared = self._items[key] = _SharedItem(projected)
+        return shared
+
+    def movie(self, item: dict[str, Any]) -> Movie:
+        """Retornar o filme decodificado, compartilhado quando possível."""
+        if not isinstance(item, _SharedItem):
+            return decode_movie(item, self._genres)
+        if item.movie is None:
+            item.movie = decode_movie(item, self._genres)
+        return item.movie
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializar o tamanho do catálogo."""
+        items = list(self._items.values())
+        return {
+            "items": len(items),
+            "movies": len({movie_id(item) for item in items}),
+            "decoded": sum(item.movie is not None for item in items),
+        }
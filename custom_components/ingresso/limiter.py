@@ -0,0 +1,130 @@
+"""Limite de taxa das requisições à API do Ingresso.com."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from time import monotonic
+from typing import Any
+
+from .stats import LimiterStats
+
+# Filas de prioridade, da mais urgente para a menos urgente
+PRIORITY_INTERACTIVE = 0
+PRIORITY_SERVICE = 1
+PRIORITY_BACKGROUND = 2
+PRIORITY_NAMES = ("interactive", "service", "background")
+
+
+class RateLimiter:
+    """Balde de fichas (token bucket) com filas de prioridade.
+
+    Até `burst` requisições saem de imediato; depois disso, uma ficha é
+    reposta a cada 1/`rate` segundos e entregue à requisição mais antiga da
+    fila mais prioritária. Assim as telas de configuração nunca esperam
+    atrás das atualizações periódicas de várias entradas.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Inicializar o limitador."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._queues: tuple[deque[asyncio.Future[None]], ...] = tuple(
+            deque() for _ in PRIORITY_NAMES
+        )
+        self._timer: asyncio.TimerHandle | None = None
+        self.stats = LimiterStats()
+
+    @property
+    def queued(self) -> int:
+        """Retornar quantas requisições aguardam uma ficha."""
+        return sum(self._depth(queue) for queue in self._queues)
+
+    def configure(self, rate: float, burst: int) -> None:
+        """Alterar a taxa e a rajada, mantendo as requisições na fila."""
+        self._refill()
+        self.rate = rate
+        self.burst = burst
+        self._tokens = min(self._tokens, burst)
+        if self._timer is not None:
+            # A próxima ficha chega em outro momento com a nova taxa
+            self._timer.cancel()
+            self._timer = None
+            self._schedule()
+
+    async def acquire(self, priority: int = PRIORITY_BACKGROUND) -> None:
+        """Aguardar a vez de uma requisição."""
+        started = monotonic()
+        self._refill()
+        if self._tokens >= 1 and not self.queued:
+            self._tokens -= 1
+            self.stats.record(priority, 0.0)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._queues[priority].append(future)
+        self._schedule()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # A ficha chegou junto com o cancelamento; devolvê-la
+                self._tokens = min(self.burst, self._tokens + 1)
+                self._release()
+            raise
+        self.stats.record(priority, monotonic() - started)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializar a configuração, as filas e os contadores."""
+        self._refill()
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "queued": {
+                name: self._depth(queue)
+                for name, queue in zip(PRIORITY_NAMES, self._queues, strict=True)
+            },
+            **self.stats.as_dict(),
+            "granted": dict(zip(PRIORITY_NAMES, self.stats.granted, strict=True)),
+        }
+
+    @staticmethod
+    def _depth(queue: deque[asyncio.Future[None]]) -> int:
+        """Contar as requisições ainda à espera em uma fila."""
+        return sum(not future.done() for future in queue)
+
+    def _refill(self) -> None:
+        """Repor as fichas acumuladas desde a última consulta."""
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _schedule(self) -> None:
+        """Agendar a entrega da próxima ficha."""
+        if self._timer is None:
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        """Entregar as fichas disponíveis às filas, por prioridade."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._refill()
+        while self._tokens >= 1 and (future := self._next()) is not None:
+            self._tokens -= 1
+            future.set_result(None)
+        if self.queued:
+            self._schedule()
+
+    def _next(self) -> asyncio.Future[None] | None:
+        """Retirar a próxima requisição à espera, da fila mais prioritária."""
+        for queue in self._queues:
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    return future
+        return None
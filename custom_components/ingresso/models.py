@@ -0,0 +1,208 @@
+"""Modelo compacto dos filmes do Ingresso.com."""
+
+from __future__ import annotations
+
+import unicodedata
+from sys import intern
+from typing import Any
+
+from .const import DEFAULT_POSTER, GENRES_CACHE_SIZE
+
+NOT_INFORMED = "Não informado"
+
+# Campos da API usados pelo modelo; mudanças em outros campos são ignoradas
+SOURCE_FIELDS = (
+    "title",
+    "images",
+    "synopsis",
+    "director",
+    "cast",
+    "distributor",
+    "genres",
+    "duration",
+    "contentRating",
+    "premiereDate",
+    "siteURL",
+)
+# Campos mantidos de cada filme ao decodificar a resposta da API
+PROJECTED_FIELDS = (*SOURCE_FIELDS, "id", "urlKey", "theaters")
+
+
+def _intern(value: Any) -> Any:
+    """Internar textos curtos que se repetem entre filmes."""
+    if isinstance(value, str):
+        return intern(value)
+    return value
+
+
+def _genres(value: Any, shared: dict[tuple[str, ...], tuple[str, ...]] | None) -> Any:
+    """Converter a lista de gêneros em uma tupla de textos.
+
+    Com `shared`, listas iguais usam a mesma tupla; a tabela recomeça ao
+    atingir GENRES_CACHE_SIZE, sem afetar os filmes já decodificados.
+    """
+    if not isinstance(value, list):
+        return _intern(value)
+    genres = tuple(
+        intern(genre if isinstance(genre, str) else str(genre)) for genre in value
+    )
+    if shared is None:
+        return genres
+    if (existing := shared.get(genres)) is not None:
+        return existing
+    if len(shared) >= GENRES_CACHE_SIZE:
+        shared.clear()
+    shared[genres] = genres
+    return genres
+
+
+def _poster(images: Any) -> str:
+    """Retornar a URL do primeiro pôster, ou o pôster padrão."""
+    if images and isinstance(images, list) and isinstance(images[0], dict):
+        if (url := images[0].get("url")) and isinstance(url, str):
+            return url
+    return DEFAULT_POSTER
+
+
+def normalize_text(value: str) -> str:
+    """Normalizar um texto para buscas, sem acentos e sem caixa."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold()
+
+
+def movie_id(item: dict[str, Any]) -> str:
+    """Retornar o identificador estável de um filme da API."""
+    return str(item.get("id") or item.get("urlKey") or item.get("title"))
+
+
+def project_movie(item: Any) -> Any:
+    """Manter de um filme da API apenas o que a integração usa."""
+    if not isinstance(item, dict):
+        return item
+    projected = {key: item[key] for key in PROJECTED_FIELDS if key in item}
+    # Das listas e objetos aninhados bastam o primeiro pôster, a data e os ids
+    if (images := item.get("images")) and isinstance(images[0], dict):
+        projected["images"] = [{"url": images[0].get("url")}]
+    if isinstance(premiere := item.get("premiereDate"), dict):
+        projected["premiereDate"] = {"localDate": premiere.get("localDate")}
+    if isinstance(theaters := item.get("theaters"), list):
+        projected["theaters"] = [
+            {"id": theater.get("id")} if isinstance(theater, dict) else theater
+            for theater in theaters
+        ]
+    return projected
+
+
+class Movie:
+    """Filme em cartaz com apenas os campos exibidos pela integração."""
+
+    __slots__ = (
+        "airdate",
+        "cast",
+        "director",
+        "genres",
+        "id",
+        "poster",
+        "rating",
+        "runtime",
+        "studio",
+        "synopsis",
+        "ticket",
+        "title",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        poster: str,
+        synopsis: str,
+        director: str,
+        cast: str,
+        studio: str,
+        genres: Any,
+        runtime: Any,
+        rating: str,
+        airdate: str,
+        ticket: str,
+    ) -> None:
+        """Inicializar o filme."""
+        self.id = id
+        self.title = title
+        self.poster = poster
+        self.synopsis = synopsis
+        self.director = director
+        self.cast = cast
+        self.studio = studio
+        self.genres = genres
+        self.runtime = runtime
+        self.rating = rating
+        self.airdate = airdate
+        self.ticket = ticket
+
+    def __repr__(self) -> str:
+        """Representar o filme."""
+        return f"Movie({self.id!r}, {self.title!r})"
+
+    def as_dict(
+        self, city: str | None = None, theater: str | None = None
+    ) -> dict[str, Any]:
+        """Serializar o filme no formato dos atributos da integração."""
+        data = {
+            "title": self.title,
+            "poster": self.poster,
+            "synopsis": self.synopsis,
+            "director": self.director,
+            "cast": self.cast,
+            "studio": self.studio,
+            "genres": self.genres,
+            "runtime": self.runtime,
+            "rating": self.rating,
+            "release": "$date",
+            "airdate": self.airdate,
+        }
+        if city is not None:
+            data["city"] = city
+            data["theater"] = theater
+        data["ticket"] = self.ticket
+        return data
+
+    def as_summary(self) -> dict[str, Any]:
+        """Serializar apenas os campos leves usados nos cartões."""
+        return {
+            "title": self.title,
+            "studio": self.studio,
+            "runtime": self.runtime,
+            "rating": self.rating,
+            "release": "$date",
+            "airdate": self.airdate,
+        }
+
+
+def decode_movie(
+    item: dict[str, Any],
+    genres: dict[tuple[str, ...], tuple[str, ...]] | None = None,
+) -> Movie:
+    """Decodificar um filme da API.
+
+    `genres` é a tabela de listas de gêneros compartilhadas, se houver.
+    """
+    premiere = item.get("premiereDate")
+    return Movie(
+        id=movie_id(item),
+        title=item.get("title", NOT_INFORMED),
+        poster=_poster(item.get("images")),
+        synopsis=item.get("synopsis", NOT_INFORMED),
+        director=_intern(item.get("director", NOT_INFORMED)),
+        cast=item.get("cast", NOT_INFORMED),
+        studio=_intern(item.get("distributor", NOT_INFORMED)),
+        genres=_genres(item.get("genres", NOT_INFORMED), genres),
+        runtime=_intern(item.get("duration", NOT_INFORMED)),
+        rating=_intern(item.get("contentRating", NOT_INFORMED)),
+        airdate=intern(premiere["localDate"].split("T")[0])
+        if premiere and premiere.get("localDate")
+        else NOT_INFORMED,
+        ticket=item.get("siteURL", NOT_INFORMED),
+    )
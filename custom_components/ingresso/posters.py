@@ -0,0 +1,280 @@
+"""Cache local dos pôsteres dos filmes do Ingresso.com."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import io
+import logging
+import secrets
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from PIL import Image, UnidentifiedImageError
+
+from .const import (
+    DATA_POSTERS,
+    DOMAIN,
+    POSTER_CACHE_BUDGET,
+    POSTER_SIZE,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+POSTER_TIMEOUT = 20
+POSTER_CONTENT_TYPE = "image/jpeg"
+POSTER_PATH = f"/api/{DOMAIN}/posters"
+# Pôsteres registrados e ainda não baixados mantidos em memória
+POSTER_PENDING_LIMIT = 512
+POSTER_DOWNLOADS = 4
+
+
+def _prepare_directory(directory: Path, renamed: dict[str, str]) -> None:
+    """Criar o diretório, renomear os arquivos e apagar os que sobraram."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for old_key, key in renamed.items():
+        if old_key != key:
+            with contextlib.suppress(FileNotFoundError):
+                (directory / f"{old_key}.jpg").replace(directory / f"{key}.jpg")
+    keep = set(renamed.values())
+    for path in directory.glob("*.jpg"):
+        if path.stem not in keep:
+            path.unlink(missing_ok=True)
+
+
+def _thumbnail(data: bytes) -> bytes:
+    """Reduzir o pôster ao tamanho exibido, fora do loop de eventos."""
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail(POSTER_SIZE)
+            output = io.BytesIO()
+            image.convert("RGB").save(output, "JPEG", quality=85, optimize=True)
+    except (OSError, UnidentifiedImageError) as err:
+        _LOGGER.debug("Pôster mantido no tamanho original: %s", err)
+        return data
+    return output.getvalue()
+
+
+class IngressoPosterCache:
+    """Pôsteres baixados uma única vez, reduzidos e guardados em disco.
+
+    O índice guarda a URL e o tamanho de cada arquivo na ordem de uso;
+    quando o total passa do orçamento, os menos usados são apagados. Os
+    pôsteres ainda não baixados ficam fora dele, só em memória e em número
+    limitado. As chaves são derivadas da URL com um segredo da instalação,
+    então não podem ser adivinhadas a partir dela.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: aiohttp.ClientSession,
+        directory: Path,
+        budget: int = POSTER_CACHE_BUDGET,
+    ) -> None:
+        """Inicializar o cache."""
+        self._hass = hass
+        self._session = session
+        self._directory = directory
+        self._budget = budget
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.posters"
+        )
+        self._secret = b""
+        # chave -> (url, bytes em disco), dos pôsteres já baixados
+        self._index: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        # chave -> url, dos pôsteres registrados e ainda não baixados
+        self._urls: OrderedDict[str, str] = OrderedDict()
+        self._total = 0
+        self._pending: dict[str, asyncio.Task[bytes | None]] = {}
+        self._downloads = asyncio.Semaphore(POSTER_DOWNLOADS)
+
+    async def async_load(self) -> None:
+        """Carregar o índice salvo e apagar os arquivos que ficaram fora dele."""
+        stored = await self._store.async_load()
+        if isinstance(stored, dict):
+            self._secret = bytes.fromhex(stored["secret"])
+            entries = stored["posters"]
+        else:
+            # Versões anteriores guardavam uma lista, com chaves tiradas só da
+            # URL; os arquivos são renomeados para as chaves novas
+            self._secret = secrets.token_bytes(16)
+            entries = stored or ()
+        renamed: dict[str, str] = {}
+        for old_key, url, size in entries:
+            # Versões anteriores também guardavam pôsteres nunca baixados
+            if size is not None:
+                key = self.key(url)
+                renamed[old_key] = key
+                self._index[key] = (url, size)
+                self._total += size
+        await self._hass.async_add_executor_job(
+            _prepare_directory, self._directory, renamed
+        )
+        if not isinstance(stored, dict):
+            self._async_schedule_save()
+
+    def key(self, url: str) -> str:
+        """Retornar a chave do pôster de uma URL."""
+        return hashlib.blake2b(
+            url.encode(), key=self._secret, digest_size=16
+        ).hexdigest()
+
+    def local_url(self, url: str) -> str:
+        """Registrar o pôster e retornar o endereço servido pelo Home Assistant.
+
+        O pôster é baixado em segundo plano; até lá, o endereço redireciona
+        para a URL original.
+        """
+        key = self.key(url)
+        if key not in self._index:
+            self._urls[key] = url
+            self._urls.move_to_end(key)
+            if len(self._urls) > POSTER_PENDING_LIMIT:
+                self._urls.popitem(last=False)
+            self._async_download_once(key, url)
+        return f"{POSTER_PATH}/{key}"
+
+    def source_url(self, key: str) -> str | None:
+        """Retornar a URL original de um pôster registrado e ainda não baixado."""
+        return self._urls.get(key)
+
+    async def async_get(self, url: str) -> bytes | None:
+        """Retornar o pôster reduzido, baixando-o na primeira vez."""
+        key = self.key(url)
+        if (data := await self.async_get_cached(key)) is not None:
+            return data
+        # Chamadas simultâneas pelo mesmo pôster aguardam o mesmo download
+        return await asyncio.shield(self._async_download_once(key, url))
+
+    async def async_get_cached(self, key: str) -> bytes | None:
+        """Retornar um pôster já baixado, sem baixar nada."""
+        if key not in self._index:
+            return None
+        self._index.move_to_end(key)
+        self._async_schedule_save()
+        path = self._directory / f"{key}.jpg"
+        try:
+            return await self._hass.async_add_executor_job(path.read_bytes)
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+
+    def _async_download_once(self, key: str, url: str) -> asyncio.Task[bytes | None]:
+        """Iniciar o download de um pôster, se ainda não estiver em andamento."""
+        if (task := self._pending.get(key)) is None:
+            task = self._pending[key] = self._hass.async_create_background_task(
+                self._async_download(key, url), f"{DOMAIN}_poster_{key}"
+            )
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return task
+
+    async def _async_download(self, key: str, url: str) -> bytes | None:
+        """Baixar, reduzir e gravar um pôster."""
+        try:
+            async with (
+                self._downloads,
+                self._session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=POSTER_TIMEOUT)
+                ) as response,
+            ):
+                response.raise_for_status()
+                original = await response.read()
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Erro ao baixar o pôster %s: %s", url, err)
+            return None
+
+        data = await self._hass.async_add_executor_job(_thumbnail, original)
+        path = self._directory / f"{key}.jpg"
+        await self._hass.async_add_executor_job(path.write_bytes, data)
+
+        self._urls.pop(key, None)
+        self._forget(key)
+        self._index[key] = (url, len(data))
+        self._total += len(data)
+        await self._async_evict()
+        self._async_schedule_save()
+        return data
+
+    def _forget(self, key: str) -> None:
+        """Remover uma chave do índice e do total."""
+        if (entry := self._index.pop(key, None)) is not None:
+            self._total -= entry[1]
+
+    async def _async_evict(self) -> None:
+        """Apagar os pôsteres menos usados até caber no orçamento."""
+        removed = []
+        for key in list(self._index):
+            if self._total <= self._budget:
+                break
+            self._forget(key)
+            removed.append(self._directory / f"{key}.jpg")
+        if removed:
+            _LOGGER.debug("Removendo %s pôsteres do cache", len(removed))
+            await self._hass.async_add_executor_job(
+                lambda: [path.unlink(missing_ok=True) for path in removed]
+            )
+
+    def _async_schedule_save(self) -> None:
+        """Agendar a gravação do índice em disco."""
+        self._store.async_delay_save(
+            lambda: {
+                "secret": self._secret.hex(),
+                "posters": [
+                    [key, url, size] for key, (url, size) in self._index.items()
+                ],
+            },
+            SNAPSHOT_SAVE_DELAY,
+        )
+
+
+class IngressoPosterView(HomeAssistantView):
+    """Servir os pôsteres em cache para os cartões do painel."""
+
+    url = f"{POSTER_PATH}/{{key}}"
+    name = f"api:{DOMAIN}:posters"
+    # Os cartões carregam as imagens sem autenticação; a view só lê pôsteres
+    # já baixados, com chaves que não podem ser adivinhadas, e nunca inicia
+    # um download ou grava em disco
+    requires_auth = False
+
+    def __init__(self, cache: IngressoPosterCache) -> None:
+        """Inicializar a view."""
+        self._cache = cache
+
+    async def get(self, request: web.Request, key: str) -> web.Response:
+        """Retornar um pôster."""
+        if (data := await self._cache.async_get_cached(key)) is None:
+            if (url := self._cache.source_url(key)) is not None:
+                raise web.HTTPFound(url)
+            raise web.HTTPNotFound
+        return web.Response(
+            body=data,
+            content_type=POSTER_CONTENT_TYPE,
+            headers={"Cache-Control": "public, max-age=604800, immutable"},
+        )
+
+
+async def async_get_poster_cache(hass: HomeAssistant) -> IngressoPosterCache:
+    """Retornar o cache de pôsteres compartilhado, criando-o na primeira chamada."""
+    if (cache := hass.data.get(DATA_POSTERS)) is None:
+        cache = hass.data[DATA_POSTERS] = IngressoPosterCache(
+            hass,
+            async_get_clientsession(hass),
+            Path(hass.config.path(STORAGE_DIR, f"{DOMAIN}_posters")),
+        )
+        await cache.async_load()
+        hass.http.register_view(IngressoPosterView(cache))
+    return cache
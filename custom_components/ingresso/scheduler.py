@@ -0,0 +1,161 @@
+"""Agendamento adaptativo das atualizações do Ingresso.com."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, time, timedelta
+from typing import Any
+
+from .const import MAX_UPDATE_INTERVAL, MIN_UPDATE_INTERVAL, UPDATE_INTERVAL
+
+HOURS_PER_WEEK = 7 * 24
+# Semanas observadas por hora; depois disso as contagens são reduzidas à
+# metade, para que mudanças de horário sejam aprendidas
+LEARNING_WEEKS = 8
+# Fração das semanas com mudança a partir da qual uma hora é considerada ativa
+ACTIVE_THRESHOLD = 0.2
+JITTER = 0.1
+
+
+def _hour_of_week(moment: datetime) -> int:
+    """Retornar a hora da semana (0 a 167) de um instante."""
+    return moment.weekday() * 24 + moment.hour
+
+
+def _week(moment: datetime) -> int:
+    """Retornar o número da semana (de segunda a domingo) de um instante."""
+    return (moment.toordinal() - 1) // 7
+
+
+class AdaptivePollScheduler:
+    """Aprender em que horas da semana o conteúdo muda e ajustar o intervalo.
+
+    Cada hora da semana conta em quantas semanas foi observada e em quantas
+    houve mudança, uma vez por semana: as várias atualizações sem mudança
+    de uma mesma hora não apagam a mudança vista nela. Perto das horas ativas o intervalo é o mínimo; fora delas ele dobra a cada
+    par de atualizações sem mudança, até o máximo, sem passar da próxima
+    hora ativa. Durante o horário silencioso não há atualizações.
+    """
+
+    def __init__(
+        self, quiet_start: time | None = None, quiet_end: time | None = None
+    ) -> None:
+        """Inicializar o agendador."""
+        self._quiet_start = quiet_start
+        self._quiet_end = quiet_end
+        # Semanas observadas e semanas com mudança de cada hora da semana
+        self._observed = [0.0] * HOURS_PER_WEEK
+        self._changed = [0.0] * HOURS_PER_WEEK
+        # Última semana contada em cada lista, para contar uma vez por semana
+        self._observed_week = [-1] * HOURS_PER_WEEK
+        self._changed_week = [-1] * HOURS_PER_WEEK
+        self._unchanged = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializar o que foi aprendido."""
+        return {
+            "observed": self._observed,
+            "changed": self._changed,
+            "observed_week": self._observed_week,
+            "changed_week": self._changed_week,
+            "unchanged": self._unchanged,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restaurar o que foi aprendido."""
+        # Snapshots antigos guardam médias móveis ("rates") e são descartados
+        if len(data.get("observed", ())) == HOURS_PER_WEEK:
+            self._observed = list(data["observed"])
+            self._changed = list(data["changed"])
+            self._observed_week = list(data["observed_week"])
+            self._changed_week = list(data["changed_week"])
+        self._unchanged = data.get("unchanged", 0)
+
+    def record(self, moment: datetime, changed: bool) -> None:
+        """Registrar se o conteúdo mudou na atualização feita no instante."""
+        hour = _hour_of_week(moment)
+        week = _week(moment)
+        if self._observed_week[hour] != week:
+            self._observed_week[hour] = week
+            if self._observed[hour] >= LEARNING_WEEKS:
+                self._observed[hour] /= 2
+                self._changed[hour] /= 2
+            self._observed[hour] += 1
+        if changed and self._changed_week[hour] != week:
+            self._changed_week[hour] = week
+            self._changed[hour] += 1
+        self._unchanged = 0 if changed else self._unchanged + 1
+
+    def next_interval(self, now: datetime) -> timedelta:
+        """Retornar o intervalo até a próxima atualização."""
+        if (quiet := self._time_until_quiet_end(now)) is not None:
+            # Espalhadas só depois do fim, para não cair no horário silencioso
+            return quiet + MIN_UPDATE_INTERVAL * random.uniform(0, JITTER)
+        if self._is_active(_hour_of_week(now)):
+            interval = MIN_UPDATE_INTERVAL
+        else:
+            interval = min(
+                UPDATE_INTERVAL * 2 ** min(self._unchanged // 2, 8),
+                MAX_UPDATE_INTERVAL,
+                max(self._time_until_active(now), MIN_UPDATE_INTERVAL),
+            )
+        # Espalhar as atualizações para não coincidirem entre entradas
+        interval *= random.uniform(1 - JITTER, 1 + JITTER)
+        # A última atualização antes do horário silencioso é no seu início
+        if (until_quiet := self._time_until_quiet_start(now)) is not None:
+            interval = min(interval, until_quiet)
+        return interval
+
+    def _rate(self, hour: int) -> float:
+        """Retornar a fração das semanas observadas com mudança na hora."""
+        if not (observed := self._observed[hour % HOURS_PER_WEEK]):
+            return 0.0
+        return self._changed[hour % HOURS_PER_WEEK] / observed
+
+    def _is_active(self, hour: int) -> bool:
+        """Retornar se a hora (ou a seguinte) costuma ter mudanças."""
+        return (
+            self._rate(hour) >= ACTIVE_THRESHOLD
+            or self._rate(hour + 1) >= ACTIVE_THRESHOLD
+        )
+
+    def _time_until_active(self, now: datetime) -> timedelta:
+        """Retornar o tempo até a próxima hora ativa da semana."""
+        start = now.replace(minute=0, second=0, microsecond=0)
+        hour = _hour_of_week(now)
+        for offset in range(1, HOURS_PER_WEEK + 1):
+            if self._rate(hour + offset) >= ACTIVE_THRESHOLD:
+                # Acordar uma hora antes, quando _is_active já vale
+                return start + timedelta(hours=offset - 1) - now
+        return MAX_UPDATE_INTERVAL
+
+    def _time_until_quiet_start(self, now: datetime) -> timedelta | None:
+        """Retornar o tempo até o próximo início do horário silencioso."""
+        if (
+            self._quiet_start is None
+            or self._quiet_end is None
+            or self._quiet_start == self._quiet_end
+        ):
+            return None
+        start_at = datetime.combine(now.date(), self._quiet_start, now.tzinfo)
+        if start_at <= now:
+            start_at += timedelta(days=1)
+        return start_at - now
+
+    def _time_until_quiet_end(self, now: datetime) -> timedelta | None:
+        """Retornar o tempo até o fim do horário silencioso, se estiver nele."""
+        if self._quiet_start is None or self._quiet_end is None:
+            return None
+        current = now.time()
+        start, end = self._quiet_start, self._quiet_end
+        if start <= end:
+            quiet = start <= current < end
+        else:
+            # Horário que atravessa a meia-noite, como 23:00 a 07:00
+            quiet = current >= start or current < end
+        if not quiet:
+            return None
+        end_at = datetime.combine(now.date(), end, now.tzinfo)
+        if end_at <= now:
+            end_at += timedelta(days=1)
+        return end_at - now
@@ -0,0 +1,160 @@
+"""Índice de busca dos filmes em cartaz do Ingresso.com."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Hashable
+from typing import Any
+
+from .models import Movie, normalize_text
+
+# Campos indexados de cada filme, na ordem usada pela busca livre
+SEARCH_FIELDS = ("title", "genres", "cast", "director", "rating")
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(value: Any) -> set[str]:
+    """Separar um texto (ou lista de textos) em termos normalizados."""
+    if isinstance(value, (list, tuple)):
+        return set().union(*(tokenize(item) for item in value))
+    if not isinstance(value, str):
+        return set()
+    return set(_TOKEN.findall(normalize_text(value)))
+
+
+class MovieSearchIndex:
+    """Índice invertido dos filmes de todas as entradas carregadas.
+
+    Cada termo normalizado de um campo aponta para os filmes que o contêm, e
+    cada filme para os cinemas que o exibem. As atualizações comparam os
+    filmes pelo objeto, então apenas os filmes novos ou alterados são
+    reindexados; uma busca é só a interseção de alguns conjuntos.
+    """
+
+    def __init__(self) -> None:
+        """Inicializar o índice."""
+        self._postings: dict[str, dict[str, set[str]]] = {
+            name: {} for name in SEARCH_FIELDS
+        }
+        # Filme indexado e os termos de cada campo, para removê-lo depois
+        self._movies: dict[str, tuple[Movie, dict[str, set[str]]]] = {}
+        self._showing: dict[str, set[Hashable]] = {}
+        self._sources: dict[Hashable, dict[str, Movie]] = {}
+        self._labels: dict[Hashable, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        """Retornar quantos filmes estão indexados."""
+        return len(self._movies)
+
+    def update(self, source: Hashable, movies: dict[str, Movie], **label: Any) -> None:
+        """Substituir os filmes de um cinema, reindexando só o que mudou.
+
+        `label` descreve o cinema nos resultados (entrada, cidade, nome).
+        """
+        previous = self._sources.get(source, {})
+        self._sources[source] = dict(movies)
+        self._labels[source] = label
+
+        for key in previous.keys() - movies.keys():
+            self._unshow(key, source)
+        for key, movie in movies.items():
+            if previous.get(key) is movie:
+                continue
+            self._showing.setdefault(key, set()).add(source)
+            indexed = self._movies.get(key)
+            if indexed is None or indexed[0] is not movie:
+                self._index(key, movie)
+
+    def remove(self, source: Hashable) -> None:
+        """Retirar do índice todos os filmes de um cinema."""
+        self._labels.pop(source, None)
+        for key in self._sources.pop(source, {}):
+            self._unshow(key, source)
+
+    def search(
+        self, query: str | None = None, **fields: str | None
+    ) -> list[dict[str, Any]]:
+        """Buscar filmes e agrupá-los por cinema, dos com mais resultados.
+
+        Todos os termos precisam ser encontrados: os de `query` em qualquer
+        campo e os de cada campo (`genres`, `cast`, ...) naquele campo.
+        """
+        candidates: list[set[str]] = []
+        for term in tokenize(query):
+            candidates.append(
+                set().union(
+                    *(postings.get(term, ()) for postings in self._postings.values())
+                )
+            )
+        for name, value in fields.items():
+            postings = self._postings[name]
+            candidates.extend(postings.get(term, set()) for term in tokenize(value))
+        if not candidates:
+            return []
+
+        # Começar pelo menor conjunto deixa a interseção proporcional a ele
+        candidates.sort(key=len)
+        matches = candidates[0].intersection(*candidates[1:])
+
+        # Ordenar uma vez pelo título mantém a ordem nas listas de cada cinema
+        by_source: dict[Hashable, list[str]] = {}
+        for key in sorted(matches, key=lambda key: self._movies[key][0].title):
+            for source in self._showing[key]:
+                by_source.setdefault(source, []).append(key)
+        results = [
+            {**self._labels[source], "movies": keys}
+            for source, keys in by_source.items()
+        ]
+        results.sort(key=lambda result: (-len(result["movies"]), _label(result)))
+        return results
+
+    def movie(self, key: str) -> Movie:
+        """Retornar o filme indexado com o identificador."""
+        return self._movies[key][0]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Resumir o tamanho do índice."""
+        return {
+            "sources": len(self._sources),
+            "movies": len(self._movies),
+            "terms": {name: len(postings) for name, postings in self._postings.items()},
+        }
+
+    def _index(self, key: str, movie: Movie) -> None:
+        """Indexar (ou reindexar) os campos de um filme."""
+        self._drop_terms(key)
+        terms = {name: tokenize(getattr(movie, name)) for name in SEARCH_FIELDS}
+        for name, field_terms in terms.items():
+            postings = self._postings[name]
+            for term in field_terms:
+                postings.setdefault(term, set()).add(key)
+        self._movies[key] = (movie, terms)
+
+    def _unshow(self, key: str, source: Hashable) -> None:
+        """Registrar que um cinema deixou de exibir um filme."""
+        showing = self._showing.get(key)
+        if showing is None:
+            return
+        showing.discard(source)
+        if not showing:
+            del self._showing[key]
+            self._drop_terms(key)
+            del self._movies[key]
+
+    def _drop_terms(self, key: str) -> None:
+        """Retirar os termos de um filme das listas invertidas."""
+        if (indexed := self._movies.get(key)) is None:
+            return
+        for name, field_terms in indexed[1].items():
+            postings = self._postings[name]
+            for term in field_terms:
+                keys = postings[term]
+                keys.discard(key)
+                if not keys:
+                    del postings[term]
+
+
+def _label(result: dict[str, Any]) -> tuple[str, str]:
+    """Ordenar cinemas com o mesmo número de resultados pelo nome."""
+    return (result.get("city_name") or "", result.get("theater_name") or "")
@@ -1,235 +1,234 @@
 """Support for Ingresso.com sensors."""
 
 import logging
-from datetime import timedelta
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from time import perf_counter
 from typing import Any, Dict, Optional
 
-import voluptuous as vol
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    Platform,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.typing import StateType
 from homeassistant.util import dt
 
-from .api import IngressoApiClient
 from .const import (
-    CONF_CITY_ID,
-    CONF_CITY_NAME,
-    CONF_PARTNERSHIP,
-    CONF_THEATER,
-    CONF_THEATER_NAME,
-    DEFAULT_POSTER,
+    API_HOST,
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_MOVIE_ENTITIES,
+    CONF_SESSION_DAYS,
+    DEFAULT_SESSION_DAYS,
     DOMAIN,
     ICON,
 )
+from .coordinator import IngressoDataUpdateCoordinator
+from .data import IngressoConfigEntry
+from .entity import IngressoEntity, async_setup_movie_entities
+from .limiter import RateLimiter
+from .models import Movie
+from .sessions import Session
 
 _LOGGER = logging.getLogger(__name__)
 
-# Movie listings change a few times a day; the default 30s platform poll
-# hammers a slow API (each request can take up to the 30s timeout).
-SCAN_INTERVAL = timedelta(minutes=30)
-
-# Service constants
-SERVICE_GET_MOVIES = "get_movies"
-ATTR_CITY_ID = "city_id"
-ATTR_PARTNERSHIP = "partnership"
-ATTR_THEATER = "theater"
-
-# Service schema
-GET_MOVIES_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_CITY_ID): cv.string,
-        vol.Required(ATTR_PARTNERSHIP): cv.string,
-        vol.Optional(ATTR_THEATER): cv.string,
-    }
+# Header entry read by upcoming-media-card
+UPCOMING_MEDIA_HEADER = {
+    "title_default": "$title",
+    "line1_default": "$rating",
+    "line2_default": "$release",
+    "line3_default": "$runtime",
+    "line4_default": "$studio",
+    "icon": "mdi:arrow-down-bold",
+}
+
+# Window of upcoming sessions listed by the next session sensor
+UPCOMING_SESSIONS_WINDOW = timedelta(hours=3)
+
+# Only the diagnostic sensors poll; they read counters kept in memory
+SCAN_INTERVAL = timedelta(minutes=1)
+
+
+def _primary_request_stat(name: str) -> Callable[[IngressoDataUpdateCoordinator], Any]:
+    """Read a request counter of the fetch that brings the entry's movies."""
+
+    def value(coordinator: IngressoDataUpdateCoordinator) -> Any:
+        fetch = coordinator.primary_fetch_stats
+        return fetch["requests"][name] if fetch else None
+
+    return value
+
+
+def _cache_hit_ratio(coordinator: IngressoDataUpdateCoordinator) -> float | None:
+    """Return the share of refreshes served by the hub cache, in percent."""
+    fetch = coordinator.primary_fetch_stats
+    if not fetch or (ratio := fetch["cache"]["hit_ratio"]) is None:
+        return None
+    return round(ratio * 100, 1)
+
+
+def _api_limiter(coordinator: IngressoDataUpdateCoordinator) -> RateLimiter:
+    """Return the rate limiter shared by the requests to the API host."""
+    return coordinator.hub.transport.hosts.limiter(API_HOST)
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+@dataclass(frozen=True, kw_only=True)
+class IngressoDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes an Ingresso.com diagnostic sensor."""
+
+    value_fn: Callable[[IngressoDataUpdateCoordinator], StateType | datetime]
+
+
+DIAGNOSTIC_SENSORS = (
+    IngressoDiagnosticSensorEntityDescription(
+        key="refresh_duration",
+        name="Duração da atualização",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda coordinator: _milliseconds(coordinator.stats.duration.last),
+    ),
+    IngressoDiagnosticSensorEntityDescription(
+        key="consecutive_failures",
+        name="Falhas consecutivas",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.stats.consecutive_failures,
+    ),
+    IngressoDiagnosticSensorEntityDescription(
+        key="last_success",
+        name="Última atualização bem-sucedida",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda coordinator: coordinator.stats.last_success,
+    ),
+    IngressoDiagnosticSensorEntityDescription(
+        key="payload_size",
+        name="Tamanho da resposta",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        value_fn=_primary_request_stat("last_bytes"),
+    ),
+    IngressoDiagnosticSensorEntityDescription(
+        key="attribute_size",
+        name="Tamanho dos atributos",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        value_fn=lambda coordinator: coordinator.stats.attribute_bytes,
+    ),
+    IngressoDiagnosticSensorEntityDescription(
+        key="rate_limit_queue",
+        name="Requisições na fila",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _api_limiter(coordinator).queued,
+    ),
+    IngressoDiagnosticSensorEntityDescription(
+        key="rate_limit_wait",
+        name="Espera no limite de taxa",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda coordinator: _milliseconds(
+            _api_limiter(coordinator).stats.last_wait
+        ),
+    ),
+    IngressoDiagnosticSensorEntityDescription(
+        key="cache_hit_ratio",
+        name="Acertos do cache",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        value_fn=_cache_hit_ratio,
+    ),
 )
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: IngressoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up the Ingresso sensor."""
-    config_data = hass.data[DOMAIN][config_entry.entry_id]
-    client = config_data["client"]
-
-    # Create a unique device identifier
-    device_id = f"{config_data[CONF_CITY_ID]}_{config_data[CONF_PARTNERSHIP]}"
-    if config_data.get(CONF_THEATER):
-        device_id = f"{device_id}_{config_data.get(CONF_THEATER)}"
-
-    # Create a device name
-    if config_data.get(CONF_THEATER_NAME):
-        device_name = f"Ingresso.com {config_data.get(CONF_THEATER_NAME)}"
-    else:
-        device_name = f"Ingresso.com {config_data[CONF_PARTNERSHIP].capitalize()} {config_data[CONF_CITY_NAME]}"
-
-    sensor = IngressoSensor(
-        client=client,
-        city_id=config_data[CONF_CITY_ID],
-        city_name=config_data[CONF_CITY_NAME],
-        partnership=config_data[CONF_PARTNERSHIP],
-        theater=config_data.get(CONF_THEATER, ""),
-        theater_name=config_data.get(CONF_THEATER_NAME, ""),
-        device_id=device_id,
-        device_name=device_name,
-        config_entry_id=config_entry.entry_id,
-    )
-
-    async_add_entities([sensor], update_before_add=True)
-
-    # Register the service
-    async def handle_get_movies(call: ServiceCall) -> None:
-        """Handle the service call."""
-        city_id = call.data.get(ATTR_CITY_ID)
-        partnership = call.data.get(ATTR_PARTNERSHIP)
-        theater = call.data.get(ATTR_THEATER, "")
-
-        # Create a temporary API client for the service call
-        temp_client = IngressoApiClient(
-            city_id=city_id,
-            partnership=partnership,
-            session=async_get_clientsession(hass),
-            theater=theater,
-        )
-
-        try:
-            movies = await temp_client.async_get_movies()
-            formatted_movies = []
-
-            if movies:
-                formatted_movies = [
-                    {
-                        "title": movie.get("title", "Não informado"),
-                        "poster": movie["images"][0]["url"]
-                        if movie.get("images")
-                        else DEFAULT_POSTER,
-                        "synopsis": movie.get("synopsis", "Não informado"),
-                        "director": movie.get("director", "Não informado"),
-                        "cast": movie.get("cast", "Não informado"),
-                        "studio": movie.get("distributor", "Não informado"),
-                        "genres": movie.get("genres", "Não informado"),
-                        "runtime": movie.get("duration", "Não informado"),
-                        "rating": movie.get("contentRating", "Não informado"),
-                        "release": "$date",
-                        "airdate": movie["premiereDate"]["localDate"].split("T")[0]
-                        if movie.get("premiereDate")
-                        and movie.get("premiereDate").get("localDate")
-                        else "Não informado",
-                        "ticket": movie.get("siteURL", "Não informado"),
-                    }
-                    for movie in movies
-                ]
-
-            # Make result available as a service response
-            hass.states.async_set(
-                f"{DOMAIN}.service_result",
-                len(formatted_movies),
-                {
-                    "movies": formatted_movies,
-                    "last_updated": dt.utcnow().isoformat(),
-                },
-            )
-
-        except Exception as error:  # pylint: disable=broad-except
-            _LOGGER.error("Erro ao obter filmes via serviço: %s", error)
-            hass.states.async_set(
-                f"{DOMAIN}.service_result",
-                "error",
-                {
-                    "error": str(error),
-                },
+    """Set up the Ingresso sensors, one set per theater of the entry."""
+    options = config_entry.options
+    entities: list[SensorEntity] = []
+    for coordinator in config_entry.runtime_data.coordinators:
+        if options.get(CONF_COMPACT_ATTRIBUTES):
+            entities.append(IngressoCompactSensor(coordinator))
+        else:
+            entities.append(IngressoSensor(coordinator))
+
+        # Showtimes are only published per theater
+        if coordinator.theater and options.get(CONF_SESSION_DAYS, DEFAULT_SESSION_DAYS):
+            entities.append(IngressoNextSessionSensor(coordinator))
+
+        if options.get(CONF_DIAGNOSTIC_SENSORS, False):
+            entities.extend(
+                IngressoDiagnosticSensor(coordinator, description)
+                for description in DIAGNOSTIC_SENSORS
             )
 
-    # Register the service with Home Assistant
-    hass.services.async_register(
-        DOMAIN, SERVICE_GET_MOVIES, handle_get_movies, schema=GET_MOVIES_SCHEMA
-    )
-
-
-class IngressoDeviceEntity(SensorEntity):
-    """Base entity class for Ingresso.com devices."""
-
-    def __init__(
-        self,
-        device_id: str,
-        device_name: str,
-        config_entry_id: str,
-    ) -> None:
-        """Initialize the device entity."""
-        self._device_id = device_id
-        self._config_entry_id = config_entry_id
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_name,
-            manufacturer="Ingresso.com",
-            model="Cinema",
-            sw_version="1.0",
-            configuration_url="https://ingresso.com",
-            # Remove the via_device parameter which is causing the warning
+    async_add_entities(entities)
+
+    for coordinator in config_entry.runtime_data.coordinators:
+        async_setup_movie_entities(
+            hass,
+            config_entry,
+            coordinator,
+            async_add_entities,
+            Platform.SENSOR,
+            "movie",
+            IngressoMovieSensor,
+            enabled=options.get(CONF_MOVIE_ENTITIES, False),
         )
 
 
-class IngressoSensor(IngressoDeviceEntity):
+class IngressoSensor(IngressoEntity, SensorEntity):
     """Representation of an Ingresso.com sensor."""
 
-    _attr_has_entity_name = True
-    _attr_attribution = "Dados fornecidos por Ingresso.com"
     _attr_translation_key = "ingresso"
 
-    def __init__(
-        self,
-        client: IngressoApiClient,
-        city_id: str,
-        city_name: str,
-        partnership: str,
-        theater: str,
-        theater_name: str,
-        device_id: str,
-        device_name: str,
-        config_entry_id: str,
-    ) -> None:
+    def __init__(self, coordinator: IngressoDataUpdateCoordinator) -> None:
         """Initialize the sensor."""
-        super().__init__(device_id, device_name, config_entry_id)
-
-        self._client = client
-        self._city_id = city_id
-        self._city_name = city_name
-        self._partnership = partnership
-        self._theater = theater
-        self._theater_name = theater_name
+        super().__init__(coordinator)
+
+        self._city_name = coordinator.city_name
+        self._theater_name = coordinator.theater_name
         self._state: Optional[StateType] = None
-        self._available = True
-        self._movies = [
-            {
-                "title_default": "$title",
-                "line1_default": "$rating",
-                "line2_default": "$release",
-                "line3_default": "$runtime",
-                "line4_default": "$studio",
-                "icon": "mdi:arrow-down-bold",
-            }
-        ]
+        self._movies: list[Movie] = []
+        self._attributes: Dict[str, Any] = {}
 
         # Create a unique ID based on city and theater
-        unique_suffix = device_id
-        self._attr_unique_id = f"{DOMAIN}_{unique_suffix}"
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.device_id}"
 
         # Create a meaningful name
         self._attr_name = "Filmes em Cartaz"
         self._attr_icon = ICON
         self._attr_native_unit_of_measurement = "filmes"
-        self._last_updated = None
+
+        self._update_from_coordinator()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self._available
+        return bool(self.coordinator.data)
 
     @property
     def native_value(self) -> StateType:
@@ -238,55 +237,242 @@ class IngressoSensor(IngressoDeviceEntity):
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes."""
-        return {
-            "data": self._movies,
-            "last_updated": self._last_updated,
+        """Return the state attributes built on the last coordinator update."""
+        return self._attributes
+
+    def _serialize_movies(self) -> list[dict[str, Any]]:
+        """Build the movie list exposed in the state attributes."""
+        movies = [
+            movie.as_dict(self._city_name, self._theater_name) for movie in self._movies
+        ]
+        if self.posters is not None:
+            for data in movies:
+                data["poster"] = self.posters.local_url(data["poster"])
+        return [UPCOMING_MEDIA_HEADER, *movies]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Use the movies decoded by the coordinator and build the attributes."""
+        if self.coordinator.data:
+            _LOGGER.debug("%s - Processando atualização", self.entity_id)
+            self._movies = self.coordinator.movies
+            self._state = len(self._movies)
+
+        # Built once per update and reused by every state write in between
+        stats = self.coordinator.stats
+        started = perf_counter()
+        data = self._serialize_movies()
+        stats.last_format_seconds = perf_counter() - started
+        stats.attribute_bytes = len(json_bytes(data))
+        # Time the listings shown were fetched, not of the last notification,
+        # so restored or stale listings keep their original time
+        fetched_at = self.coordinator.fetched_at
+        self._attributes = {
+            "data": data,
+            "last_updated": fetched_at.isoformat() if fetched_at else None,
+            "stale": self.coordinator.is_stale,
             "theater_name": self._theater_name,
             "city_name": self._city_name,
         }
 
+
+class IngressoCompactSensor(IngressoSensor):
+    """Ingresso.com sensor that keeps the heavy movie payload out of the state.
+
+    Only a summary of each movie is exposed and the list is not recorded;
+    the full catalog is served by the ``ingresso/movies`` websocket command.
+    """
+
+    _unrecorded_attributes = frozenset({"data"})
+
+    def _serialize_movies(self) -> list[dict[str, Any]]:
+        """Build the movie summary exposed in the state attributes."""
+        return [
+            UPCOMING_MEDIA_HEADER,
+            *(movie.as_summary() for movie in self._movies),
+        ]
+
+
+class IngressoNextSessionSensor(IngressoEntity, SensorEntity):
+    """Start time of the next session at the theater.
+
+    The state is looked up in the coordinator's session index and moved to
+    the following session when the current one starts, and the upcoming
+    list is refreshed as sessions enter its window, without polling.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:ticket"
+    _unrecorded_attributes = frozenset({"upcoming"})
+
+    def __init__(self, coordinator: IngressoDataUpdateCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.device_id}_next_session"
+        self._attr_name = "Próxima Sessão"
+        self._session: Session | None = None
+        self._upcoming: list[Session] = []
+        self._unsub_next: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Look up the next session once the entity is added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._cancel_next)
+        self._update_session(dt.utcnow())
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the start of the next session."""
+        return self._session.start if self._session else None
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the state attributes."""
+        if self._session is None:
+            return {"upcoming": []}
+        return {
+            "movie_id": self._session.movie_id,
+            "title": self._session.title,
+            "room": self._session.room,
+            "types": list(self._session.types),
+            "ticket": self._session.ticket,
+            "upcoming": [session.as_dict() for session in self._upcoming],
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_session(dt.utcnow())
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_scheduled_change(self, now: datetime) -> None:
+        """Move on when a session starts or another enters the upcoming window."""
+        self._unsub_next = None
+        self._update_session(now)
+        self.async_write_ha_state()
+
+    @callback
+    def _update_session(self, now: datetime) -> None:
+        """Look up the next session and schedule the following lookup."""
+        sessions = self.coordinator.sessions
+        end = now + UPCOMING_SESSIONS_WINDOW
+        self._session = sessions.next_session(now)
+        self._upcoming = sessions.between(now, end)
+
+        self._cancel_next()
+        # The state changes when the next session starts; the upcoming list
+        # also changes when the first session past the window enters it
+        changes = []
+        if self._session is not None:
+            changes.append(self._session.start)
+        if (entering := sessions.next_session(end)) is not None:
+            changes.append(entering.start - UPCOMING_SESSIONS_WINDOW)
+        if changes:
+            self._unsub_next = async_track_point_in_time(
+                self.hass, self._handle_scheduled_change, min(changes)
+            )
+
+    @callback
+    def _cancel_next(self) -> None:
+        """Cancel the scheduled lookup."""
+        if self._unsub_next is not None:
+            self._unsub_next()
+            self._unsub_next = None
+
+
+class IngressoMovieSensor(IngressoEntity, SensorEntity):
+    """A single movie showing at the theater.
+
+    The coordinator keeps the same movie object while a movie is unchanged,
+    so an update only writes the state of the movies that actually changed.
+    """
+
+    _attr_icon = ICON
+    _unrecorded_attributes = frozenset({"synopsis", "cast", "poster"})
+
+    def __init__(self, coordinator: IngressoDataUpdateCoordinator, key: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        self._movie = coordinator.movies_by_id[key]
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.device_id}_movie_{key}"
+        self._attr_name = self._movie.title
+
+    @property
+    def available(self) -> bool:
+        """Return True while the movie is in the listings."""
+        return super().available and self._key in self.coordinator.movies_by_id
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the title of the movie."""
+        return self._movie.title
+
+    @property
+    def entity_picture(self) -> str | None:
+        """Return the poster of the movie."""
+        if self.posters is not None:
+            return self.posters.local_url(self._movie.poster)
+        return self._movie.poster
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the state attributes."""
+        data = self._movie.as_dict()
+        # Title is the state; the release placeholder is only for the card
+        del data["title"], data["release"]
+        data["poster"] = self.entity_picture
+        data["movie_id"] = self._key
+        return data
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when this movie changed."""
+        if (movie := self.coordinator.movies_by_id.get(self._key)) is None:
+            # Removed from the listings; the platform removes the entity
+            return
+        if movie is not self._movie:
+            self._movie = movie
+            self.async_write_ha_state()
+
+
+class IngressoDiagnosticSensor(IngressoEntity, SensorEntity):
+    """Performance counter of the entry, for finding slow theaters.
+
+    The counters change on every refresh, including those that bring no
+    new listings, so these sensors poll the in-memory values instead of
+    waiting for coordinator updates.
+    """
+
+    entity_description: IngressoDiagnosticSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = True
+
+    def __init__(
+        self,
+        coordinator: IngressoDataUpdateCoordinator,
+        description: IngressoDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.device_id}_{description.key}"
+
+    @property
+    def available(self) -> bool:
+        """Counters are available even before the first successful refresh."""
+        return True
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the counter value."""
+        return self.entity_description.value_fn(self.coordinator)
+
     async def async_update(self) -> None:
-        """Update the sensor."""
-        _LOGGER.debug("%s - Executando atualização", self.name)
-
-        try:
-            movie_data = await self._client.async_get_movies()
-
-            if movie_data:
-                formatted_movies = [
-                    {
-                        "title": movie.get("title", "Não informado"),
-                        "poster": movie["images"][0]["url"]
-                        if movie.get("images")
-                        else DEFAULT_POSTER,
-                        "synopsis": movie.get("synopsis", "Não informado"),
-                        "director": movie.get("director", "Não informado"),
-                        "cast": movie.get("cast", "Não informado"),
-                        "studio": movie.get("distributor", "Não informado"),
-                        "genres": movie.get("genres", "Não informado"),
-                        "runtime": movie.get("duration", "Não informado"),
-                        "rating": movie.get("contentRating", "Não informado"),
-                        "release": "$date",
-                        "airdate": movie["premiereDate"]["localDate"].split("T")[0]
-                        if movie.get("premiereDate")
-                        and movie.get("premiereDate").get("localDate")
-                        else "Não informado",
-                        "city": self._city_name,
-                        "theater": self._theater_name,
-                        "ticket": movie.get("siteURL", "Não informado"),
-                    }
-                    for movie in movie_data
-                ]
-
-                self._movies = [self._movies[0], *formatted_movies]
-                self._state = len(formatted_movies)
-                self._last_updated = dt.utcnow().isoformat()
-                self._available = True
-
-            else:
-                self._available = False
-
-        except Exception as error:  # pylint: disable=broad-except
-            _LOGGER.error("Erro ao atualizar sensor Ingresso.com: %s", error)
-            self._available = False
+        """Read the counters; never trigger a refresh of the listings."""
@@ -0,0 +1,238 @@
+"""Services for the Ingresso.com integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .api import IngressoApiClientError
+from .const import (
+    BATCH_MAX_CONCURRENCY,
+    BATCH_TIMEOUT,
+    DEFAULT_PARTNERSHIP,
+    DOMAIN,
+    SERVICE_CACHE_SIZE,
+    SERVICE_CACHE_TTL,
+)
+from .hub import async_get_hub
+from .limiter import PRIORITY_SERVICE
+from .models import movie_id
+
+# Service constants
+SERVICE_GET_MOVIES = "get_movies"
+SERVICE_GET_MOVIES_BATCH = "get_movies_batch"
+SERVICE_SEARCH = "search"
+ATTR_CITY_ID = "city_id"
+ATTR_PARTNERSHIP = "partnership"
+ATTR_THEATER = "theater"
+ATTR_TARGETS = "targets"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+ATTR_TIMEOUT = "timeout"
+ATTR_QUERY = "query"
+ATTR_GENRE = "genre"
+ATTR_CAST = "cast"
+ATTR_DIRECTOR = "director"
+ATTR_RATING = "rating"
+
+# Search index field behind each search service field
+SEARCH_FIELDS = {
+    ATTR_GENRE: "genres",
+    ATTR_CAST: "cast",
+    ATTR_DIRECTOR: "director",
+    ATTR_RATING: "rating",
+}
+
+# Service schema
+GET_MOVIES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CITY_ID): cv.string,
+        vol.Required(ATTR_PARTNERSHIP): cv.string,
+        vol.Optional(ATTR_THEATER): cv.string,
+    }
+)
+TARGET_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CITY_ID): cv.string,
+        vol.Optional(ATTR_THEATER): cv.string,
+    }
+)
+GET_MOVIES_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_TARGETS): vol.All(
+            cv.ensure_list, vol.Length(min=1), [TARGET_SCHEMA]
+        ),
+        vol.Optional(ATTR_PARTNERSHIP, default=DEFAULT_PARTNERSHIP): cv.string,
+        vol.Optional(ATTR_MAX_CONCURRENCY, default=BATCH_MAX_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=16)
+        ),
+        vol.Optional(ATTR_TIMEOUT, default=BATCH_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=60)
+        ),
+    }
+)
+
+SEARCH_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_QUERY): cv.string,
+            **{vol.Optional(name): cv.string for name in SEARCH_FIELDS},
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_QUERY, *SEARCH_FIELDS),
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Ingresso.com services."""
+    # Serialized responses, reused while the hub returns the same payload;
+    # scripts may query any number of cities, so only the latest are kept
+    responses: OrderedDict[tuple[str, str, str | None], tuple[Any, dict[str, Any]]] = (
+        OrderedDict()
+    )
+
+    async def handle_get_movies(call: ServiceCall) -> ServiceResponse:
+        """Return the movies showing in a city or theater."""
+        hub = async_get_hub(hass)
+        key = (
+            call.data[ATTR_CITY_ID],
+            call.data[ATTR_PARTNERSHIP],
+            call.data.get(ATTR_THEATER) or None,
+        )
+
+        try:
+            # The hub caches each fetch and coalesces concurrent calls, so a
+            # burst of service calls costs a single upstream request
+            movies = await hub.async_get_movies(
+                *key, max_age=SERVICE_CACHE_TTL, priority=PRIORITY_SERVICE
+            )
+        except IngressoApiClientError as error:
+            raise HomeAssistantError(f"Erro ao obter filmes: {error}") from error
+
+        cached = responses.get(key)
+        if cached is not None and cached[0] is movies:
+            responses.move_to_end(key)
+            return cached[1]
+
+        response = {
+            "movies": [hub.library.movie(movie).as_dict() for movie in movies or ()],
+            "last_updated": dt_util.utcnow().isoformat(),
+        }
+        responses[key] = (movies, response)
+        responses.move_to_end(key)
+        if len(responses) > SERVICE_CACHE_SIZE:
+            responses.popitem(last=False)
+        return response
+
+    async def handle_get_movies_batch(call: ServiceCall) -> ServiceResponse:
+        """Return the movies of several cities or theaters at once."""
+        hub = async_get_hub(hass)
+        partnership = call.data[ATTR_PARTNERSHIP]
+        timeout = call.data[ATTR_TIMEOUT]
+        semaphore = asyncio.Semaphore(call.data[ATTR_MAX_CONCURRENCY])
+
+        async def fetch(target: dict[str, Any]) -> list[dict[str, Any]]:
+            async with semaphore, asyncio.timeout(timeout):
+                return await hub.async_get_movies(
+                    target[ATTR_CITY_ID],
+                    partnership,
+                    target.get(ATTR_THEATER) or None,
+                    max_age=SERVICE_CACHE_TTL,
+                    priority=PRIORITY_SERVICE,
+                )
+
+        targets = call.data[ATTR_TARGETS]
+        results = await asyncio.gather(
+            *(fetch(target) for target in targets), return_exceptions=True
+        )
+
+        # Merge the listings by movie, recording the targets showing each one
+        movies: dict[str, dict[str, Any]] = {}
+        target_results = []
+        for target, result in zip(targets, results, strict=True):
+            city_id = target[ATTR_CITY_ID]
+            theater = target.get(ATTR_THEATER) or None
+            if isinstance(result, BaseException):
+                error = (
+                    "Tempo limite excedido"
+                    if isinstance(result, TimeoutError)
+                    else str(result)
+                )
+                target_results.append(
+                    {ATTR_CITY_ID: city_id, ATTR_THEATER: theater, "error": error}
+                )
+                continue
+
+            for item in result or ():
+                if (key := movie_id(item)) not in movies:
+                    movies[key] = {
+                        **hub.library.movie(item).as_dict(),
+                        "showing_at": [],
+                    }
+                movies[key]["showing_at"].append(
+                    {ATTR_CITY_ID: city_id, ATTR_THEATER: theater}
+                )
+            target_results.append(
+                {ATTR_CITY_ID: city_id, ATTR_THEATER: theater, "count": len(result)}
+            )
+
+        return {
+            "movies": list(movies.values()),
+            "targets": target_results,
+            "last_updated": dt_util.utcnow().isoformat(),
+        }
+
+    @callback
+    def handle_search(call: ServiceCall) -> ServiceResponse:
+        """Search the listings of all loaded entries, ranked by theater."""
+        index = async_get_hub(hass).search
+        theaters = index.search(
+            call.data.get(ATTR_QUERY),
+            **{
+                field: call.data[name]
+                for name, field in SEARCH_FIELDS.items()
+                if name in call.data
+            },
+        )
+        # Movies showing at several theaters are serialized once
+        keys = {key for theater in theaters for key in theater["movies"]}
+        return {
+            "theaters": theaters,
+            "movies": {key: index.movie(key).as_dict() for key in keys},
+            "last_updated": dt_util.utcnow().isoformat(),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_MOVIES,
+        handle_get_movies,
+        schema=GET_MOVIES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_MOVIES_BATCH,
+        handle_get_movies_batch,
+        schema=GET_MOVIES_BATCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH,
+        handle_search,
+        schema=SEARCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
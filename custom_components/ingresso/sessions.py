@@ -0,0 +1,159 @@
+"""Sessões (horários) dos filmes do Ingresso.com."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta, tzinfo
+from operator import attrgetter
+from sys import intern
+from typing import Any
+
+from .models import NOT_INFORMED, movie_id
+
+
+@dataclass(frozen=True, slots=True)
+class Session:
+    """Sessão de um filme em uma sala do cinema."""
+
+    start: datetime
+    movie_id: str
+    title: str
+    room: str
+    types: tuple[str, ...]
+    ticket: str
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializar a sessão para atributos e respostas."""
+        return {
+            "start": self.start.isoformat(),
+            "movie_id": self.movie_id,
+            "title": self.title,
+            "room": self.room,
+            "types": list(self.types),
+            "ticket": self.ticket,
+        }
+
+
+def _session_start(day: str | None, session: dict[str, Any]) -> datetime | None:
+    """Retornar o início da sessão a partir da data informada pela API."""
+    for key in ("date", "realDate"):
+        if isinstance(value := session.get(key), dict) and value.get("localDate"):
+            try:
+                return datetime.fromisoformat(value["localDate"])
+            except ValueError:
+                continue
+    if day and session.get("time"):
+        try:
+            return datetime.fromisoformat(f"{day[:10]}T{session['time']}")
+        except ValueError:
+            return None
+    return None
+
+
+def _session_types(session: dict[str, Any]) -> tuple[str, ...]:
+    """Retornar os tipos da sessão, como dublado, legendado ou 3D."""
+    types = session.get("type") or [
+        item.get("name") for item in session.get("types") or () if item.get("name")
+    ]
+    return tuple(intern(str(value)) for value in types)
+
+
+def project_session_day(day: Any) -> tuple[str | None, list[Session]]:
+    """Reduzir um dia da resposta de sessões às sessões que a integração usa."""
+    if not isinstance(day, dict):
+        return None, []
+    day_date = day.get("date")
+    sessions = []
+    for movie in day.get("movies") or ():
+        key = movie_id(movie)
+        title = movie.get("title", NOT_INFORMED)
+        for room in movie.get("rooms") or ():
+            room_name = intern(str(room.get("name", NOT_INFORMED)))
+            for session in room.get("sessions") or ():
+                if (start := _session_start(day_date, session)) is None:
+                    continue
+                sessions.append(
+                    Session(
+                        start=start,
+                        movie_id=key,
+                        title=title,
+                        room=room_name,
+                        types=_session_types(session),
+                        ticket=session.get("siteURL")
+                        or movie.get("siteURL", NOT_INFORMED),
+                    )
+                )
+    return day_date, sessions
+
+
+class SessionIndex:
+    """Sessões ordenadas pelo início, no geral e por filme.
+
+    As consultas de próxima sessão e de sessões em um intervalo são buscas
+    binárias nas listas de inícios, sem percorrer todas as sessões.
+    """
+
+    def __init__(self, sessions: list[Session]) -> None:
+        """Montar o índice a partir das sessões."""
+        self._sessions = sorted(sessions, key=attrgetter("start"))
+        self._starts = [session.start for session in self._sessions]
+        self._by_movie: dict[str, list[Session]] = {}
+        for session in self._sessions:
+            self._by_movie.setdefault(session.movie_id, []).append(session)
+        self._movie_starts = {
+            key: [session.start for session in sessions]
+            for key, sessions in self._by_movie.items()
+        }
+
+    @classmethod
+    def from_days(
+        cls,
+        days: list[tuple[str | None, list[Session]]],
+        first_day: date,
+        window: int,
+        time_zone: tzinfo,
+    ) -> SessionIndex:
+        """Montar o índice com as sessões dos dias dentro da janela."""
+        last_day = first_day + timedelta(days=window - 1)
+        sessions = []
+        for day_date, day_sessions in days or ():
+            if day_date:
+                try:
+                    if not first_day <= date.fromisoformat(day_date[:10]) <= last_day:
+                        continue
+                except ValueError:
+                    pass
+            for session in day_sessions:
+                # Horários sem fuso são locais do cinema
+                if session.start.tzinfo is None:
+                    session = replace(
+                        session, start=session.start.replace(tzinfo=time_zone)
+                    )
+                sessions.append(session)
+        return cls(sessions)
+
+    def __len__(self) -> int:
+        """Retornar o número de sessões."""
+        return len(self._sessions)
+
+    def next_session(
+        self, now: datetime, movie_id: str | None = None
+    ) -> Session | None:
+        """Retornar a próxima sessão, de qualquer filme ou de um filme."""
+        sessions, starts = self._lists(movie_id)
+        index = bisect_right(starts, now)
+        return sessions[index] if index < len(sessions) else None
+
+    def between(
+        self, start: datetime, end: datetime, movie_id: str | None = None
+    ) -> list[Session]:
+        """Retornar as sessões que começam no intervalo [start, end)."""
+        sessions, starts = self._lists(movie_id)
+        return sessions[bisect_left(starts, start) : bisect_left(starts, end)]
+
+    def _lists(self, movie_id: str | None) -> tuple[list[Session], list[datetime]]:
+        """Retornar as sessões e os inícios de todos ou de um filme."""
+        if movie_id is None:
+            return self._sessions, self._starts
+        return self._by_movie.get(movie_id, []), self._movie_starts.get(movie_id, [])
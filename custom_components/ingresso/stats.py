@@ -0,0 +1,174 @@
+"""Contadores de desempenho do Ingresso.com."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+# Limites (em segundos) das faixas do histograma de latência
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Histograma de latências em faixas fixas."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    total: float = 0.0
+    last: float | None = None
+
+    def record(self, seconds: float) -> None:
+        """Registrar uma latência."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.last = seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializar o histograma com as faixas nomeadas."""
+        count = sum(self.counts)
+        labels = [f"<={bucket}s" for bucket in LATENCY_BUCKETS] + [
+            f">{LATENCY_BUCKETS[-1]}s"
+        ]
+        return {
+            "count": count,
+            "mean": self.total / count if count else None,
+            "last": self.last,
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+@dataclass(slots=True)
+class RequestStats:
+    """Contadores das requisições de um cliente da API."""
+
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    # Respostas 304 e corpos idênticos ao anterior, que não geram conteúdo novo
+    not_modified: int = 0
+    unchanged: int = 0
+    bytes: int = 0
+    last_bytes: int | None = None
+    decode_seconds: float = 0.0
+    last_decode_seconds: float | None = None
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def record_body(self, size: int, decode_seconds: float) -> None:
+        """Registrar o tamanho e o tempo de decodificação de um corpo."""
+        self.bytes += size
+        self.last_bytes = size
+        self.decode_seconds += decode_seconds
+        self.last_decode_seconds = decode_seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializar os contadores."""
+        data = asdict(self)
+        data["latency"] = self.latency.as_dict()
+        return data
+
+
+@dataclass(slots=True)
+class TransportStats:
+    """Conexões e bytes da sessão HTTP da integração."""
+
+    requests: int = 0
+    # Conexões abertas (um handshake TLS cada) e conexões reaproveitadas
+    connections: int = 0
+    reused: int = 0
+    dns_hits: int = 0
+    dns_misses: int = 0
+    compressed: int = 0
+    # Bytes recebidos pela rede, somados das respostas com Content-Length
+    wire_bytes: int = 0
+
+    @property
+    def handshakes_per_request(self) -> float | None:
+        """Retornar quantas conexões novas foram abertas por requisição."""
+        return self.connections / self.requests if self.requests else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializar os contadores."""
+        return {**asdict(self), "handshakes_per_request": self.handshakes_per_request}
+
+
+@dataclass(slots=True)
+class LimiterStats:
+    """Tempo de espera das requisições no limitador de taxa."""
+
+    # Requisições liberadas por fila de prioridade
+    granted: list[int] = field(default_factory=lambda: [0, 0, 0])
+    waited: int = 0
+    wait_seconds: float = 0.0
+    max_wait: float = 0.0
+    last_wait: float | None = None
+
+    def record(self, priority: int, seconds: float) -> None:
+        """Registrar uma requisição liberada."""
+        self.granted[priority] += 1
+        self.last_wait = seconds
+        if seconds:
+            self.waited += 1
+            self.wait_seconds += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializar os contadores."""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class FetchStats:
+    """Uso do cache de uma busca compartilhada do hub."""
+
+    hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Retornar a fração das chamadas atendidas sem nova requisição."""
+        calls = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / calls if calls else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializar os contadores."""
+        return {**asdict(self), "hit_ratio": self.hit_ratio}
+
+
+@dataclass(slots=True)
+class RefreshStats:
+    """Contadores das atualizações de uma entrada de configuração."""
+
+    refreshes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_success: datetime | None = None
+    last_failure: datetime | None = None
+    last_error: str | None = None
+    duration: LatencyHistogram = field(default_factory=LatencyHistogram)
+    last_diff_seconds: float | None = None
+    last_format_seconds: float | None = None
+    attribute_bytes: int | None = None
+
+    def record_success(self, moment: datetime, seconds: float) -> None:
+        """Registrar uma atualização bem-sucedida."""
+        self.refreshes += 1
+        self.consecutive_failures = 0
+        self.last_success = moment
+        self.duration.record(seconds)
+
+    def record_failure(self, moment: datetime, error: Exception) -> None:
+        """Registrar uma atualização que falhou."""
+        self.refreshes += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_failure = moment
+        self.last_error = str(error)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializar os contadores."""
+        data = asdict(self)
+        data["duration"] = self.duration.as_dict()
+        return data
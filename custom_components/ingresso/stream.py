@@ -0,0 +1,200 @@
+"""Decodificação incremental das respostas JSON do Ingresso.com."""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import json
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Callable, Sequence
+
+CHUNK_SIZE = 64 * 1024
+# Bytes entre os hashes parciais usados para comparar com o corpo anterior
+CHECKPOINT_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+# Itens que terminam no próprio fechamento, sem depender do que vem depois
+_SELF_DELIMITED = '{["'
+_DECODER = json.JSONDecoder()
+
+
+class DecodedBody(NamedTuple):
+    """Resultado da decodificação de uma resposta.
+
+    `digest` traz os hashes parciais do corpo, a cada CHECKPOINT_SIZE bytes,
+    seguidos do hash do corpo inteiro; `payload` é None se o corpo repetiu
+    o anterior.
+    """
+
+    digest: tuple[bytes, ...]
+    payload: Any
+    size: int
+    decode_seconds: float
+
+
+class _ItemParser:
+    """Extrair um a um os itens de um array JSON recebido em pedaços."""
+
+    def __init__(self, project: Callable[[Any], Any]) -> None:
+        """Inicializar o analisador."""
+        self._project = project
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        # Respostas que não são um array são decodificadas inteiras
+        self._whole: list[str] | None = None
+        self.items: list[Any] = []
+
+    def feed(self, chunk: bytes, final: bool = False) -> None:
+        """Consumir um pedaço da resposta."""
+        text = self._text.decode(chunk, final)
+        if self._whole is not None:
+            self._whole.append(text)
+            return
+        self._buffer += text
+        self._parse(final)
+
+    def result(self) -> Any:
+        """Retornar o conteúdo decodificado ao fim da resposta."""
+        if self._whole is not None:
+            return json.loads("".join(self._whole))
+        if not self._finished:
+            msg = "Resposta JSON incompleta"
+            raise json.JSONDecodeError(msg, self._buffer, 0)
+        return self.items
+
+    def _parse(self, final: bool) -> None:
+        """Decodificar os itens completos disponíveis no buffer."""
+        buffer = self._buffer
+        pos = _skip(buffer, 0)
+        if not self._started:
+            if pos == len(buffer):
+                return
+            if buffer[pos] != "[":
+                self._whole = [buffer]
+                self._buffer = ""
+                return
+            self._started = True
+            pos = _skip(buffer, pos + 1)
+
+        while pos < len(buffer) and not self._finished:
+            if buffer[pos] == "]":
+                self._finished = True
+                pos += 1
+                break
+            if buffer[pos] == ",":
+                pos = _skip(buffer, pos + 1)
+                continue
+            try:
+                item, end = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Item ainda incompleto; aguardar o próximo pedaço
+                if final:
+                    raise
+                break
+            after = _skip(buffer, end)
+            if buffer[pos] not in _SELF_DELIMITED and (
+                after == len(buffer) or buffer[after] not in ",]"
+            ):
+                # Números e literais só terminam no delimitador seguinte: um
+                # pedaço que corta "1.5" entrega "1." e o decodificador lê 1
+                if final:
+                    msg = "Valor JSON incompleto"
+                    raise json.JSONDecodeError(msg, buffer, after)
+                break
+            self.items.append(self._project(item))
+            pos = after
+
+        # Descartar o que já foi decodificado mantém a memória constante
+        self._buffer = buffer[pos:]
+
+
+class _BodyHash:
+    """Hash do corpo, com hashes parciais em posições fixas."""
+
+    def __init__(self) -> None:
+        """Inicializar o hash."""
+        self._hash = hashlib.blake2b(digest_size=16)
+        self._filled = 0
+        self.checkpoints: list[bytes] = []
+
+    def update(self, chunk: bytes) -> None:
+        """Acrescentar um pedaço, registrando cada posição fixa atravessada."""
+        view = memoryview(chunk)
+        while view:
+            part = view[: CHECKPOINT_SIZE - self._filled]
+            self._hash.update(part)
+            self._filled += len(part)
+            view = view[len(part) :]
+            if self._filled == CHECKPOINT_SIZE:
+                self.checkpoints.append(self._hash.digest())
+                self._filled = 0
+
+    def digest(self) -> tuple[bytes, ...]:
+        """Retornar os hashes parciais e o do corpo inteiro."""
+        return (*self.checkpoints, self._hash.digest())
+
+
+def _skip(buffer: str, pos: int) -> int:
+    """Avançar sobre espaços em branco."""
+    while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+async def async_decode_items(
+    chunks: AsyncIterable[bytes],
+    project: Callable[[Any], Any],
+    previous: Sequence[bytes] = (),
+) -> DecodedBody:
+    """Decodificar um array JSON em pedaços, projetando cada item.
+
+    Cada item é decodificado e reduzido assim que chega, sem montar o corpo
+    inteiro nem a árvore completa de objetos. Retorna também o hash e o
+    tamanho do corpo, calculados durante a leitura, e o tempo gasto
+    decodificando (sem contar a espera pela rede).
+
+    Com o `digest` da resposta anterior em `previous`, os pedaços só são
+    guardados enquanto os hashes parciais coincidem; a decodificação começa
+    na primeira diferença, e um corpo idêntico não é decodificado.
+    """
+    body_hash = _BodyHash()
+    parser = _ItemParser(project)
+    # Pedaços ainda iguais aos da resposta anterior, à espera de uma diferença
+    pending: list[bytes] | None = [] if previous else None
+    size = 0
+    decode_seconds = 0.0
+    async for chunk in chunks:
+        started = perf_counter()
+        size += len(chunk)
+        checked = len(body_hash.checkpoints)
+        body_hash.update(chunk)
+        if pending is not None:
+            pending.append(chunk)
+            current = body_hash.checkpoints[checked:]
+            if current != list(previous[checked : checked + len(current)]):
+                _flush(parser, pending)
+                pending = None
+        else:
+            parser.feed(chunk)
+        decode_seconds += perf_counter() - started
+    started = perf_counter()
+    digest = body_hash.digest()
+    if pending is not None:
+        if digest == tuple(previous):
+            decode_seconds += perf_counter() - started
+            return DecodedBody(digest, None, size, decode_seconds)
+        _flush(parser, pending)
+    parser.feed(b"", final=True)
+    payload = parser.result()
+    decode_seconds += perf_counter() - started
+    return DecodedBody(digest, payload, size, decode_seconds)
+
+
+def _flush(parser: _ItemParser, pending: list[bytes]) -> None:
+    """Decodificar os pedaços guardados enquanto o corpo repetia o anterior."""
+    for chunk in pending:
+        parser.feed(chunk)
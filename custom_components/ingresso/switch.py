@@ -1,84 +1,90 @@
-"""Switch platform for integration_blueprint."""
+"""Switch platform for Ingresso.com."""
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.const import STATE_OFF, EntityCategory
+from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
+from .entity import IngressoEntity
 
 if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
-    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+    from .coordinator import IngressoDataUpdateCoordinator
+    from .data import IngressoConfigEntry
 
 ENTITY_DESCRIPTIONS = (
     SwitchEntityDescription(
-        key="ingresso_switch",
-        name="Ingresso Switch",
-        icon="mdi:movie",
+        key="auto_update",
+        name="Atualização automática",
+        icon="mdi:update",
+        entity_category=EntityCategory.CONFIG,
     ),
 )
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: IngressoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the switch platform."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    client = hass.data[DOMAIN][entry.entry_id]["client"]
-
     async_add_entities(
         IngressoSwitch(
             coordinator=coordinator,
-            client=client,
             entity_description=entity_description,
-            entry_id=entry.entry_id,
         )
+        for coordinator in entry.runtime_data.coordinators
         for entity_description in ENTITY_DESCRIPTIONS
     )
 
 
-class IngressoSwitch(CoordinatorEntity, SwitchEntity):
-    """Ingresso switch class."""
+class IngressoSwitch(IngressoEntity, SwitchEntity, RestoreEntity):
+    """Turn the periodic refresh of the listings on or off.
+
+    While off, the listings are only refreshed on request, e.g. with the
+    ``homeassistant.update_entity`` action.
+    """
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
-        client: Any,
+        coordinator: IngressoDataUpdateCoordinator,
         entity_description: SwitchEntityDescription,
-        entry_id: str,
     ) -> None:
         """Initialize the switch class."""
         super().__init__(coordinator)
         self.entity_description = entity_description
-        self._client = client
-        self._attr_unique_id = f"{entry_id}_{entity_description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry_id)},
-            "name": "Ingresso.com",
-            "manufacturer": "Ingresso.com",
-            "model": "API",
-            "sw_version": "1.0",
-        }
+        self._attr_unique_id = (
+            f"{DOMAIN}_{coordinator.device_id}_{entity_description.key}"
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last choice."""
+        await super().async_added_to_hass()
+        if (state := await self.async_get_last_state()) and state.state == STATE_OFF:
+            self.coordinator.async_set_auto_update(False)
+
+    @property
+    def available(self) -> bool:
+        """Return True; the switch works without listings."""
+        return True
 
     @property
     def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        # You can implement a meaningful state check here
-        return len(self.coordinator.data) > 0 if self.coordinator.data else False
+        """Return true if the listings refresh periodically."""
+        return self.coordinator.auto_update
 
     async def async_turn_on(self, **_: Any) -> None:
-        """Turn on the switch."""
-        # Implement a meaningful action here if needed
-        await self.coordinator.async_request_refresh()
+        """Turn on the periodic refresh."""
+        self.coordinator.async_set_auto_update(True)
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **_: Any) -> None:
-        """Turn off the switch."""
-        # Implement a meaningful action here if needed
-        await self.coordinator.async_request_refresh()
+        """Turn off the periodic refresh."""
+        self.coordinator.async_set_auto_update(False)
+        self.async_write_ha_state()
@@ -0,0 +1,106 @@
+"""Sessão HTTP própria da integração Ingresso.com."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.util.ssl import get_default_context
+
+from .api import ApiHosts, create_session
+from .const import API_RATE_BURST, API_RATE_LIMIT, DATA_TRANSPORT, DOMAIN
+from .stats import TransportStats
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IngressoTransport:
+    """Sessão HTTP compartilhada pelas entradas, fechada com a última delas.
+
+    A sessão é criada na primeira requisição e reaberta se for usada depois
+    de fechada, por exemplo por um serviço chamado sem entradas carregadas.
+    O estado dos hosts (disjuntor e limite de taxa) vive com ela e é
+    esquecido quando a última entrada é descarregada.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Inicializar o transporte."""
+        self._hass = hass
+        self._session: aiohttp.ClientSession | None = None
+        self._users = 0
+        # Taxa e rajada pedidas nas opções de cada entrada carregada
+        self._limits: dict[str, tuple[float, int]] = {}
+        self.stats = TransportStats()
+        self.hosts = ApiHosts()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_close)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Retornar a sessão, criando-a se necessário."""
+        if self._session is None or self._session.closed:
+            self._session = create_session(self.stats, get_default_context())
+        return self._session
+
+    @callback
+    def async_acquire(self) -> CALLBACK_TYPE:
+        """Registrar uma entrada que usa a sessão."""
+        self._users += 1
+
+        @callback
+        def _release() -> None:
+            self._users -= 1
+            if self._users:
+                return
+            self.hosts.clear()
+            if self._session is None:
+                return
+            _LOGGER.debug("Fechando a sessão HTTP após a última entrada")
+            session, self._session = self._session, None
+            self._hass.async_create_background_task(
+                session.close(), f"{DOMAIN}_close_session"
+            )
+
+        return _release
+
+    @callback
+    def async_set_limits(self, entry_id: str, rate: float, burst: int) -> CALLBACK_TYPE:
+        """Registrar o limite de taxa pedido por uma entrada.
+
+        O limitador é único por host, então vale o limite mais restritivo
+        entre as entradas carregadas.
+        """
+        self._limits[entry_id] = (rate, burst)
+        self._apply_limits()
+
+        @callback
+        def _remove() -> None:
+            self._limits.pop(entry_id, None)
+            self._apply_limits()
+
+        return _remove
+
+    def _apply_limits(self) -> None:
+        """Aplicar aos hosts o limite mais restritivo entre as entradas."""
+        limits = self._limits.values()
+        self.hosts.configure(
+            min((rate for rate, _ in limits), default=API_RATE_LIMIT),
+            min((burst for _, burst in limits), default=API_RATE_BURST),
+        )
+
+    async def _async_close(self, _: Event) -> None:
+        """Fechar a sessão ao encerrar o Home Assistant."""
+        if self._session is not None:
+            await self._session.close()
+
+
+@callback
+def async_get_transport(hass: HomeAssistant) -> IngressoTransport:
+    """Retornar o transporte compartilhado, criando-o se necessário."""
+    if (transport := hass.data.get(DATA_TRANSPORT)) is None:
+        transport = hass.data[DATA_TRANSPORT] = IngressoTransport(hass)
+    return transport
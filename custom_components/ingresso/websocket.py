@@ -0,0 +1,69 @@
+"""Comandos websocket do Ingresso.com."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Registrar os comandos websocket da integração."""
+    websocket_api.async_register_command(hass, websocket_get_movies)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "ingresso/movies",
+        vol.Required("entry_id"): str,
+        vol.Optional("theater"): str,
+    }
+)
+@callback
+def websocket_get_movies(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Retornar o catálogo completo de uma entrada sob demanda."""
+    entry = hass.config_entries.async_get_entry(msg["entry_id"])
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Entrada não carregada"
+        )
+        return
+
+    coordinators = [
+        coordinator
+        for coordinator in entry.runtime_data.coordinators
+        if msg.get("theater") in (None, coordinator.theater)
+    ]
+    if not coordinators:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Cinema não encontrado"
+        )
+        return
+
+    # Em entradas com vários cinemas, a data mais antiga vale para o conjunto
+    fetched_at = [c.fetched_at for c in coordinators if c.fetched_at is not None]
+    connection.send_result(
+        msg["id"],
+        {
+            "fetched_at": min(fetched_at, default=None),
+            "movies": [
+                movie.as_dict(coordinator.city_name, coordinator.theater_name)
+                for coordinator in coordinators
+                for movie in coordinator.movies
+            ],
+        },
+    )
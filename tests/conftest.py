@@ -0,0 +1,20 @@
+"""Shared setup for the unit tests of the integration's core modules.
+
+The core modules only need aiohttp and the standard library. Importing
+``custom_components.ingresso`` would run its ``__init__`` and pull in Home
+Assistant, so the directory is registered as a bare ``ingresso`` package,
+the same way the benchmarks load it.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+INTEGRATION = Path(__file__).resolve().parent.parent / "custom_components" / "ingresso"
+
+if "ingresso" not in sys.modules:
+    package = types.ModuleType("ingresso")
+    package.__path__ = [str(INTEGRATION)]
+    sys.modules["ingresso"] = package
@@ -0,0 +1,50 @@
+"""Tests for the incremental comparison of the listings."""
+
+from __future__ import annotations
+
+from ingresso.diff import MovieDiffer
+
+
+def test_first_update_adds_every_movie() -> None:
+    """Every movie of the first listing is new."""
+    differ = MovieDiffer()
+    diff = differ.update([{"id": "1", "title": "Duna"}, {"id": "2", "title": "Wicked"}])
+    assert diff.added == ["1", "2"]
+    assert diff.titles == {"1": "Duna", "2": "Wicked"}
+    assert [movie.title for movie in differ.movies] == ["Duna", "Wicked"]
+
+
+def test_unchanged_movies_keep_their_object() -> None:
+    """Equal listings report no change and reuse the decoded movies."""
+    differ = MovieDiffer()
+    differ.update([{"id": "1", "title": "Duna", "urlKey": "duna"}])
+    movie = differ.by_id["1"]
+    # A field the model does not use is not a change
+    diff = differ.update([{"id": "1", "title": "Duna", "urlKey": "duna-2"}])
+    assert not diff
+    assert differ.by_id["1"] is movie
+
+
+def test_changed_and_removed_movies() -> None:
+    """Changed fields are listed, and removed movies keep their last title."""
+    differ = MovieDiffer()
+    differ.update(
+        [
+            {"id": "1", "title": "Duna", "duration": "155"},
+            {"id": "2", "title": "Wicked"},
+        ]
+    )
+    movie = differ.by_id["1"]
+    diff = differ.update(
+        [
+            {"id": "1", "title": "Duna", "duration": "166"},
+            {"id": "3", "title": "Anora"},
+        ]
+    )
+    assert diff.added == ["3"]
+    assert diff.removed == ["2"]
+    assert diff.changed == {"1": ["duration"]}
+    assert diff.titles == {"1": "Duna", "2": "Wicked", "3": "Anora"}
+    assert differ.by_id["1"] is not movie
+    assert differ.by_id["1"].runtime == "166"
+    assert list(differ.by_id) == ["1", "3"]
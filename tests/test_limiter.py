@@ -0,0 +1,99 @@
+"""Tests for the token bucket rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+
+from ingresso.limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_SERVICE,
+    RateLimiter,
+)
+
+
+def test_burst_is_immediate_then_rate_applies() -> None:
+    """Up to `burst` requests go out at once; the next waits for a token."""
+
+    async def run() -> tuple[RateLimiter, float]:
+        limiter = RateLimiter(rate=20, burst=3)
+        for _ in range(3):
+            await limiter.acquire()
+        started = monotonic()
+        await limiter.acquire()
+        return limiter, monotonic() - started
+
+    limiter, waited = asyncio.run(run())
+    assert waited >= 0.04
+    assert limiter.stats.waited == 1
+    assert limiter.stats.granted[PRIORITY_BACKGROUND] == 4
+
+
+def test_queued_requests_are_served_by_priority() -> None:
+    """A waiting interactive request overtakes older background ones."""
+
+    async def run() -> list[int]:
+        limiter = RateLimiter(rate=50, burst=1)
+        await limiter.acquire()
+        order: list[int] = []
+
+        async def request(priority: int) -> None:
+            await limiter.acquire(priority)
+            order.append(priority)
+
+        tasks = [
+            asyncio.create_task(request(priority))
+            for priority in (
+                PRIORITY_BACKGROUND,
+                PRIORITY_BACKGROUND,
+                PRIORITY_SERVICE,
+                PRIORITY_INTERACTIVE,
+            )
+        ]
+        await asyncio.sleep(0)
+        assert limiter.queued == 4
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == [
+        PRIORITY_INTERACTIVE,
+        PRIORITY_SERVICE,
+        PRIORITY_BACKGROUND,
+        PRIORITY_BACKGROUND,
+    ]
+
+
+def test_cancelled_request_leaves_the_queue() -> None:
+    """A cancelled waiter neither blocks the queue nor consumes a token."""
+
+    async def run() -> RateLimiter:
+        limiter = RateLimiter(rate=50, burst=1)
+        await limiter.acquire()
+        cancelled = asyncio.create_task(limiter.acquire(PRIORITY_INTERACTIVE))
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.wait_for(waiting, 1)
+        assert cancelled.cancelled()
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.queued == 0
+    assert limiter.stats.granted[PRIORITY_INTERACTIVE] == 0
+
+
+def test_configure_applies_to_queued_requests() -> None:
+    """A faster rate set while requests wait serves them at the new rate."""
+
+    async def run() -> float:
+        limiter = RateLimiter(rate=0.5, burst=1)
+        await limiter.acquire()
+        started = monotonic()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        limiter.configure(50, 1)
+        await asyncio.wait_for(waiting, 1)
+        return monotonic() - started
+
+    assert asyncio.run(run()) < 0.5
@@ -0,0 +1,36 @@
+"""Tests for the compact movie model."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from ingresso.const import DEFAULT_POSTER
+from ingresso.library import MovieLibrary
+from ingresso.models import decode_movie
+
+
+@pytest.mark.parametrize(
+    "images",
+    [None, [], [{}], [{"url": None}], [{"url": ""}], ["poster.jpg"], {"url": "x"}],
+)
+def test_missing_poster_falls_back_to_default(images: Any) -> None:
+    """Every movie has a poster URL consumers can pass on as a string."""
+    assert decode_movie({"id": "1", "images": images}).poster == DEFAULT_POSTER
+
+
+def test_genres_are_text() -> None:
+    """Genre values that are not strings are coerced instead of raising."""
+    movie = decode_movie({"id": "1", "genres": ["Ação", 7, {"name": "Drama"}]})
+    assert movie.genres == ("Ação", "7", "{'name': 'Drama'}")
+
+
+def test_library_shares_equal_genres() -> None:
+    """Movies of one library with the same genres share one tuple."""
+    library = MovieLibrary()
+    first = library.movie({"id": "1", "genres": ["Ação", "Drama"]})
+    second = library.movie({"id": "2", "genres": ["Ação", "Drama"]})
+    assert first.genres is second.genres
+    other = MovieLibrary().movie({"id": "3", "genres": ["Ação", "Drama"]})
+    assert other.genres == first.genres
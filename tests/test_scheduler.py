@@ -0,0 +1,98 @@
+"""Tests for the adaptive poll scheduler."""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta, timezone
+
+import pytest
+
+from ingresso import scheduler
+from ingresso.const import MIN_UPDATE_INTERVAL, UPDATE_INTERVAL
+from ingresso.scheduler import AdaptivePollScheduler
+
+# A Monday, so week numbers line up with the simulated weeks
+START = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make the jitter deterministic."""
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: (low + high) / 2)
+
+
+def simulate(
+    poll_scheduler: AdaptivePollScheduler, changes: list[datetime], weeks: int
+) -> list[timedelta]:
+    """Poll like the coordinator does and return how late each change was seen."""
+    latencies = []
+    now = previous = START
+    while now < START + timedelta(weeks=weeks):
+        seen = [change for change in changes if previous < change <= now]
+        if seen:
+            latencies.append(now - seen[0])
+        poll_scheduler.record(now, bool(seen))
+        previous = now
+        now += poll_scheduler.next_interval(now)
+    return latencies
+
+
+@pytest.mark.parametrize("minute", [5, 35, 55, 125])
+def test_weekly_change_becomes_active(minute: int) -> None:
+    """A change at the same time every week is learned and seen quickly."""
+    poll_scheduler = AdaptivePollScheduler()
+    # Thursdays, some minutes after 10:00
+    changes = [
+        START + timedelta(days=3 + 7 * week, hours=10, minutes=minute)
+        for week in range(8)
+    ]
+
+    latencies = simulate(poll_scheduler, changes, weeks=8)
+
+    assert len(latencies) == len(changes)
+    # Once learned, changes are seen no later than the old fixed interval
+    assert all(latency <= UPDATE_INTERVAL for latency in latencies[4:])
+    # and the time leading up to the change is polled at the minimum interval
+    before = changes[-1] - MIN_UPDATE_INTERVAL
+    assert poll_scheduler.next_interval(before) == MIN_UPDATE_INTERVAL
+
+
+def test_unchanged_polls_do_not_erase_a_change() -> None:
+    """Polls without a change in the same hour and week count once."""
+    poll_scheduler = AdaptivePollScheduler()
+    moment = START + timedelta(hours=10)
+    poll_scheduler.record(moment, True)
+    for minutes in range(10, 60, 10):
+        poll_scheduler.record(moment + timedelta(minutes=minutes), False)
+
+    data = poll_scheduler.as_dict()
+    assert data["observed"][10] == 1
+    assert data["changed"][10] == 1
+    assert poll_scheduler.next_interval(moment - timedelta(hours=1)) == (
+        MIN_UPDATE_INTERVAL
+    )
+
+
+def test_restore_round_trip() -> None:
+    """What was learned survives a restart; old snapshots are ignored."""
+    poll_scheduler = AdaptivePollScheduler()
+    poll_scheduler.record(START + timedelta(hours=10), True)
+    restored = AdaptivePollScheduler()
+    restored.restore(poll_scheduler.as_dict())
+    assert restored.as_dict() == poll_scheduler.as_dict()
+
+    legacy = AdaptivePollScheduler()
+    legacy.restore({"rates": [1.0] * 168, "unchanged": 3})
+    assert legacy.as_dict()["observed"] == [0.0] * 168
+
+
+def test_no_polls_in_quiet_hours() -> None:
+    """Polls stop at the start of the quiet hours and resume after the end."""
+    poll_scheduler = AdaptivePollScheduler(time(23), time(7))
+
+    late = START.replace(hour=22, minute=50)
+    assert late + poll_scheduler.next_interval(late) <= START.replace(hour=23)
+
+    night = START.replace(hour=23, minute=5)
+    resume = night + poll_scheduler.next_interval(night)
+    assert (resume - timedelta(days=1)).time() >= time(7)
+    assert resume - night < timedelta(hours=8, minutes=10)
@@ -0,0 +1,104 @@
+"""Tests for the inverted index behind the search service."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ingresso.models import Movie, decode_movie
+from ingresso.search import MovieSearchIndex
+
+
+def _movie(key: str, title: str, **fields: Any) -> Movie:
+    """Decode a movie with the given title and API fields."""
+    return decode_movie({"id": key, "title": title, **fields})
+
+
+def _titles(index: MovieSearchIndex, results: list[dict[str, Any]]) -> list[Any]:
+    """Reduce the results to (theater, titles) pairs."""
+    return [
+        (
+            result["theater_name"],
+            [index.movie(key).title for key in result["movies"]],
+        )
+        for result in results
+    ]
+
+
+def _index() -> MovieSearchIndex:
+    """Index two theaters sharing one movie."""
+    index = MovieSearchIndex()
+    shared = _movie("1", "Duna", genres=["Ficção Científica"])
+    index.update(
+        "a",
+        {
+            "1": shared,
+            "2": _movie("2", "Ação Total", genres=["Ação"], director="Ana Souza"),
+        },
+        theater_name="A",
+    )
+    index.update(
+        "b",
+        {"1": shared, "3": _movie("3", "Drama", genres=["Drama", "Ação"])},
+        theater_name="B",
+    )
+    return index
+
+
+def test_search_ignores_accents_and_case() -> None:
+    """Free text matches any field, without accents or case."""
+    index = _index()
+    assert _titles(index, index.search("ACAO")) == [
+        ("A", ["Ação Total"]),
+        ("B", ["Drama"]),
+    ]
+
+
+def test_field_and_query_terms_must_all_match() -> None:
+    """Each term narrows the results, within its own field."""
+    index = _index()
+    assert _titles(index, index.search("drama", genres="ação")) == [("B", ["Drama"])]
+    assert _titles(index, index.search(director="souza")) == [("A", ["Ação Total"])]
+    assert index.search(genres="souza") == []
+    assert index.search() == []
+
+
+def test_theaters_with_more_results_come_first() -> None:
+    """A movie shown in several theaters is listed under each of them."""
+    index = _index()
+    results = index.search("ficcao")
+    assert _titles(index, results) == [("A", ["Duna"]), ("B", ["Duna"])]
+    assert len(index) == 3
+
+
+def test_update_reindexes_changed_movies_only() -> None:
+    """A new movie object replaces the terms of the previous one."""
+    index = _index()
+    index.update(
+        "a",
+        {"1": _movie("1", "Duna Parte Dois"), "2": index.movie("2")},
+        theater_name="A",
+    )
+    assert index.movie("1").title == "Duna Parte Dois"
+    assert index.search("ficcao") == []
+    assert _titles(index, index.search("dois")) == [
+        ("A", ["Duna Parte Dois"]),
+        ("B", ["Duna Parte Dois"]),
+    ]
+
+
+def test_remove_keeps_movies_still_shown_elsewhere() -> None:
+    """Removing a theater drops only the movies no other theater shows."""
+    index = _index()
+    index.remove("a")
+    assert len(index) == 2
+    assert index.search("total") == []
+    assert _titles(index, index.search("duna")) == [("B", ["Duna"])]
+    index.remove("b")
+    assert len(index) == 0
+    assert index.as_dict()["terms"] == {
+        "title": 0,
+        "genres": 0,
+        "cast": 0,
+        "director": 0,
+        "rating": 0,
+    }
@@ -0,0 +1,108 @@
+"""Tests for the streaming decoder of the nowplaying payload."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from ingresso.stream import CHECKPOINT_SIZE, _ItemParser, async_decode_items
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+# Bodies covering numbers and literals (which only end at the next
+# delimiter), escapes, multi-byte UTF-8, nesting and a non-array response
+BODIES = [
+    "[]",
+    " [ 1 , -2.5e3 ,true,false, null ] ",
+    '[{"title": "Ação", "genres": ["Drama"], "runtime": 120}, {"t": "a\\"b\\u00e9"}]',
+    '[[1, [2]], "x,]", {"a": {"b": []}}, 0.5]',
+    '{"items": [1, 2]}',
+]
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    """Yield the body in pieces of the given size."""
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def _decode(body: bytes, size: int = 1000, previous: Any = ()) -> Any:
+    """Decode a body, recording every projected item."""
+    projected: list[Any] = []
+
+    def project(item: Any) -> Any:
+        projected.append(item)
+        return item
+
+    decoded = asyncio.run(async_decode_items(_chunks(body, size), project, previous))
+    return decoded, projected
+
+
+def _parse(chunks: list[bytes]) -> Any:
+    """Feed the chunks to the item parser and return its result."""
+    parser = _ItemParser(lambda item: item)
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.feed(b"", final=True)
+    return parser.result()
+
+
+def _body(count: int, title: str = "Movie") -> bytes:
+    """Build a nowplaying-like array spanning several checkpoints."""
+    movies = [{"id": str(index), "title": f"{title} {index}"} for index in range(count)]
+    return json.dumps(movies).encode()
+
+
+def test_unchanged_body_is_not_decoded() -> None:
+    """A body equal to the previous one is recognised by its hash alone."""
+    body = _body(10_000)
+    assert len(body) > 3 * CHECKPOINT_SIZE
+    first, projected = _decode(body)
+    assert len(projected) == 10_000
+
+    # Network chunking differs between responses; the checkpoints do not
+    again, projected = _decode(body, size=4099, previous=first.digest)
+    assert again.payload is None
+    assert again.digest == first.digest
+    assert projected == []
+
+
+def test_changed_body_is_decoded_from_the_start() -> None:
+    """A difference anywhere, even after matching checkpoints, decodes it all."""
+    body = _body(10_000)
+    first, _ = _decode(body)
+    for changed in (
+        _body(10_000, title="Film"),
+        body.replace(b'"Movie 9999"', b'"Movie 9998"'),
+        _body(10_001),
+        _body(9_000),
+    ):
+        decoded, projected = _decode(changed, previous=first.digest)
+        assert decoded.payload == json.loads(changed)
+        assert projected == decoded.payload
+        assert decoded.digest != first.digest
+
+
+@pytest.mark.parametrize("body", BODIES)
+def test_every_split_decodes_like_json_loads(body: str) -> None:
+    """Any two chunk boundaries, even inside a token, give the same result."""
+    data = body.encode()
+    expected = json.loads(data)
+    for first in range(len(data) + 1):
+        for second in range(first, len(data) + 1):
+            chunks = [data[:first], data[first:second], data[second:]]
+            assert _parse(chunks) == expected, chunks
+
+
+@pytest.mark.parametrize("body", BODIES)
+def test_truncated_body_raises(body: str) -> None:
+    """A body cut anywhere before its end is an error, never a shorter list."""
+    data = body.encode()
+    for end in range(len(data.rstrip())):
+        with pytest.raises(ValueError):
+            _parse([data[:end]])